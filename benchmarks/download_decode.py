@@ -0,0 +1,66 @@
+"""
+Compares wall time and peak memory of decoding a query response with the previous
+`json.loads`, `json.dumps` and `pd.read_json` round trip against the direct decoder.
+
+Run with::
+
+    python -m benchmarks.download_decode
+"""
+from io import StringIO
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from rapid.utils.decode import dataframe_from_index_json, loads
+
+ROW_COUNTS = [10_000, 100_000, 250_000]
+
+
+def response_content(rows: int) -> bytes:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.random(rows),
+            "category": rng.choice(["alpha", "beta", "gamma", "delta"], rows),
+            "date": pd.date_range("2020-01-01", periods=rows, freq="min").strftime(
+                "%Y-%m-%d"
+            ),
+        }
+    )
+    return df.to_json(orient="index").encode("utf-8")
+
+
+def round_trip(content: bytes) -> pd.DataFrame:
+    data = json.loads(content.decode("utf-8"))
+    return pd.read_json(StringIO(json.dumps(data)), orient="index")
+
+
+def direct(content: bytes) -> pd.DataFrame:
+    return dataframe_from_index_json(loads(content))
+
+
+def measure(decoder, content: bytes):
+    tracemalloc.start()
+    start = time.perf_counter()
+    decoder(content)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run():
+    print(f"{'rows':>10}{'decoder':>12}{'time (s)':>12}{'peak (MB)':>12}")
+    for rows in ROW_COUNTS:
+        content = response_content(rows)
+        for name, decoder in [("round trip", round_trip), ("direct", direct)]:
+            elapsed, peak = measure(decoder, content)
+            print(f"{rows:>10}{name:>12}{elapsed:>12.3f}{peak / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,48 @@
+"""
+Measures the time taken to import the sdk in a fresh interpreter, and the largest imports
+reported by ``python -X importtime``.
+
+Run with::
+
+    python -m benchmarks.import_time
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+REPEATS = 10
+TOP = 10
+
+
+def time_import(statement: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return time.perf_counter() - start
+
+
+def largest_imports(statement: str):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:TOP]
+
+
+def main():
+    baseline = statistics.median(time_import("pass") for _ in range(REPEATS))
+    for statement in ["import rapid", "import rapid.patterns.data"]:
+        elapsed = statistics.median(time_import(statement) for _ in range(REPEATS))
+        print(f"{statement:<30} {(elapsed - baseline) * 1000:8.1f}ms")
+        for cumulative, name in largest_imports(statement):
+            print(f"    {name:<40} {cumulative / 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compares the bytes sent and the estimated end to end upload time of uncompressed, gzip and zstd
+compressed csv uploads over a bandwidth limited link. Serialising the DataFrame costs the same for
+every codec and is left out of the totals.
+
+Run with::
+
+    python -m benchmarks.request_compression [--bandwidth MB/s]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import requests
+
+from rapid.utils.compress import compress
+from rapid.utils.constants import Compression
+from rapid.utils.serialise import serialise_dataframe
+
+ROWS = 200_000
+CODECS = [
+    (None, None),
+    (Compression.GZIP, 1),
+    (Compression.GZIP, 6),
+    (Compression.ZSTD, 3),
+    (Compression.ZSTD, 10),
+]
+
+
+def frames():
+    rng = np.random.default_rng(0)
+    yield "narrow_int", pd.DataFrame({"id": np.arange(ROWS)})
+    yield "wide_float", pd.DataFrame(
+        rng.random((ROWS // 10, 50)), columns=[f"col_{i}" for i in range(50)]
+    )
+    yield "mixed", pd.DataFrame(
+        {
+            "id": np.arange(ROWS),
+            "value": rng.random(ROWS).round(2),
+            "category": rng.choice(["alpha", "beta", "gamma", "delta"], ROWS),
+            "date": pd.date_range("2020-01-01", periods=ROWS, freq="min").strftime(
+                "%Y-%m-%d"
+            ),
+        }
+    )
+
+
+def run(bandwidth: float):
+    print(f"Estimated over a {bandwidth} MB/s link")
+    print(
+        f"{'frame':<12}{'codec':<10}{'sent (MB)':>12}{'ratio':>8}{'compress (s)':>14}{'total (s)':>12}"
+    )
+    for name, df in frames():
+        body = (
+            requests.Request(
+                "POST", "http://rapid", files={"file": serialise_dataframe(df)}
+            )
+            .prepare()
+            .body
+        )
+        for codec, level in CODECS:
+            start = time.perf_counter()
+            sent = compress(body, codec, level) if codec else body
+            elapsed = time.perf_counter() - start
+            total = elapsed + len(sent) / (bandwidth * 1e6)
+            label = f"{codec.value}-{level}" if codec else "none"
+            print(
+                f"{name:<12}{label:<10}{len(sent) / 1e6:>12.2f}{len(body) / len(sent):>8.1f}{elapsed:>14.3f}{total:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--bandwidth", type=float, default=10, help="MB/s")
+    arguments = parser.parse_args()
+    run(arguments.bandwidth)
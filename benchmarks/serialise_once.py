@@ -0,0 +1,89 @@
+"""
+Compares the schema generation, upload and info calls of the
+``rapid.patterns.data.upload_and_create_dataframe`` flow, with ``upgrade_schema_on_fail``, when
+the DataFrame is passed to each call and serialised every time, and when it is serialised once into
+a payload with ``Rapid.prepare_payload``. Runs against the local stand-in server from
+:mod:`benchmarks.server`.
+
+Serialisation time is the client's own time spent writing the DataFrame, taken from the
+serialise events. Process CPU time includes the stand-in server, which runs in the same process.
+The payload changes how often the DataFrame is serialised, not what is sent, so bytes sent match.
+
+Run with::
+
+    python -m benchmarks.serialise_once [--rows 100000 500000] [--format csv parquet]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from rapid import Rapid, RapidAuth
+from rapid.utils.constants import EventPhase
+
+from benchmarks.server import StandInServer
+
+
+def frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.random(rows).round(4),
+            "count": rng.integers(0, 1000, rows),
+            "category": rng.choice(["alpha", "beta", "gamma", "delta"], rows),
+        }
+    )
+
+
+def flow(rapid: Rapid, df) -> None:
+    schema = rapid.generate_schema(df, "bench", "serialise", "PUBLIC")
+    rapid.create_schema(schema)
+    rapid.upload_dataframe("bench", "serialise", df)
+    rapid.generate_info(df, "bench", "serialise")
+
+
+def run(rows, formats) -> None:
+    print(
+        f"{'rows':>10}{'format':>9}{'mode':>10}{'serialised':>12}{'serialise (s)':>15}{'cpu (s)':>10}{'wall (s)':>10}{'sent (MB)':>11}"
+    )
+    with StandInServer() as server:
+        for upload_format in formats:
+            for count in rows:
+                df = frame(count)
+                for mode in ["per call", "payload"]:
+                    events = []
+                    rapid = Rapid(
+                        RapidAuth("id", "secret", server.url),
+                        upload_format=upload_format,
+                        hooks=[events.append],
+                    )
+                    cpu, wall = time.process_time(), time.perf_counter()
+                    if mode == "payload":
+                        with rapid.prepare_payload(df) as payload:
+                            flow(rapid, payload)
+                    else:
+                        flow(rapid, df)
+                    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+                    serialised = [e for e in events if e.phase == EventPhase.SERIALISE]
+                    sent = sum(
+                        e.request_bytes or 0
+                        for e in events
+                        if e.phase == EventPhase.REQUEST
+                    )
+                    print(
+                        f"{count:>10}{upload_format:>9}{mode:>10}{len(serialised):>12}"
+                        f"{sum(e.duration for e in serialised):>15.3f}{cpu:>10.2f}{wall:>10.2f}{sent / 1e6:>11.2f}"
+                    )
+                    rapid.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 500_000])
+    parser.add_argument(
+        "--format", dest="formats", nargs="+", default=["csv", "parquet"]
+    )
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.formats)
@@ -0,0 +1,218 @@
+"""
+A local stand-in for the rAPId API that the benchmarks run the sdk against. It keeps datasets in
+memory and implements the endpoints the sdk calls:
+
+- ``POST /oauth2/token``
+- ``POST /datasets``
+- ``POST /datasets/{domain}/{dataset}``, accepting csv or parquet uploads
+- ``POST /datasets/{domain}/{dataset}/query``, supporting ``limit`` and simple ``column > value``
+  filters joined with ``AND``, enough for :meth:`rapid.Rapid.iter_dataframe`
+- ``POST /datasets/{domain}/{dataset}/info``
+- ``POST /schema/{sensitivity}/{domain}/{dataset}/generate``, ``POST /schema`` and ``PUT /schema``
+- ``GET /jobs/{id}``, upload jobs complete as soon as they are accepted
+
+Every request can be delayed by a fixed latency, and request and response bodies can be throttled
+to a bandwidth, to approximate a remote instance.
+
+Use it as a context manager::
+
+    with StandInServer(latency=0.02, bandwidth=50e6) as server:
+        rapid = Rapid(RapidAuth("id", "secret", server.url))
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+import gzip
+import json
+import re
+import threading
+import time
+import uuid
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+from pandas import DataFrame
+
+from rapid.utils.inference import infer_schema
+
+CONDITION = re.compile(r"(\w+) (>|<) ('(?:[^']|'')*'|[-+\w.]+)")
+
+
+class StandInServer:
+    def __init__(self, latency: float = 0.0, bandwidth: Optional[float] = None) -> None:
+        """
+        Args:
+            latency (float, optional): Seconds every request is delayed by. Defaults to 0.
+            bandwidth (float, optional): Bytes per second request and response bodies are throttled to. Defaults to None, unthrottled.
+        """
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.datasets: Dict[Tuple[str, str], DataFrame] = {}
+        self.jobs: Dict[str, dict] = {}
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def add_dataset(self, domain: str, dataset: str, df: DataFrame) -> None:
+        with self._lock:
+            self.datasets[(domain, dataset)] = df.reset_index(drop=True)
+
+    def throttle(self, size: int) -> None:
+        if self.bandwidth:
+            time.sleep(size / self.bandwidth)
+
+    def handle(self, method: str, path: str, headers, body: bytes):
+        """
+        Returns the status code and JSON body for a request.
+        """
+        with self._lock:
+            self.requests += 1
+        parts = path.split("?")[0].strip("/").split("/")
+        if parts == ["oauth2", "token"]:
+            return 200, {"access_token": "token", "expires_in": 3600}
+        if parts[0] == "jobs" and len(parts) == 2:
+            if parts[1] not in self.jobs:
+                return 404, {"details": "Job not found"}
+            return 200, self.jobs[parts[1]]
+        if parts[0] == "schema":
+            return self.schema(method, parts[1:], headers, body)
+        if parts[0] == "datasets":
+            return self.dataset(parts[1:], headers, body)
+        return 404, {"details": "Not found"}
+
+    def dataset(self, parts, headers, body):
+        if not parts:
+            return 200, [
+                {"domain": domain, "dataset": dataset, "version": 1}
+                for domain, dataset in self.datasets
+            ]
+        key = tuple(parts[:2])
+        if len(parts) == 2:
+            df = read_upload(headers, body)
+            with self._lock:
+                existing = self.datasets.get(key)
+                self.datasets[key] = (
+                    df
+                    if existing is None
+                    else pd.concat([existing, df], ignore_index=True)
+                )
+                job_id = str(uuid.uuid4())
+                self.jobs[job_id] = {"status": "SUCCESS", "rows": len(df)}
+            return 202, {"details": {"job_id": job_id}}
+        if parts[2] == "info":
+            df = read_upload(headers, body)
+            return 200, {
+                "metadata": {"domain": key[0], "dataset": key[1], "rows": len(df)},
+                "columns": [
+                    {"name": str(name), "data_type": str(dtype)}
+                    for name, dtype in df.dtypes.items()
+                ],
+            }
+        if parts[2] == "query":
+            df = self.datasets.get(key)
+            if df is None:
+                return 400, {"details": "Dataset not found"}
+            return 200, query_dataframe(df, json.loads(body or b"{}"))
+        return 404, {"details": "Not found"}
+
+    def schema(self, method, parts, headers, body):
+        if len(parts) == 4 and parts[3] == "generate":
+            sensitivity, domain, dataset = parts[:3]
+            df = read_upload(headers, body)
+            return 200, json.loads(
+                infer_schema(df, domain, dataset, sensitivity).json()
+            )
+        if not parts:
+            return 200, json.loads(body) if method == "PUT" else None
+        return 404, {"details": "Not found"}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def respond(self, method: str):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                server.throttle(len(body))
+                time.sleep(server.latency)
+                status, data = server.handle(method, self.path, self.headers, body)
+                content = data if isinstance(data, bytes) else json.dumps(data).encode()
+                server.throttle(len(content))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self):
+                self.respond("GET")
+
+            def do_POST(self):
+                self.respond("POST")
+
+            def do_PUT(self):
+                self.respond("PUT")
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def read_upload(headers, body: bytes) -> DataFrame:
+    """
+    Reads the DataFrame from a multipart file upload, decompressing gzip or zstd bodies.
+    """
+    encoding = headers.get("Content-Encoding")
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "zstd":
+        import zstandard
+
+        body = zstandard.ZstdDecompressor().decompress(body)
+    boundary = headers.get("Content-Type").split("boundary=")[1].encode()
+    part = body.split(b"--" + boundary)[1]
+    part_headers, content = part.split(b"\r\n\r\n", 1)
+    content = content[: -len(b"\r\n")]
+    if b".parquet" in part_headers:
+        return pd.read_parquet(BytesIO(content))
+    return pd.read_csv(BytesIO(content))
+
+
+def query_dataframe(df: DataFrame, query: dict) -> bytes:
+    """
+    Applies the supported parts of a query and returns the result as index oriented JSON.
+    """
+    for column, operator, value in CONDITION.findall(query.get("filter") or ""):
+        value = (
+            value[1:-1].replace("''", "'")
+            if value.startswith("'")
+            else pd.to_numeric(value)
+        )
+        df = df[df[column] > value] if operator == ">" else df[df[column] < value]
+    if query.get("select_columns"):
+        df = df[query["select_columns"]]
+    if query.get("limit"):
+        df = df.head(int(query["limit"]))
+    return df.to_json(orient="index").encode()
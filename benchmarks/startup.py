@@ -0,0 +1,41 @@
+"""
+Measures how long it takes to construct a client with eager and lazy credential validation,
+against a local token endpoint that responds after a configurable latency.
+
+Run with::
+
+    python -m benchmarks.startup [--latency ms]
+"""
+import argparse
+import statistics
+import time
+
+from rapid import Rapid, RapidAuth
+
+from benchmarks.server import StandInServer
+
+REPEATS = 20
+
+
+def construct(url: str, lazy: bool) -> float:
+    start = time.perf_counter()
+    Rapid(RapidAuth(client_id="id", client_secret="secret", url=url, lazy=lazy))
+    return time.perf_counter() - start
+
+
+def run(latency: float):
+    server = StandInServer(latency).start()
+    url = server.url
+    print(f"Token endpoint latency {latency * 1000:.0f}ms")
+    print(f"{'mode':<8}{'median (ms)':>14}{'max (ms)':>12}")
+    for mode, lazy in [("eager", False), ("lazy", True)]:
+        timings = [construct(url, lazy) * 1000 for _ in range(REPEATS)]
+        print(f"{mode:<8}{statistics.median(timings):>14.2f}{max(timings):>12.2f}")
+    server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--latency", type=float, default=50, help="milliseconds")
+    arguments = parser.parse_args()
+    run(arguments.latency / 1000)
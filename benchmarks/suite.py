@@ -0,0 +1,169 @@
+"""
+Runs the sdk against the local stand-in server from :mod:`benchmarks.server` and reports upload and
+download throughput, latency percentiles and peak Python memory across frame sizes and widths. The
+server runs in the same process, so peak memory includes its allocations too.
+
+Results can be written to a JSON file with ``--output`` and compared against an earlier run with
+``--compare``, so the effect of a change can be measured run to run.
+
+Run with::
+
+    python -m benchmarks.suite [--latency ms] [--bandwidth MB/s] [--rows 10000 100000] [--widths 5 50]
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from rapid import Rapid, RapidAuth
+from rapid.items.query import Query, SQLQueryOrderBy
+from rapid.utils.hooks import LatencyAggregator
+
+from benchmarks.server import StandInServer
+
+
+def frame(rows: int, width: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    columns = {"id": np.arange(rows)}
+    for i in range(width - 1):
+        kind = i % 3
+        if kind == 0:
+            columns[f"value_{i}"] = rng.random(rows).round(4)
+        elif kind == 1:
+            columns[f"count_{i}"] = rng.integers(0, 1000, rows)
+        else:
+            columns[f"category_{i}"] = rng.choice(["alpha", "beta", "gamma"], rows)
+    return pd.DataFrame(columns)
+
+
+def percentile(timings, q: float) -> float:
+    return float(np.percentile(timings, q))
+
+
+def measure(operation, repeats: int) -> dict:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    # Tracing slows allocations down, so peak memory is measured on a separate run
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "p50": percentile(timings, 50),
+        "p95": percentile(timings, 95),
+        "p99": percentile(timings, 99),
+        "mean": statistics.mean(timings),
+        "peak_mb": peak / 1e6,
+    }
+
+
+def operations(rapid: Rapid, df: pd.DataFrame, page_size: int, path: str) -> dict:
+    query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+    return {
+        "upload": lambda: rapid.upload_dataframe("bench", "upload", df),
+        "download": lambda: rapid.download_dataframe("bench", "download"),
+        "iter_download": lambda: sum(
+            len(page)
+            for page in rapid.iter_dataframe(
+                "bench", "download", query, page_size=page_size
+            )
+        ),
+        "download_to_file": lambda: rapid.download_to_file(
+            "bench", "download", path, query=query, chunk_rows=page_size
+        ),
+    }
+
+
+def run(rows, widths, repeats: int, latency: float, bandwidth, hooks=None) -> list:
+    results = []
+    with StandInServer(
+        latency, bandwidth
+    ) as server, tempfile.TemporaryDirectory() as directory:
+        rapid = Rapid(RapidAuth("id", "secret", server.url), hooks=hooks)
+        for width in widths:
+            for count in rows:
+                df = frame(count, width)
+                size_mb = df.memory_usage(deep=True).sum() / 1e6
+                server.add_dataset("bench", "download", df)
+                page_size = max(count // 4, 1)
+                path = os.path.join(directory, "download.parquet")
+                for name, operation in operations(rapid, df, page_size, path).items():
+                    result = measure(operation, repeats)
+                    result.update(
+                        operation=name,
+                        rows=count,
+                        width=width,
+                        throughput_mb_s=size_mb / result["mean"],
+                    )
+                    results.append(result)
+                server.datasets.clear()
+        rapid.close()
+    return results
+
+
+def report(results, baseline=None) -> None:
+    previous = {(r["operation"], r["rows"], r["width"]): r for r in (baseline or [])}
+    print(
+        f"{'operation':<18}{'rows':>9}{'width':>7}{'MB/s':>9}{'p50 (ms)':>10}{'p95 (ms)':>10}"
+        f"{'p99 (ms)':>10}{'peak (MB)':>11}{'vs base':>9}"
+    )
+    for r in results:
+        before = previous.get((r["operation"], r["rows"], r["width"]))
+        change = f"{r['p50'] / before['p50']:>8.2f}x" if before else f"{'':>9}"
+        print(
+            f"{r['operation']:<18}{r['rows']:>9}{r['width']:>7}{r['throughput_mb_s']:>9.1f}"
+            f"{r['p50'] * 1000:>10.1f}{r['p95'] * 1000:>10.1f}{r['p99'] * 1000:>10.1f}"
+            f"{r['peak_mb']:>11.1f}{change}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--widths", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds")
+    parser.add_argument("--bandwidth", type=float, default=None, help="MB/s")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare against results from --output")
+    parser.add_argument(
+        "--phases",
+        action="store_true",
+        help="print latency histograms for each phase and endpoint",
+    )
+    args = parser.parse_args()
+
+    aggregator = LatencyAggregator() if args.phases else None
+
+    results = run(
+        args.rows,
+        args.widths,
+        args.repeats,
+        args.latency / 1000,
+        args.bandwidth * 1e6 if args.bandwidth else None,
+        [aggregator] if aggregator else None,
+    )
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+    report(results, baseline)
+    if aggregator:
+        print()
+        aggregator.print_report()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compares the payload size and serialisation time of the csv and parquet upload formats.
+
+Run with::
+
+    python -m benchmarks.upload_format
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from rapid.utils.constants import UploadFormat
+from rapid.utils.serialise import serialise_dataframe
+
+ROWS = 100_000
+FORMATS = [
+    (UploadFormat.CSV, None),
+    (UploadFormat.PARQUET, "snappy"),
+    (UploadFormat.PARQUET, "zstd"),
+    (UploadFormat.PARQUET, "gzip"),
+]
+
+
+def wide_numeric(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.random((rows, 50)), columns=[f"col_{i}" for i in range(50)])
+
+
+def mixed(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.random(rows),
+            "count": rng.integers(0, 1000, rows),
+            "category": rng.choice(["alpha", "beta", "gamma", "delta"], rows),
+            "date": pd.date_range("2020-01-01", periods=rows, freq="min").strftime(
+                "%Y-%m-%d"
+            ),
+        }
+    )
+
+
+def run():
+    print(f"{'frame':<14}{'format':<18}{'size (MB)':>12}{'time (s)':>12}")
+    for name, df in [("wide_numeric", wide_numeric(ROWS)), ("mixed", mixed(ROWS))]:
+        for upload_format, compression in FORMATS:
+            start = time.perf_counter()
+            _, content = serialise_dataframe(df, upload_format, compression)
+            elapsed = time.perf_counter() - start
+            size = len(content.encode("utf-8") if isinstance(content, str) else content)
+            label = upload_format.value + (f" ({compression})" if compression else "")
+            print(f"{name:<14}{label:<18}{size / 1e6:>12.2f}{elapsed:>12.3f}")
+
+
+if __name__ == "__main__":
+    run()
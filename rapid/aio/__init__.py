@@ -0,0 +1,2 @@
+from rapid.aio.auth import AsyncRapidAuth
+from rapid.aio.rapid import AsyncRapid
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import time
+
+import httpx
+
+from rapid.auth import RAPID_CLIENT_ID, RAPID_CLIENT_SECRET, RAPID_URL, token_expiry
+from rapid.utils.constants import TIMEOUT_PERIOD
+from rapid.exceptions import AuthenticationErrorException, CannotFindCredentialException
+
+
+class AsyncRapidAuth:
+    def __init__(
+        self,
+        client_id: str = None,
+        client_secret: str = None,
+        url: str = None,
+        client: httpx.AsyncClient = None,
+    ) -> None:
+        """
+        The asynchronous counterpart of :class:`rapid.auth.RapidAuth`. The authentication values can be
+        passed into the constructor but they default to reading them from your environment variables.
+
+        Credentials cannot be checked while the object is constructed, they are validated when the first
+        token is fetched or by awaiting :meth:`validate_credentials`.
+
+        Args:
+            client_id (str, optional): Your rAPId API client id token. Defaults to None.
+            client_secret (str, optional): Your rAPId API client secret token. Defaults to None.
+            url (str, optional): The url where your rAPId API is hosted. Defaults to None.
+            client (httpx.AsyncClient, optional): The client used to request tokens. When used with
+                :class:`rapid.aio.AsyncRapid` this is replaced by the rAPId client's connection pool. Defaults to a new
+                client, created when the first token is requested.
+        """
+        self.client_id = self.evaluate_inputs(client_id, RAPID_CLIENT_ID)
+        self.client_secret = self.evaluate_inputs(client_secret, RAPID_CLIENT_SECRET)
+        self.url = self.evaluate_inputs(url, RAPID_URL)
+        self._client = client
+        self._token = None
+        self._token_expiry = 0.0
+        self._token_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created on first use, as a client that is replaced by AsyncRapid could not be closed here
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=TIMEOUT_PERIOD)
+        return self._client
+
+    @client.setter
+    def client(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    def evaluate_inputs(self, value: str, environment_variable: str):
+        if not value:
+            value = os.environ.get(environment_variable)
+            if not value:
+                raise CannotFindCredentialException(
+                    f"No value passed for {environment_variable}, could not authenticate to rAPId"
+                )
+        return value
+
+    async def request_token(self) -> httpx.Response:
+        return await self.client.post(
+            self.url + "/oauth2/token",
+            auth=(self.client_id, self.client_secret),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            json={"grant_type": "client_credentials", "client_id": self.client_id},
+            timeout=TIMEOUT_PERIOD,
+        )
+
+    async def validate_credentials(self):
+        """
+        Tests authentication to the rAPId API.
+
+        Raises:
+            :class:`rapid.exceptions.AuthenticationErrorException`: If no authorisation can be created.
+
+        Returns:
+            None: If authentication was successful.
+        """
+        await self.fetch_token()
+
+    async def fetch_token(self) -> str:
+        """
+        Returns an access token for the rAPId API, reusing a cached token until it is about to expire.
+        Concurrent callers share a single token request.
+
+        Raises:
+            :class:`rapid.exceptions.AuthenticationErrorException`: If no authorisation can be created.
+
+        Returns:
+            str: The access token.
+        """
+        if self._is_token_valid():
+            return self._token
+        async with self._token_lock:
+            if not self._is_token_valid():
+                response = await self.request_token()
+                if response.status_code != 200:
+                    raise AuthenticationErrorException(
+                        "Auth not configured, could not connect to instance of rAPId"
+                    )
+                data = response.json()
+                self._token = data["access_token"]
+                self._token_expiry = token_expiry(data)
+            return self._token
+
+    def _is_token_valid(self) -> bool:
+        return self._token is not None and time.monotonic() < self._token_expiry
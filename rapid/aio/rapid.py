@@ -0,0 +1,343 @@
+import asyncio
+from typing import Dict, Optional, Union
+
+import httpx
+from pandas import DataFrame
+
+from rapid.aio.auth import AsyncRapidAuth
+from rapid.items.schema import Schema
+from rapid.items.query import Query
+from rapid.utils.constants import (
+    TIMEOUT_PERIOD,
+    POOL_MAXSIZE,
+    UploadFormat,
+)
+from rapid.utils.decode import dataframe_from_index_json, loads
+from rapid.utils.serialise import serialise_dataframe
+from rapid.exceptions import (
+    DataFrameUploadFailedException,
+    DataFrameUploadValidationException,
+    JobFailedException,
+    SchemaGenerationFailedException,
+    SchemaCreateFailedException,
+    SchemaUpdateFailedException,
+    SchemaAlreadyExistsException,
+    UnableToFetchJobStatusException,
+    DatasetInfoFailedException,
+    DatasetNotFoundException,
+)
+
+
+class AsyncRapid:
+    def __init__(
+        self,
+        auth: AsyncRapidAuth = None,
+        client: httpx.AsyncClient = None,
+        max_concurrency: int = POOL_MAXSIZE,
+        upload_format: Union[UploadFormat, str] = UploadFormat.CSV,
+        parquet_compression: str = "snappy",
+    ) -> None:
+        """
+        The asynchronous counterpart of :class:`rapid.rapid.Rapid`, for use within asyncio applications.
+        It mirrors the synchronous API and raises the same exceptions. Requires the optional `httpx` dependency.
+
+        At most `max_concurrency` requests are in flight at once, so calls can be fanned out freely::
+
+            async with AsyncRapid() as rapid:
+                dfs = await asyncio.gather(
+                    *[rapid.download_dataframe("domain", dataset) for dataset in datasets]
+                )
+
+        Args:
+            auth (:class:`rapid.aio.AsyncRapidAuth`, optional): An instance of the async rAPId auth class. Defaults to None.
+            client (httpx.AsyncClient, optional): A client to send requests with instead of creating a pooled one. It is not closed by :meth:`aclose`. Defaults to None.
+            max_concurrency (int, optional): The maximum number of concurrent requests, which is also the connection pool size. Defaults to 10.
+            upload_format (:class:`rapid.utils.constants.UploadFormat`, optional): The file format DataFrames are serialised to before being sent to the API. Defaults to csv.
+            parquet_compression (str, optional): The compression codec used when uploading parquet files. Defaults to "snappy".
+        """
+        self.upload_format = UploadFormat(upload_format)
+        self.parquet_compression = parquet_compression
+        self._owns_client = client is None
+        self.client = (
+            client
+            if client
+            else httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_concurrency,
+                    max_keepalive_connections=max_concurrency,
+                ),
+                timeout=TIMEOUT_PERIOD,
+            )
+        )
+        if auth:
+            self.auth = auth
+            self.auth.client = self.client
+        else:
+            self.auth = AsyncRapidAuth(client=self.client)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the client and any connections it holds open.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def generate_headers(self) -> Dict:
+        return {"Authorization": "Bearer " + await self.auth.fetch_token()}
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        headers = await self.generate_headers()
+        async with self._semaphore:
+            return await self.client.request(
+                method, url, headers=headers, timeout=TIMEOUT_PERIOD, **kwargs
+            )
+
+    async def list_datasets(self):
+        """
+        Makes a POST request to the API to list the current datasets.
+
+        Returns:
+            A JSON response of the API's response.
+        """
+        response = await self._request("POST", f"{self.auth.url}/datasets")
+        return loads(response.content)
+
+    async def fetch_job_progress(self, _id: str):
+        """
+        Makes a GET request to the API to fetch the progress of a specific job.
+
+        Args:
+            _id (str): The ID of the job to fetch the progress for.
+
+        Raises:
+            :class:`rapid.exceptions.UnableToFetchJobStatusException`: If the job status could not be fetched.
+
+        Returns:
+            A JSON response of the API's response.
+        """
+        response = await self._request("GET", f"{self.auth.url}/jobs/{_id}")
+        data = loads(response.content)
+        if response.status_code == 200:
+            return data
+        raise UnableToFetchJobStatusException("Could not check job status", data)
+
+    async def wait_for_job_outcome(self, _id: str, interval: float = 1):
+        """
+        Periodically requests the status of a specific job until it finishes, without blocking the event loop.
+
+        Args:
+            _id (str): The ID of the job to wait for the outcome of.
+            interval (float, optional): The number of seconds to sleep between requests to the API. Defaults to 1.
+
+        Returns:
+            None if the job is successful.
+
+        Raises:
+            :class:`rapid.exceptions.JobFailedException`: If the job outcome failed.
+        """
+        while True:
+            progress = await self.fetch_job_progress(_id)
+            status = progress["status"]
+            if status == "SUCCESS":
+                return None
+            if status == "FAILED":
+                raise JobFailedException("Upload failed", progress)
+            await asyncio.sleep(interval)
+
+    async def download_dataframe(
+        self,
+        domain: str,
+        dataset: str,
+        version: Optional[int] = None,
+        query: Optional[Query] = None,
+        schema: Optional[Schema] = None,
+    ) -> DataFrame:
+        """
+        Downloads data to a pandas DataFrame based on the domain, dataset and version passed.
+        The response is decoded on a worker thread.
+
+        Args:
+            domain (str): The domain of the dataset to download the DataFrame from.
+            dataset (str): The dataset from the domain to download the DataFrame from.
+            version (int, optional): Version of the dataset to download.
+            query (:class:`rapid.items.query.Query`, optional): An optional query type to provide when downloading data. Defaults to empty.
+            schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset, used to set the column dtypes. Defaults to None.
+
+        Raises:
+            :class:`rapid.exceptions.DatasetNotFoundException`: If the dataset to download does not exist.
+
+        Returns:
+            DataFrame: A pandas DataFrame of the data
+        """
+        query = query if query else Query()
+        url = f"{self.auth.url}/datasets/{domain}/{dataset}/query"
+        if version is not None:
+            url = f"{url}?version={version}"
+        response = await self._request(
+            "POST", url, content=query.json(exclude_none=True)
+        )
+        data = loads(response.content)
+        if response.status_code == 200:
+            return await asyncio.to_thread(dataframe_from_index_json, data, schema)
+
+        raise DatasetNotFoundException(
+            f"Could not find dataset, {domain}/{dataset} to download", data
+        )
+
+    async def upload_dataframe(
+        self, domain: str, dataset: str, df: DataFrame, wait_to_complete: bool = True
+    ):
+        """
+        Uploads a pandas DataFrame to a specified dataset in the API. The DataFrame is serialised on a worker thread.
+
+        Args:
+            domain (str): The domain of the dataset to upload the DataFrame to.
+            dataset (str): The name of the dataset to upload the DataFrame to.
+            df (DataFrame): The pandas DataFrame to upload.
+            wait_to_complete (bool, optional): Whether to wait for the upload job to complete before returning. Defaults to True.
+
+        Raises:
+        :class:`rapid.exceptions.DataFrameUploadValidationException`: If the DataFrame's schema is incorrect.
+        :class:`rapid.exceptions.DataFrameUploadFailedException`: If an unexpected error occurs while uploading the DataFrame.
+
+        Returns:
+            If wait_to_complete is True, returns "Success" if the upload is successful.
+            If wait_to_complete is False, returns the ID of the upload job if the upload is accepted.
+        """
+        url = f"{self.auth.url}/datasets/{domain}/{dataset}"
+        response = await self._request(
+            "POST", url, files=await self.convert_dataframe_for_file_upload(df)
+        )
+        data = loads(response.content)
+
+        if response.status_code == 202:
+            if wait_to_complete:
+                await self.wait_for_job_outcome(data["details"]["job_id"])
+                return "Success"
+            return data["details"]["job_id"]
+        if response.status_code == 422:
+            raise DataFrameUploadValidationException(
+                "Could not upload dataframe due to an incorrect schema definition"
+            )
+
+        raise DataFrameUploadFailedException(
+            "Encountered an unexpected error, could not upload dataframe",
+            data["details"],
+        )
+
+    async def generate_info(self, df: DataFrame, domain: str, dataset: str):
+        """
+        Generates metadata information for a pandas DataFrame and a specified dataset in the API.
+
+        Args:
+            df (DataFrame): The pandas DataFrame to generate metadata for.
+            domain (str): The domain of the dataset to generate metadata for.
+            dataset (str): The name of the dataset to generate metadata for.
+
+        Raises:
+            :class:`rapid.exceptions.DatasetInfoFailedException`: If an error occurs while generating the metadata information.
+
+        Returns:
+            A dictionary containing the metadata information for the DataFrame and dataset.
+        """
+        url = f"{self.auth.url}/datasets/{domain}/{dataset}/info"
+        response = await self._request(
+            "POST", url, files=await self.convert_dataframe_for_file_upload(df)
+        )
+        data = loads(response.content)
+        if response.status_code == 200:
+            return data
+
+        raise DatasetInfoFailedException(
+            "Failed to gather the dataset info", data["details"]
+        )
+
+    async def convert_dataframe_for_file_upload(self, df: DataFrame):
+        """
+        Converts a pandas DataFrame on a worker thread to a format that can be used for file uploads to the API.
+
+        Args:
+            df (DataFrame): The pandas DataFrame to convert.
+
+        Returns:
+            A dictionary containing the converted DataFrame in a format suitable for file uploads to the API.
+        """
+        return {
+            "file": await asyncio.to_thread(
+                serialise_dataframe, df, self.upload_format, self.parquet_compression
+            )
+        }
+
+    async def generate_schema(
+        self, df: DataFrame, domain: str, dataset: str, sensitivity: str
+    ) -> Schema:
+        """
+        Generates a schema for a pandas DataFrame and a specified dataset in the API.
+
+        Args:
+            df (DataFrame): The pandas DataFrame to generate a schema for.
+            domain (str): The domain of the dataset to generate a schema for.
+            dataset (str): The name of the dataset to generate a schema for.
+            sensitivity (str): The sensitivity level of the schema to generate.
+
+        Raises:
+            :class:`rapid.exceptions.SchemaGenerationFailedException`: If an error occurs while generating the schema.
+
+        Returns:
+            :class:`rapid.items.schema.Schema`: A Schema class type from the generated schema for the DataFrame and dataset.
+        """
+        url = f"{self.auth.url}/schema/{sensitivity}/{domain}/{dataset}/generate"
+        response = await self._request(
+            "POST", url, files=await self.convert_dataframe_for_file_upload(df)
+        )
+        data = loads(response.content)
+        if response.status_code == 200:
+            return Schema(**data)
+        raise SchemaGenerationFailedException("Could not generate schema", data)
+
+    async def create_schema(self, schema: Schema):
+        """
+        Creates a new schema on the API.
+
+        Args:
+            schema (:class:`rapid.items.schema.Schema`): The schema model for which you want to create for.
+
+        Raises:
+            :class: `rapid.exceptions.SchemaAlreadyExistsException`: If you try to create a schema that already exists in rAPId.
+            :class:`rapid.exceptions.SchemaCreateFailedException`: If an error occurs while trying to update the schema.
+        """
+        response = await self._request(
+            "POST", f"{self.auth.url}/schema", content=schema.json()
+        )
+        if response.status_code == 200:
+            pass
+        elif response.status_code == 409:
+            raise SchemaAlreadyExistsException("The schema already exists")
+        else:
+            data = loads(response.content)
+            raise SchemaCreateFailedException("Could not create schema", data)
+
+    async def update_schema(self, schema: Schema):
+        """
+        Uploads a new updated schema to the API.
+
+        Args:
+            schema (:class:`rapid.items.schema.Schema`): The new schema model that will be used for the update.
+
+        Raises:
+            :class:`rapid.exceptions.SchemaUpdateFailedException`: If an error occurs while trying to update the schema.
+        """
+        response = await self._request(
+            "PUT", f"{self.auth.url}/schema", content=schema.json()
+        )
+        data = loads(response.content)
+        if response.status_code == 200:
+            return data
+        raise SchemaUpdateFailedException("Could not update schema", data)
@@ -1,10 +1,12 @@
 import json
 import os
+import threading
+import time
 
 import requests
 from requests.auth import HTTPBasicAuth
 
-from rapid.utils.constants import TIMEOUT_PERIOD
+from rapid.utils.constants import TIMEOUT_PERIOD, TOKEN_EXPIRY_MARGIN
 from rapid.exceptions import AuthenticationErrorException, CannotFindCredentialException
 
 RAPID_CLIENT_ID = "RAPID_CLIENT_ID"
@@ -14,22 +16,43 @@ RAPID_URL = "RAPID_URL"
 
 class RapidAuth:
     def __init__(
-        self, client_id: str = None, client_secret: str = None, url: str = None
+        self,
+        client_id: str = None,
+        client_secret: str = None,
+        url: str = None,
+        session: requests.Session = None,
+        lazy: bool = False,
     ) -> None:
         """
         The rAPId auth class is a helper authentication class used to connect to your rAPId API instance. The authentication values
         can be passed into the constructor but they default to reading them from your environment variables.
 
+        Access tokens are cached in memory and only refreshed shortly before they expire, so a single instance
+        can safely be shared between threads.
+
+        By default the credentials are validated with a token request when the class is created. In `lazy` mode
+        construction makes no network calls and the credentials are validated by the first request that needs
+        a token, which then reuses it.
+
         Args:
             client_id (str, optional): Your rAPId API client id token. Defaults to None.
             client_secret (str, optional): Your rAPId API client secret token. Defaults to None.
             url (str, optional): The url where your rAPId API is hosted. Defaults to None.
+            session (requests.Session, optional): The session used to request tokens. When used with
+                :class:`rapid.rapid.Rapid` this is replaced by the client's pooled session. Defaults to a new session.
+            lazy (bool, optional): Whether to defer validating the credentials until a token is first needed. Defaults to False.
         """
 
         self.client_id = self.evaluate_inputs(client_id, RAPID_CLIENT_ID)
         self.client_secret = self.evaluate_inputs(client_secret, RAPID_CLIENT_SECRET)
         self.url = self.evaluate_inputs(url, RAPID_URL)
-        self.validate_credentials()
+        self._owns_session = session is None
+        self.session = session if session else requests.Session()
+        self._token = None
+        self._token_expiry = 0.0
+        self._token_lock = threading.Lock()
+        if not lazy:
+            self.validate_credentials()
 
     def evaluate_inputs(self, value: str, environment_variable: str):
         if not value:
@@ -55,7 +78,7 @@ class RapidAuth:
         return HTTPBasicAuth(self.client_id, self.client_secret)
 
     def request_token(self):
-        response = requests.post(
+        response = self.session.post(
             self.url + "/oauth2/token",
             auth=self.credentials_secret(),
             headers=self.headers,
@@ -66,7 +89,7 @@ class RapidAuth:
 
     def validate_credentials(self):
         """
-        Tests authentication to the rAPId API.
+        Tests authentication to the rAPId API. The token requested is cached for later requests.
 
         Raises:
             :class:`rapid.exceptions.AuthenticationErrorException`: If no authorisation can be created.
@@ -74,10 +97,50 @@ class RapidAuth:
         Returns:
             None: If authentication was successful.
         """
-        if self.request_token().status_code != 200:
+        with self._token_lock:
+            self._refresh_token()
+
+    def fetch_token(self):
+        """
+        Returns an access token for the rAPId API. A cached token is reused until it is within
+        `TOKEN_EXPIRY_MARGIN` seconds of expiring, at which point a single new token is requested
+        while any other threads wait for it.
+
+        Raises:
+            :class:`rapid.exceptions.AuthenticationErrorException`: If no authorisation can be created.
+
+        Returns:
+            str: The access token.
+        """
+        if self._is_token_valid():
+            return self._token
+        with self._token_lock:
+            if not self._is_token_valid():
+                self._refresh_token()
+            return self._token
+
+    def _is_token_valid(self) -> bool:
+        return self._token is not None and time.monotonic() < self._token_expiry
+
+    def _refresh_token(self):
+        response = self.request_token()
+        if response.status_code != 200:
             raise AuthenticationErrorException(
                 "Auth not configured, could not connect to instance of rAPId"
             )
-
-    def fetch_token(self):
-        return json.loads(self.request_token().content.decode("utf-8"))["access_token"]
+        data = json.loads(response.content.decode("utf-8"))
+        self._token = data["access_token"]
+        self._token_expiry = token_expiry(data)
+
+
+def token_expiry(data: dict) -> float:
+    """
+    Returns the `time.monotonic()` time after which a token from the given token response
+    should be refreshed.
+    """
+    expires_in = data.get("expires_in")
+    if expires_in is None:
+        # Without a known lifetime the token cannot safely be reused
+        return 0.0
+    margin = min(TOKEN_EXPIRY_MARGIN, int(expires_in) / 2)
+    return time.monotonic() + int(expires_in) - margin
@@ -0,0 +1,162 @@
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from rapid.rapid import Rapid
+
+DatasetKey = Tuple[str, str]
+
+
+class DatasetCatalogue:
+    def __init__(self, rapid: Rapid, ttl: Optional[float] = None) -> None:
+        """
+        An in-memory catalogue of the datasets in rAPId, built from :meth:`rapid.rapid.Rapid.list_datasets`.
+        The datasets are fetched once and indexed by domain, dataset, version and tag, so lookups do not
+        call the API. The catalogue is fetched again once `ttl` seconds have passed, when :meth:`refresh`
+        is called, or on the next lookup after the client creates or updates a schema.
+
+        Example::
+
+            catalogue = DatasetCatalogue(rapid, ttl=300)
+            if catalogue.exists("domain", "dataset"):
+                ...
+            catalogue.find(key_value_tags={"team": "data"}, key_only_tags=["daily"])
+
+        Args:
+            rapid (:class:`rapid.rapid.Rapid`): The client used to list the datasets.
+            ttl (float, optional): The number of seconds the catalogue stays valid for. Defaults to None, never expiring.
+        """
+        self.rapid = rapid
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._fetched_at = None
+        self._schema_changes = None
+        self._versions: Dict[DatasetKey, Dict[int, Dict]] = {}
+        self._domains: Dict[str, List[DatasetKey]] = {}
+        self._tags: Dict[Tuple[str, Optional[str]], Set[DatasetKey]] = {}
+
+    def refresh(self) -> None:
+        """
+        Fetches the datasets from the API and rebuilds the indexes.
+        """
+        with self._lock:
+            # Read before listing, so that a schema changed while listing refreshes the catalogue again
+            schema_changes = self.rapid.schema_changes
+            self._build(self.rapid.list_datasets())
+            self._fetched_at = time.monotonic()
+            self._schema_changes = schema_changes
+
+    def invalidate(self) -> None:
+        """
+        Marks the catalogue as out of date, so that it is fetched again on the next lookup.
+        """
+        self._fetched_at = None
+
+    def exists(self, domain: str, dataset: str, version: Optional[int] = None) -> bool:
+        """
+        Returns whether a dataset, or a version of it, exists.
+        """
+        return self.get(domain, dataset, version) is not None
+
+    def get(
+        self, domain: str, dataset: str, version: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Returns the entry for a dataset as listed by the API, or None if it does not exist.
+
+        Args:
+            domain (str): The domain of the dataset.
+            dataset (str): The name of the dataset.
+            version (int, optional): The version of the dataset. Defaults to None, returning the latest version.
+        """
+        versions = self._index()[0].get((domain, dataset))
+        if not versions:
+            return None
+        if version is None:
+            return versions[max(versions)]
+        return versions.get(int(version))
+
+    def versions(self, domain: str, dataset: str) -> List[int]:
+        """
+        Returns the known versions of a dataset in ascending order.
+        """
+        return sorted(self._index()[0].get((domain, dataset), {}))
+
+    def datasets(self, domain: Optional[str] = None) -> List[Dict]:
+        """
+        Returns the latest version of every dataset, or of the datasets in a domain.
+        """
+        versions, domains, _ = self._index()
+        keys = domains.get(domain, []) if domain is not None else list(versions)
+        return [versions[key][max(versions[key])] for key in keys]
+
+    def find(
+        self,
+        key_value_tags: Optional[Dict[str, str]] = None,
+        key_only_tags: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Returns the latest version of the datasets that have all of the given tags.
+
+        Args:
+            key_value_tags (Dict[str, str], optional): Tags that must be set to the given values. Defaults to None.
+            key_only_tags (List[str], optional): Tags that must be present, with any value. Defaults to None.
+        """
+        versions, _, tags = self._index()
+        required = [(key, str(value)) for key, value in (key_value_tags or {}).items()]
+        required += [(key, None) for key in key_only_tags or []]
+        if not required:
+            return self.datasets()
+        matches = sorted(
+            (tags.get(tag, set()) for tag in required), key=len
+        )  # intersect starting from the smallest set
+        keys = set(matches[0]).intersection(*matches[1:])
+        return [versions[key][max(versions[key])] for key in sorted(keys)]
+
+    def _index(self):
+        with self._lock:
+            stale = (
+                self._fetched_at is None
+                or self._schema_changes != self.rapid.schema_changes
+                or (
+                    self.ttl is not None
+                    and time.monotonic() - self._fetched_at > self.ttl
+                )
+            )
+        if stale:
+            self.refresh()
+        with self._lock:
+            return self._versions, self._domains, self._tags
+
+    def _build(self, entries: List[Dict]) -> None:
+        versions: Dict[DatasetKey, Dict[int, Dict]] = {}
+        domains: Dict[str, List[DatasetKey]] = {}
+        tags: Dict[Tuple[str, Optional[str]], Set[DatasetKey]] = {}
+        for entry in entries:
+            fields = _fields(entry)
+            key = (fields.get("domain"), fields.get("dataset"))
+            if key not in versions:
+                versions[key] = {}
+                domains.setdefault(key[0], []).append(key)
+            versions[key][int(fields.get("version") or 1)] = entry
+        # Lookups return the latest version, so only its tags are indexed
+        for key, entries_by_version in versions.items():
+            fields = _fields(entries_by_version[max(entries_by_version)])
+            key_value_tags = dict(fields.get("keyvaluetags") or {})
+            key_only_tags = list(fields.get("keyonlytags") or [])
+            # Older versions of the API list all tags together, with empty values for key only tags
+            for tag, value in (fields.get("tags") or {}).items():
+                if value:
+                    key_value_tags[tag] = value
+                else:
+                    key_only_tags.append(tag)
+            for tag, value in key_value_tags.items():
+                tags.setdefault((tag, str(value)), set()).add(key)
+                tags.setdefault((tag, None), set()).add(key)
+            for tag in key_only_tags:
+                tags.setdefault((tag, None), set()).add(key)
+        self._versions, self._domains, self._tags = versions, domains, tags
+
+
+def _fields(entry: Dict) -> Dict:
+    return {name.lower().replace("_", ""): value for name, value in entry.items()}
@@ -8,6 +8,12 @@ class JobFailedException(Exception):
         self.data = data
 
 
+class JobTimeoutException(Exception):
+    def __init__(self, message, data):
+        self.message = message
+        self.data = data
+
+
 class UnableToFetchJobStatusException(Exception):
     def __init__(self, message, data):
         self.message = message
@@ -20,6 +26,10 @@ class DataFrameUploadFailedException(Exception):
         self.data = data
 
 
+class DataFrameChunkUploadFailedException(DataFrameUploadFailedException):
+    pass
+
+
 class DataFrameUploadValidationException(Exception):
     pass
 
@@ -36,6 +46,10 @@ class DatasetNotFoundException(Exception):
         self.data = data
 
 
+class InvalidPaginationQueryException(Exception):
+    pass
+
+
 class SchemaGenerationFailedException(Exception):
     def __init__(self, message, data):
         self.message = message
@@ -14,6 +14,15 @@ class UpdateBehaviour(Enum):
     OVERWRITE = "OVERWRITE"
 
 
+class ColumnChangeType(Enum):
+    ADDED = "ADDED"
+    REMOVED = "REMOVED"
+    TYPE_CHANGED = "TYPE_CHANGED"
+    NULLABILITY_CHANGED = "NULLABILITY_CHANGED"
+    PARTITION_CHANGED = "PARTITION_CHANGED"
+    FORMAT_CHANGED = "FORMAT_CHANGED"
+
+
 class Owner(BaseModel):
     name: str
     email: str
@@ -40,6 +49,59 @@ class Column(BaseModel):
     format: Optional[str] = None
 
 
+class ColumnChange(BaseModel):
+    name: str
+    change_type: ColumnChangeType
+    old: Optional[Column] = None
+    new: Optional[Column] = None
+    breaking: bool
+
+
+class SchemaDiff(BaseModel):
+    """
+    The differences between the columns of two schemas, as returned by :meth:`Schema.diff`. Each
+    change is classified as compatible, such as adding a nullable column or widening a type, or
+    breaking, such as removing a column or changing a partition.
+    """
+
+    changes: List[ColumnChange] = []
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changes)
+
+    @property
+    def is_breaking(self) -> bool:
+        return any(change.breaking for change in self.changes)
+
+    @property
+    def added(self) -> List[ColumnChange]:
+        return self._of_type(ColumnChangeType.ADDED)
+
+    @property
+    def removed(self) -> List[ColumnChange]:
+        return self._of_type(ColumnChangeType.REMOVED)
+
+    @property
+    def type_changed(self) -> List[ColumnChange]:
+        return self._of_type(ColumnChangeType.TYPE_CHANGED)
+
+    @property
+    def nullability_changed(self) -> List[ColumnChange]:
+        return self._of_type(ColumnChangeType.NULLABILITY_CHANGED)
+
+    @property
+    def partition_changed(self) -> List[ColumnChange]:
+        return self._of_type(ColumnChangeType.PARTITION_CHANGED)
+
+    @property
+    def format_changed(self) -> List[ColumnChange]:
+        return self._of_type(ColumnChangeType.FORMAT_CHANGED)
+
+    def _of_type(self, change_type: ColumnChangeType) -> List[ColumnChange]:
+        return [change for change in self.changes if change.change_type == change_type]
+
+
 class Schema(BaseModel):
     """
     A Schema is a Pydantic class representing a rAPId schema. It allows you to programmatically define
@@ -89,18 +151,133 @@ class Schema(BaseModel):
 
         """
         Checks that for a given Schema, does it's columns match the columns being passed
-        into this function.
+        into this function. The order of the columns is ignored.
 
         Args:
             new_columns (Union[List[Column], List[dict]]): The new columns can be passed as either
                 a list of Column defined classes or as a list of Python dictionaries representing
                 the values. If the later is chosen and there is an incorrect value passed the function
-                will raise a :class:`rapid.exceptions.ColumnNotDifferentException`.
+                will raise a :class:`pydantic.ValidationError`.
 
         Returns:
             bool: If the new columns match the columns in the Schema
         """
-        if all(isinstance(col, dict) for col in new_columns):
-            new_columns = [Column(**col) for col in new_columns]
+        return not self.diff(new_columns).has_changes
+
+    def diff(self, new_columns: Union[List[Column], List[dict]]) -> SchemaDiff:
+        """
+        Compares the Schema's columns against new columns by name, in linear time.
+
+        Args:
+            new_columns (Union[List[Column], List[dict]]): The new columns, as Column classes or
+                Python dictionaries representing the values.
+
+        Returns:
+            SchemaDiff: The added, removed and changed columns, in the order of the new columns
+                followed by the removed columns.
+        """
+        old_columns = {column.name: column for column in self.columns}
+        changes = []
+        seen = set()
+        for new in new_columns:
+            if isinstance(new, dict):
+                new = Column(**new)
+            seen.add(new.name)
+            old = old_columns.get(new.name)
+            if old is None:
+                changes.append(
+                    ColumnChange(
+                        name=new.name,
+                        change_type=ColumnChangeType.ADDED,
+                        new=new,
+                        breaking=not new.allow_null or new.partition_index is not None,
+                    )
+                )
+                continue
+            for change_type, old_value, new_value, breaking in (
+                (
+                    ColumnChangeType.TYPE_CHANGED,
+                    old.data_type,
+                    new.data_type,
+                    not _is_widening(old.data_type, new.data_type),
+                ),
+                (
+                    ColumnChangeType.NULLABILITY_CHANGED,
+                    old.allow_null,
+                    new.allow_null,
+                    not new.allow_null,
+                ),
+                (
+                    ColumnChangeType.PARTITION_CHANGED,
+                    old.partition_index,
+                    new.partition_index,
+                    True,
+                ),
+                (ColumnChangeType.FORMAT_CHANGED, old.format, new.format, True),
+            ):
+                if old_value != new_value:
+                    changes.append(
+                        ColumnChange(
+                            name=new.name,
+                            change_type=change_type,
+                            old=old,
+                            new=new,
+                            breaking=breaking,
+                        )
+                    )
+        for name, old in old_columns.items():
+            if name not in seen:
+                changes.append(
+                    ColumnChange(
+                        name=name,
+                        change_type=ColumnChangeType.REMOVED,
+                        old=old,
+                        breaking=True,
+                    )
+                )
+        return SchemaDiff(changes=changes)
+
+
+def _type_family(data_type: str) -> Optional[str]:
+    data_type = data_type.lower()
+    if data_type in ("string", "object", "str"):
+        return "string"
+    if data_type.startswith(("int", "uint", "bigint", "smallint", "tinyint")):
+        return "integer"
+    if data_type.startswith("float") or data_type in ("double", "decimal"):
+        return "float"
+    return None
+
+
+def _is_widening(old: str, new: str) -> bool:
+    """
+    Whether values of the old data type can be read as the new data type without loss, such as
+    integers to floats or anything to strings.
+    """
+    if old.lower() == new.lower():
+        return True
+    old_family, new_family = _type_family(old), _type_family(new)
+    if new_family == "string":
+        return True
+    if old_family == "integer":
+        return new_family in ("integer", "float") and _bits(new) >= _bits(old)
+    if old_family == "float":
+        return new_family == "float" and _bits(new) >= _bits(old)
+    return False
+
 
-        return self.columns == new_columns
+def _bits(data_type: str) -> int:
+    data_type = data_type.lower()
+    for prefix, bits in (
+        ("tinyint", 8),
+        ("smallint", 16),
+        ("bigint", 64),
+        ("double", 64),
+        ("decimal", 128),
+    ):
+        if data_type.startswith(prefix):
+            return bits
+    digits = "".join(character for character in data_type if character.isdigit())
+    if digits:
+        return int(digits)
+    return 64 if data_type.startswith("float") else 32
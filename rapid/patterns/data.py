@@ -1,71 +1,132 @@
-from typing import Union, List
+from typing import Optional, Union, List
 from pandas import DataFrame
 from rapid.exceptions import (
     ColumnNotDifferentException,
     DataFrameUploadValidationException,
 )
-from rapid.items.schema import Schema, SchemaMetadata, Column
+from rapid.items.schema import Schema, SchemaDiff, SchemaMetadata, Column
+from rapid.utils.manifest import UploadManifest
+from rapid.utils.payload import UploadPayload
 from rapid import Rapid
 
 
 def upload_and_create_dataframe(
-    rapid: Rapid, metadata: SchemaMetadata, df: DataFrame, upgrade_schema_on_fail=False
+    rapid: Rapid,
+    metadata: SchemaMetadata,
+    df: DataFrame,
+    upgrade_schema_on_fail=False,
+    local_schema=False,
 ):
     """
     Generates a schema and dataset from a pandas Dataframe. The function first creates the schema
-    using the API and the uploads the DataFrame to this schema, uploading the data to rAPId.
+    using the API and the uploads the DataFrame to this schema, uploading the data to rAPId. The
+    DataFrame is serialised once and the same payload is sent to every endpoint.
 
     Args:
         rapid (Rapid): An instance of the rAPId SDK's main class.
         metadata (SchemaMetadata): The metadata for the schema to be created and the dataset to upload the DataFrame to.ß
         df (DataFrame): The pandas DataFrame to generate a schema for and upload to the dataset.
         upgrade_schema_on_fail (bool, optional): Whether to upgrade the schema if the DataFrame's schema is incorrect. Defaults to False.
+        local_schema (bool, optional): Whether to infer the schema locally instead of uploading the DataFrame to generate it. Defaults to False.
 
     Raises:
         :class:`rapid.exceptions.DataFrameUploadValidationException`: If the DataFrame's schema is incorrect and upgrade_schema_on_fail is False.
         Exception: If an error occurs while generating the schema, creating the schema, or uploading the DataFrame.
     """
-    schema = rapid.generate_schema(
-        df, metadata.domain, metadata.dataset, metadata.sensitivity
-    )
-    try:
-        rapid.create_schema(schema)
-        rapid.upload_dataframe(metadata.domain, metadata.dataset, df)
-    except DataFrameUploadValidationException as exception:
-        if upgrade_schema_on_fail:
-            update_schema_dataframe(rapid, metadata, df, schema.columns)
-        else:
+    with rapid.prepare_payload(df) as payload:
+        schema = rapid.generate_schema(
+            payload,
+            metadata.domain,
+            metadata.dataset,
+            metadata.sensitivity,
+            local_schema,
+        )
+        try:
+            rapid.create_schema(schema)
+            rapid.upload_dataframe(metadata.domain, metadata.dataset, payload)
+        except DataFrameUploadValidationException as exception:
+            if upgrade_schema_on_fail:
+                update_schema_dataframe(rapid, metadata, payload, schema.columns)
+            else:
+                raise exception
+        except Exception as exception:
             raise exception
-    except Exception as exception:
-        raise exception
 
 
 def update_schema_dataframe(
     rapid: Rapid,
     metadata: SchemaMetadata,
-    df: DataFrame,
+    df: Union[DataFrame, UploadPayload],
     new_columns: Union[List[Column], List[dict]],
-):
+) -> SchemaDiff:
     """
-    Updates a schema for a specified dataset in the API based on a pandas DataFrame.
+    Updates a schema for a specified dataset in the API based on a pandas DataFrame. The update is
+    only made if the new columns differ, by name, from those generated for the DataFrame.
 
     Args:
         rapid (Rapid): An instance of the rAPId SDK's main class.
         metadata (SchemaMetadata): The metadata for the schema to be updated and the dataset the DataFrame belongs to.
-        df (DataFrame): The pandas DataFrame to generate the original schema columns from.
+        df (Union[DataFrame, UploadPayload]): The pandas DataFrame to generate the original schema columns from, or a payload of it.
         new_columns (Union[List[Column], List[dict]]): The new schema columns to update the schema with.
 
     Raises:
         :class:`rapid.exceptions.ColumnNotDifferentException`: If the new schema columns are the same as the existing schema columns.
         Exception: If an error occurs while generating the schema information, updating the schema, or comparing the schema columns.
+
+    Returns:
+        SchemaDiff: The changes made to the schema's columns.
     """
     info = rapid.generate_info(df, metadata.domain, metadata.dataset)
     try:
         schema = Schema(metadata=metadata, columns=info["columns"])
-        if schema.are_columns_the_same(new_columns=new_columns):
+        diff = schema.diff(new_columns)
+        if not diff.has_changes:
             raise ColumnNotDifferentException
 
         schema.columns = new_columns
         rapid.update_schema(schema)
+        return diff
     except Exception as e:
         raise e
+
+
+def upload_dataframe_delta(
+    rapid: Rapid,
+    manifest: UploadManifest,
+    domain: str,
+    dataset: str,
+    df: DataFrame,
+    key_columns: Optional[List[str]] = None,
+    wait_to_complete: bool = True,
+) -> int:
+    """
+    Uploads only the rows of a pandas DataFrame that have not already been uploaded to an APPEND dataset,
+    according to a local :class:`rapid.utils.manifest.UploadManifest`. Rows are identified by a hash of their
+    key columns, which must be the same for every upload
+    to the dataset, and repeated keys within the DataFrame are only uploaded once. The uploaded rows are recorded
+    in the manifest once the upload job succeeds, or once the upload is accepted if not waiting for it.
+
+    If the manifest is lost, :meth:`rapid.utils.manifest.UploadManifest.rebuild` records the rows the dataset
+    already holds before uploading again.
+
+    Args:
+        rapid (Rapid): An instance of the rAPId SDK's main class.
+        manifest (UploadManifest): The manifest of rows already uploaded.
+        domain (str): The domain of the dataset to upload to.
+        dataset (str): The name of the dataset to upload to.
+        df (DataFrame): The pandas DataFrame to upload the new rows of.
+        key_columns (List[str], optional): The columns that identify a row. Defaults to None, using every column.
+        wait_to_complete (bool, optional): Whether to wait for the upload job to complete before returning. Defaults to True.
+
+    Raises:
+        Exception: If an error occurs while uploading the new rows, in which case nothing is recorded.
+
+    Returns:
+        int: The number of rows uploaded.
+    """
+    new_rows, hashes = manifest.new_rows(domain, dataset, df, key_columns)
+    if new_rows.empty:
+        return 0
+    rapid.upload_dataframe(domain, dataset, new_rows, wait_to_complete)
+    manifest.add(domain, dataset, hashes)
+    return len(new_rows)
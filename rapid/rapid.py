@@ -1,17 +1,39 @@
-from datetime import datetime
-from typing import Dict, Optional
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import json
+import os
+import threading
 import time
+from urllib.parse import urlsplit
 import requests
 
-import pandas as pd
-from pandas import DataFrame
-
 from rapid.auth import RapidAuth
-from rapid.items.schema import Schema
-from rapid.items.query import Query
-from rapid.utils.constants import TIMEOUT_PERIOD
+from rapid.utils.constants import (
+    TIMEOUT_PERIOD,
+    DOWNLOAD_PAGE_SIZE,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    UPLOAD_MAX_WORKERS,
+    UPLOAD_MEMORY_LIMIT,
+    UPLOAD_INFLIGHT_BYTES,
+    SAMPLE_ROWS,
+    Compression,
+    EventPhase,
+    FileFormat,
+    UploadFormat,
+)
+from rapid.utils.backoff import Backoff
+from rapid.utils.budget import ByteBudget
+from rapid.utils.compress import compress, compress_file
+from rapid.utils.hooks import Event, Hooks, endpoint_template
+from rapid.utils.multipart import StreamBody, multipart_body
+from rapid.utils.payload import UploadPayload
+from rapid.utils.retry import RetryPolicy
+from rapid.utils.session import create_session
 from rapid.exceptions import (
+    DataFrameChunkUploadFailedException,
     DataFrameUploadFailedException,
     DataFrameUploadValidationException,
     JobFailedException,
@@ -22,22 +44,277 @@ from rapid.exceptions import (
     UnableToFetchJobStatusException,
     DatasetInfoFailedException,
     DatasetNotFoundException,
+    InvalidPaginationQueryException,
+    JobTimeoutException,
 )
 
+# pandas, pyarrow and the pydantic models are only imported when first used, so that
+# importing the sdk stays fast for short lived processes
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow as pa
+    from pandas import DataFrame
+
+    from rapid.items.query import Query, SQLQueryOrderBy
+    from rapid.items.schema import Schema, UpdateBehaviour
+    from rapid.utils.cache import DownloadCache
 
-class Rapid:
-    def __init__(self, auth: RapidAuth = None) -> None:
+
+class Rapid:  # pylint: disable=too-many-public-methods
+    def __init__(
+        self,
+        auth: RapidAuth = None,
+        session: requests.Session = None,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = False,
+        upload_format: Union[UploadFormat, str] = UploadFormat.CSV,
+        parquet_compression: str = "snappy",
+        compression: Optional[Union[Compression, str]] = None,
+        compression_level: Optional[int] = None,
+        upload_memory_limit: int = UPLOAD_MEMORY_LIMIT,
+        cache: Optional[DownloadCache] = None,
+        hooks: Optional[List[Callable[[Event], None]]] = None,
+        retry: Optional[RetryPolicy] = None,
+    ) -> None:
         """
         The rAPId class is the main SDK class for the rAPId API. It acts as a wrapper for the various
         API endpoints, providing a simple and intuitive programmatic interface.
 
+        All requests, including those made by the auth class, share one pooled keep-alive session. The
+        client can be used as a context manager to close the session once finished::
+
+            with Rapid() as rapid:
+                rapid.list_datasets()
+
         Args:
             auth (:class:`rapid.auth.RapidAuth`, optional): An instance of the rAPId auth class, which is used for authentication and authorization with the API. Defaults to None.
+            session (requests.Session, optional): A session to send requests with instead of creating a pooled one. It is not closed by :meth:`close`. Defaults to None.
+            pool_connections (int, optional): The number of hosts to keep connection pools for. Defaults to 10.
+            pool_maxsize (int, optional): The maximum number of connections kept open per host, set this to at least the number of threads sharing the client. Defaults to 10.
+            pool_block (bool, optional): Whether to block when a host's pool is exhausted instead of opening a short lived extra connection. Defaults to False.
+            upload_format (:class:`rapid.utils.constants.UploadFormat`, optional): The file format DataFrames are serialised to before being sent to the API. Parquet requires pyarrow and falls back to csv without it. Defaults to csv.
+            parquet_compression (str, optional): The compression codec used when uploading parquet files. Defaults to "snappy".
+            compression (:class:`rapid.utils.constants.Compression`, optional): The codec used to compress file upload request bodies, gzip or zstd. zstd requires the optional `zstandard` dependency. Until a compressed upload has succeeded, an upload that gets a client error is sent again uncompressed, and compression is turned off for the client if that succeeds. Defaults to None.
+            compression_level (int, optional): The compression level. Defaults to the codec's default level.
+            upload_memory_limit (int, optional): The number of bytes of a serialised upload kept in memory. Larger uploads are
+                spooled to a temporary file and streamed from it. Defaults to 16MB.
+            cache (:class:`rapid.utils.cache.DownloadCache`, optional): A local cache that downloaded DataFrames are served from and stored in. Defaults to None.
+            hooks (List[Callable[[:class:`rapid.utils.hooks.Event`], None]], optional): Functions called with a timing event for each
+                token fetch, serialisation, request, decode and job outcome. More can be added with `hooks.register`. Defaults to None.
+            retry (:class:`rapid.utils.retry.RetryPolicy`, optional): How requests that hit a rate limit, a gateway error or a dropped
+                connection are retried. Uploads are retried with the file already serialised. Defaults to up to 4 attempts within 60
+                seconds, pass `RetryPolicy(max_attempts=1)` to turn retries off.
+        """
+        self.upload_format = UploadFormat(upload_format)
+        self.parquet_compression = parquet_compression
+        self.compression = Compression(compression) if compression else None
+        self.compression_level = compression_level
+        self.upload_memory_limit = upload_memory_limit
+        self._compression_accepted = False
+        self.cache = cache
+        self._pending_uploads: Dict[str, Tuple[str, str]] = {}
+        self._pending_lock = threading.Lock()
+        self._schema_changes = 0
+        self.hooks = Hooks(hooks)
+        self.retry = retry if retry else RetryPolicy()
+        self._owns_session = session is None
+        self.session = (
+            session
+            if session
+            else create_session(pool_connections, pool_maxsize, pool_block)
+        )
+        if auth:
+            self.auth = auth
+            # The session the auth class created for itself is replaced, so its connections are released
+            if getattr(auth, "_owns_session", False) is True:
+                if auth.session is not self.session:
+                    auth.session.close()
+                auth._owns_session = False
+            self.auth.session = self.session
+        else:
+            self.auth = RapidAuth(session=self.session)
+
+    @property
+    def schema_changes(self) -> int:
+        """
+        The number of schemas the client has created or updated, used to tell when lists of datasets are out of date.
+        """
+        return self._schema_changes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
         """
-        self.auth = auth if auth else RapidAuth()
+        Closes the pooled session and any connections it holds open.
+        """
+        if self._owns_session:
+            self.session.close()
 
     def generate_headers(self) -> Dict:
-        return {"Authorization": "Bearer " + self.auth.fetch_token()}
+        if not self.hooks:
+            return {"Authorization": "Bearer " + self.auth.fetch_token()}
+        start = time.perf_counter()
+        token = self.auth.fetch_token()
+        self.hooks.emit(Event(EventPhase.TOKEN, time.perf_counter() - start))
+        return {"Authorization": "Bearer " + token}
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict = None,
+        idempotent: bool = True,
+        **kwargs,
+    ) -> requests.Response:
+        # Requests that are not idempotent, like uploads that each start a job, are only retried
+        # when the API cannot have acted on them
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            if hasattr(kwargs.get("data"), "seek"):
+                kwargs["data"].seek(0)
+            try:
+                response = self._send(method, url, headers, **kwargs)
+                delay = self.retry.delay(
+                    method,
+                    attempt,
+                    time.monotonic() - start,
+                    response=response,
+                    idempotent=idempotent,
+                )
+                if delay is None:
+                    return response
+                status_code = response.status_code
+            except requests.ConnectionError as error:
+                delay = self.retry.delay(
+                    method,
+                    attempt,
+                    time.monotonic() - start,
+                    error=error,
+                    idempotent=idempotent,
+                )
+                if delay is None:
+                    raise
+                status_code = None
+            if self.hooks:
+                self.hooks.emit(
+                    Event(
+                        EventPhase.RETRY,
+                        delay,
+                        endpoint=self._endpoint(url),
+                        method=method,
+                        status_code=status_code,
+                    )
+                )
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(
+        self, method: str, url: str, headers: Dict = None, **kwargs
+    ) -> requests.Response:
+        headers = {**self.generate_headers(), **(headers if headers else {})}
+        if not self.hooks:
+            return self.session.request(
+                method, url, headers=headers, timeout=TIMEOUT_PERIOD, **kwargs
+            )
+        start = time.perf_counter()
+        response = self.session.request(
+            method, url, headers=headers, timeout=TIMEOUT_PERIOD, **kwargs
+        )
+        duration = time.perf_counter() - start
+        body = response.request.body if response.request else None
+        endpoint = self._endpoint(url)
+        self.hooks.emit(
+            Event(
+                EventPhase.REQUEST,
+                duration,
+                endpoint=endpoint,
+                method=method,
+                status_code=response.status_code,
+                request_bytes=len(body) if hasattr(body, "__len__") else None,
+                response_bytes=len(response.content),
+                job_id=url.rsplit("/", 1)[-1] if endpoint == "/jobs/{id}" else None,
+            )
+        )
+        return response
+
+    def _endpoint(self, url: str) -> str:
+        path = url.split("?")[0]
+        if path.startswith(self.auth.url):
+            path = "/" + path[len(self.auth.url) :].lstrip("/")
+        else:
+            path = urlsplit(path).path
+        return endpoint_template(path)
+
+    def _emit_job(self, _id: str, start: float) -> None:
+        self.hooks.emit(
+            Event(
+                EventPhase.JOB,
+                time.perf_counter() - start,
+                endpoint="/jobs/{id}",
+                job_id=_id,
+            )
+        )
+
+    def _upload_file(self, url: str, files: Dict) -> requests.Response:
+        # The body is encoded once so that retries resend the same bytes, files spooled by
+        # convert_dataframe_for_file_upload are streamed from their temporary file and closed after
+        streamed = [
+            content for _, content in files.values() if hasattr(content, "read")
+        ]
+        try:
+            if streamed:
+                body, content_type = multipart_body(files)
+            else:
+                request = requests.Request("POST", url, files=files).prepare()
+                body, content_type = request.body, request.headers.get("Content-Type")
+            headers = {"Content-Type": content_type} if content_type else {}
+            if not self.compression:
+                return self._request(
+                    "POST", url, data=body, headers=headers, idempotent=False
+                )
+
+            compressed = (
+                compress_file(
+                    body,
+                    self.compression,
+                    self.compression_level,
+                    self.upload_memory_limit,
+                )
+                if streamed
+                else compress(body, self.compression, self.compression_level)
+            )
+            try:
+                response = self._request(
+                    "POST",
+                    url,
+                    data=StreamBody([compressed]) if streamed else compressed,
+                    headers={**headers, "Content-Encoding": self.compression.value},
+                    idempotent=False,
+                )
+            finally:
+                if streamed:
+                    compressed.close()
+            if self._compression_accepted or response.status_code >= 500:
+                return response
+            if response.ok:
+                self._compression_accepted = True
+                return response
+            # Until a compressed upload has succeeded, any client error may be the API failing to read
+            # the compressed body, so it is resent once uncompressed and compression is turned off if that works
+            response = self._request(
+                "POST", url, data=body, headers=headers, idempotent=False
+            )
+            if response.ok:
+                self.compression = None
+            return response
+        finally:
+            for content in streamed:
+                content.close()
 
     def list_datasets(self):
         """
@@ -49,11 +326,7 @@ class Rapid:
         For more details on the response structure, see the API documentation:
         https://getrapid.link/api/docs#/Datasets/list_all_datasets_datasets_post
         """
-        response = requests.post(
-            f"{self.auth.url}/datasets",
-            headers=self.generate_headers(),
-            timeout=TIMEOUT_PERIOD,
-        )
+        response = self._request("POST", f"{self.auth.url}/datasets")
         return json.loads(response.content.decode("utf-8"))
 
     def fetch_job_progress(self, _id: str):
@@ -70,14 +343,25 @@ class Rapid:
         https://getrapid.link/api/docs#/Jobs/get_job_jobs__job_id__get
         """
         url = f"{self.auth.url}/jobs/{_id}"
-        response = requests.get(
-            url, headers=self.generate_headers(), timeout=TIMEOUT_PERIOD
-        )
+        response = self._request("GET", url)
         data = json.loads(response.content.decode("utf-8"))
         if response.status_code == 200:
+            if data.get("status") in ("SUCCESS", "FAILED"):
+                self._settle_upload(_id)
             return data
         raise UnableToFetchJobStatusException("Could not check job status", data)
 
+    def _settle_upload(self, _id: str) -> None:
+        # Cached results read while the upload job ran may hold the rows from before it
+        with self._pending_lock:
+            uploaded = self._pending_uploads.pop(_id, None)
+        if uploaded and self.cache:
+            self.cache.invalidate(*uploaded)
+
+    def _upload_pending(self, domain: str, dataset: str) -> bool:
+        with self._pending_lock:
+            return (domain, dataset) in self._pending_uploads.values()
+
     def wait_for_job_outcome(self, _id: str, interval: int = 1):
         """
         Makes periodic requests to the API to wait for the outcome of a specific job.
@@ -92,30 +376,166 @@ class Rapid:
         Raises:
             :class:`rapid.exceptions.JobFailedException`: If the job outcome failed.
         """
+        start = time.perf_counter()
         while True:
             progress = self.fetch_job_progress(_id)
             status = progress["status"]
+            if status in ("SUCCESS", "FAILED") and self.hooks:
+                self._emit_job(_id, start)
             if status == "SUCCESS":
                 return None
             if status == "FAILED":
                 raise JobFailedException("Upload failed", progress)
             time.sleep(interval)
 
+    def iter_job_outcomes(
+        self,
+        job_ids: List[str],
+        timeout: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Polls the progress of many jobs from a single loop, yielding each job's final progress as soon
+        as it settles. The pause between polls grows with an exponential backoff.
+
+        Args:
+            job_ids (List[str]): The IDs of the jobs to wait for.
+            timeout (float, optional): The overall number of seconds to wait for all jobs. Defaults to None, waiting indefinitely.
+            backoff (:class:`rapid.utils.backoff.Backoff`, optional): The backoff between polls. Defaults to
+                a backoff starting at 1 second and growing to at most 30 seconds.
+
+        Raises:
+            :class:`rapid.exceptions.JobTimeoutException`: If jobs are still running once the timeout has passed.
+
+        Yields:
+            Tuple[str, Dict]: The job ID and its final progress, with a "status" of "SUCCESS" or "FAILED".
+        """
+        backoff = backoff if backoff else Backoff()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = list(dict.fromkeys(job_ids))
+        attempt = 0
+        start = time.perf_counter()
+        while pending:
+            still_pending = []
+            for _id in pending:
+                progress = self.fetch_job_progress(_id)
+                if progress["status"] in ("SUCCESS", "FAILED"):
+                    if self.hooks:
+                        self._emit_job(_id, start)
+                    yield _id, progress
+                else:
+                    still_pending.append(_id)
+            pending = still_pending
+            if not pending:
+                return
+            delay = backoff.delay(attempt)
+            attempt += 1
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise JobTimeoutException(
+                        f"{len(pending)} jobs did not finish within {timeout} seconds",
+                        pending,
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    def wait_for_jobs(
+        self,
+        job_ids: List[str],
+        timeout: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
+        callback: Optional[Callable[[str, Dict], None]] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Waits for many jobs at once, polling them all from a single loop with an exponential backoff.
+        Failed jobs do not raise, their outcome is returned along with the successful ones.
+
+        Args:
+            job_ids (List[str]): The IDs of the jobs to wait for.
+            timeout (float, optional): The overall number of seconds to wait for all jobs. Defaults to None, waiting indefinitely.
+            backoff (:class:`rapid.utils.backoff.Backoff`, optional): The backoff between polls. Defaults to
+                a backoff starting at 1 second and growing to at most 30 seconds.
+            callback (Callable[[str, Dict], None], optional): A function called with the job ID and final
+                progress of each job as soon as it settles. Defaults to None.
+
+        Raises:
+            :class:`rapid.exceptions.JobTimeoutException`: If jobs are still running once the timeout has passed.
+
+        Returns:
+            Dict[str, Dict]: The final progress of each job, keyed by job ID.
+        """
+        outcomes = {}
+        for _id, progress in self.iter_job_outcomes(job_ids, timeout, backoff):
+            outcomes[_id] = progress
+            if callback:
+                callback(_id, progress)
+        return outcomes
+
+    def watch_jobs(
+        self,
+        job_ids: List[str],
+        timeout: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
+    ) -> Dict[str, Future]:
+        """
+        Waits for many jobs on a single background thread without blocking the caller. Each job's future
+        resolves to its final progress when it succeeds, or raises a :class:`rapid.exceptions.JobFailedException`
+        if it fails and a :class:`rapid.exceptions.JobTimeoutException` if it is still running after the timeout.
+
+        Args:
+            job_ids (List[str]): The IDs of the jobs to wait for.
+            timeout (float, optional): The overall number of seconds to wait for all jobs. Defaults to None, waiting indefinitely.
+            backoff (:class:`rapid.utils.backoff.Backoff`, optional): The backoff between polls. Defaults to
+                a backoff starting at 1 second and growing to at most 30 seconds.
+
+        Returns:
+            Dict[str, Future]: A future for each job, keyed by job ID.
+        """
+        futures = {_id: Future() for _id in job_ids}
+
+        def watch():
+            try:
+                for _id, progress in self.iter_job_outcomes(job_ids, timeout, backoff):
+                    if progress["status"] == "FAILED":
+                        futures[_id].set_exception(
+                            JobFailedException("Upload failed", progress)
+                        )
+                    else:
+                        futures[_id].set_result(progress)
+            except Exception as exception:  # pylint: disable=broad-except
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(exception)
+
+        threading.Thread(target=watch, daemon=True).start()
+        return futures
+
     def download_dataframe(
         self,
         domain: str,
         dataset: str,
         version: Optional[int] = None,
-        query: Query = Query(),
+        query: Optional[Query] = None,
+        schema: Optional[Schema] = None,
+        compact: bool = False,
     ) -> DataFrame:
         """
-        Downloads data to a pandas DataFrame based on the domain, dataset and version passed.
+        Downloads data to a pandas DataFrame based on the domain, dataset and version passed. If the
+        client has a `cache`, a cached result for the same query is returned without calling the API.
+        Results are not cached while an upload job to the dataset from this client has not been seen to finish.
+
+        With `compact` set the columns are cast to the smallest dtypes that hold them by
+        :func:`rapid.utils.decode.compact_dtypes`, guided by the `schema` when it is passed, and the memory
+        saved is recorded in the DataFrame's `attrs["memory_usage"]`.
 
         Args:
             domain (str): The domain of the dataset to download the DataFrame from.
             dataset (str): The dataset from the domain to download the DataFrame from.
             version (int, optional): Version of the dataset to download.
             query (:class:`rapid.items.query.Query`, optional): An optional query type to provide when downloading data. Defaults to empty.
+            schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset, used to set the column dtypes instead of inferring them. Defaults to None.
+            compact (bool, optional): Whether to cast the columns to compact dtypes to save memory. Defaults to False.
 
         Raises:
             DatasetNotFoundException: :class:`rapid.exceptions.DatasetNotFoundException`: If the
@@ -125,57 +545,415 @@ class Rapid:
         Returns:
             DataFrame: A pandas DataFrame of the data
         """
-        url = f"{self.auth.url}/datasets/{domain}/{dataset}/query"
-        if version is not None:
-            url = f"{url}?version={version}"
-        response = requests.post(
+        from rapid.items.query import Query
+        from rapid.utils.decode import (
+            apply_schema_dtypes,
+            compact_dtypes,
+            dataframe_from_index_json,
+            infer_dtypes,
+        )
+
+        query = query if query else Query()
+        url = self._query_url(self.auth.url, domain, dataset, version)
+        df = None
+        if self.cache:
+            key = self.cache.key(url, version, query)
+            df = self.cache.get(key)
+        if df is None:
+            cacheable = self.cache and not self._upload_pending(domain, dataset)
+            df = self._query_dataset(
+                domain,
+                dataset,
+                url,
+                query,
+                lambda data: dataframe_from_index_json(data, raw=True),
+            )
+            # Results are not stored while an upload to the dataset may still change them
+            if cacheable and not self._upload_pending(domain, dataset):
+                self.cache.put(key, domain, dataset, df)
+        # The values are cached as decoded, so the schema, rather than inference, decides their dtypes
+        df = infer_dtypes(df, schema)
+        if compact:
+            return compact_dtypes(df, schema)
+        return apply_schema_dtypes(df, schema) if schema else df
+
+    def _query_dataset(
+        self, domain: str, dataset: str, url: str, query: Query, decode: Callable
+    ):
+        from rapid.utils.decode import loads
+
+        response = self._request(
+            "POST",
             url,
-            headers=self.generate_headers(),
-            data=json.dumps(query.dict(exclude_none=True)),
-            timeout=TIMEOUT_PERIOD,
+            data=query.json(exclude_none=True),
         )
-        data = json.loads(response.content.decode("utf-8"))
+        start = time.perf_counter() if self.hooks else None
+        data = loads(response.content)
         if response.status_code == 200:
-            return pd.read_json(json.dumps(data), orient="index")
+            result = decode(data)
+            if self.hooks:
+                self.hooks.emit(
+                    Event(
+                        EventPhase.DECODE,
+                        time.perf_counter() - start,
+                        endpoint=self._endpoint(url),
+                        response_bytes=len(response.content),
+                    )
+                )
+            return result
 
         raise DatasetNotFoundException(
             f"Could not find dataset, {domain}/{dataset} to download", data
         )
 
+    @staticmethod
+    def _query_url(base_url: str, domain: str, dataset: str, version: Optional[int]):
+        url = f"{base_url}/datasets/{domain}/{dataset}/query"
+        return url if version is None else f"{url}?version={version}"
+
+    def download_arrow(
+        self,
+        domain: str,
+        dataset: str,
+        version: Optional[int] = None,
+        query: Optional[Query] = None,
+        schema: Optional[Schema] = None,
+    ) -> pa.Table:
+        """
+        Downloads data to a pyarrow Table, built directly from the response without a pandas DataFrame.
+        Requires the optional `pyarrow` dependency. Downloads are not read from or stored in the client's `cache`.
+
+        Args:
+            domain (str): The domain of the dataset to download the table from.
+            dataset (str): The dataset from the domain to download the table from.
+            version (int, optional): Version of the dataset to download.
+            query (:class:`rapid.items.query.Query`, optional): An optional query type to provide when downloading data. Defaults to empty.
+            schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset, used to set the column types instead of inferring them. Defaults to None.
+
+        Raises:
+            :class:`rapid.exceptions.DatasetNotFoundException`: If the dataset to download does not exist.
+
+        Returns:
+            pyarrow.Table: A table of the data.
+        """
+        from rapid.items.query import Query
+        from rapid.utils.arrow import table_from_index_json
+
+        url = self._query_url(self.auth.url, domain, dataset, version)
+        return self._query_dataset(
+            domain,
+            dataset,
+            url,
+            query if query else Query(),
+            lambda data: table_from_index_json(data, schema),
+        )
+
+    def iter_dataframe(
+        self,
+        domain: str,
+        dataset: str,
+        query: Optional[Query] = None,
+        page_size: int = DOWNLOAD_PAGE_SIZE,
+        version: Optional[int] = None,
+        schema: Optional[Schema] = None,
+        prefetch: bool = False,
+    ) -> Iterator[DataFrame]:
+        """
+        Downloads data page by page, yielding a pandas DataFrame for each page so datasets larger than
+        memory can be processed in bounded memory.
+
+        Pages are fetched with keyset pagination on the first of the query's `order_by_columns`, which
+        must uniquely identify a row. Each page is requested with a `limit` of `page_size` rows and a filter
+        on the key to continue after the last row of the previous page. A `limit` set on the query caps the
+        total number of rows returned.
+
+        Example::
+
+            query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+            for df in rapid.iter_dataframe("domain", "dataset", query, page_size=10000):
+                process(df)
+
+        Args:
+            domain (str): The domain of the dataset to download the DataFrame from.
+            dataset (str): The dataset from the domain to download the DataFrame from.
+            query (:class:`rapid.items.query.Query`, optional): The query to page through, ordered by a unique key column.
+            page_size (int, optional): The maximum number of rows in each page. Defaults to 50000.
+            version (int, optional): Version of the dataset to download.
+            schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset, used to set the column dtypes. Defaults to None.
+            prefetch (bool, optional): Whether to download the next page on a background thread while the current page is processed. Defaults to False.
+
+        Raises:
+            :class:`rapid.exceptions.InvalidPaginationQueryException`: If the query has no order by column, or the key column is not selected.
+            :class:`rapid.exceptions.DatasetNotFoundException`: If the dataset to download does not exist.
+
+        Yields:
+            DataFrame: A pandas DataFrame for each page of the data.
+        """
+        return self._iter_pages(
+            query,
+            page_size,
+            prefetch,
+            lambda page_query: self.download_dataframe(
+                domain, dataset, version, page_query, schema
+            ),
+            lambda page, column: page[column].iloc[-1],
+        )
+
+    def iter_arrow(
+        self,
+        domain: str,
+        dataset: str,
+        query: Optional[Query] = None,
+        page_size: int = DOWNLOAD_PAGE_SIZE,
+        version: Optional[int] = None,
+        schema: Optional[Schema] = None,
+        prefetch: bool = False,
+    ) -> Iterator[pa.Table]:
+        """
+        Downloads data page by page like :meth:`iter_dataframe`, yielding a pyarrow Table for each page
+        built without a pandas DataFrame. Requires the optional `pyarrow` dependency.
+
+        Args:
+            domain (str): The domain of the dataset to download the tables from.
+            dataset (str): The dataset from the domain to download the tables from.
+            query (:class:`rapid.items.query.Query`, optional): The query to page through, ordered by a unique key column.
+            page_size (int, optional): The maximum number of rows in each page. Defaults to 50000.
+            version (int, optional): Version of the dataset to download.
+            schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset, used to set the column types. Defaults to None.
+            prefetch (bool, optional): Whether to download the next page on a background thread while the current page is processed. Defaults to False.
+
+        Raises:
+            :class:`rapid.exceptions.InvalidPaginationQueryException`: If the query has no order by column, or the key column is not selected.
+            :class:`rapid.exceptions.DatasetNotFoundException`: If the dataset to download does not exist.
+
+        Yields:
+            pyarrow.Table: A table for each page of the data.
+        """
+        return self._iter_pages(
+            query,
+            page_size,
+            prefetch,
+            lambda page_query: self.download_arrow(
+                domain, dataset, version, page_query, schema
+            ),
+            lambda page, column: page.column(column)[-1].as_py(),
+        )
+
+    def download_to_file(
+        self,
+        domain: str,
+        dataset: str,
+        path: str,
+        file_format: Union[FileFormat, str] = FileFormat.PARQUET,
+        query: Optional[Query] = None,
+        version: Optional[int] = None,
+        schema: Optional[Schema] = None,
+        chunk_rows: int = DOWNLOAD_PAGE_SIZE,
+        compression: Optional[str] = None,
+    ) -> int:
+        """
+        Downloads data straight to a Parquet or Feather file, without building a pandas DataFrame.
+        Requires the optional `pyarrow` dependency.
+
+        When the query has `order_by_columns` the data is downloaded in pages of `chunk_rows` rows, as
+        in :meth:`iter_arrow`, and each page is written as soon as it arrives while the next is fetched,
+        so memory use is bounded by the page size. Without an order by column the data is downloaded in
+        a single request and written in chunks of `chunk_rows` rows.
+
+        Example::
+
+            query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+            rapid.download_to_file("domain", "dataset", "dataset.parquet", query=query)
+
+        Args:
+            domain (str): The domain of the dataset to download.
+            dataset (str): The dataset from the domain to download.
+            path (str): The path of the file to write, replaced if it exists.
+            file_format (:class:`rapid.utils.constants.FileFormat`, optional): The file format to write. Defaults to Parquet.
+            query (:class:`rapid.items.query.Query`, optional): An optional query type to provide when downloading data. Defaults to empty.
+            version (int, optional): Version of the dataset to download.
+            schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset, used to set the column types. Defaults to None.
+            chunk_rows (int, optional): The number of rows downloaded and written at a time. Defaults to 50000.
+            compression (str, optional): The compression codec of the file, "uncompressed" for none. Defaults to
+                snappy for Parquet and lz4 for Feather files.
+
+        Raises:
+            :class:`rapid.exceptions.DatasetNotFoundException`: If the dataset to download does not exist.
+
+        Returns:
+            int: The number of rows written.
+        """
+        from rapid.utils.arrow import ArrowFileWriter
+
+        if query is not None and query.order_by_columns:
+            tables = self.iter_arrow(
+                domain, dataset, query, chunk_rows, version, schema, prefetch=True
+            )
+        else:
+            tables = [self.download_arrow(domain, dataset, version, query, schema)]
+        with ArrowFileWriter(path, file_format, compression) as writer:
+            for table in tables:
+                writer.write(table, row_group_size=chunk_rows)
+        return writer.rows
+
+    def _iter_pages(
+        self,
+        query: Optional[Query],
+        page_size: int,
+        prefetch: bool,
+        fetch: Callable,
+        last_key_of: Callable,
+    ) -> Iterator:
+        from rapid.items.query import Query
+
+        query = query if query else Query()
+        if not query.order_by_columns:
+            raise InvalidPaginationQueryException(
+                "Paginating a query requires an order by column that uniquely identifies each row"
+            )
+        order_by = query.order_by_columns[0]
+        if query.select_columns and order_by.column not in query.select_columns:
+            raise InvalidPaginationQueryException(
+                f"The order by column {order_by.column} must be selected to paginate the query"
+            )
+        return self._paginate(query, order_by, page_size, prefetch, fetch, last_key_of)
+
+    def _paginate(
+        self,
+        query: Query,
+        order_by: SQLQueryOrderBy,
+        page_size: int,
+        prefetch: bool,
+        fetch: Callable,
+        last_key_of: Callable,
+    ) -> Iterator:
+        remaining = int(query.limit) if query.limit else None
+
+        def fetch_page(last_key, remaining):
+            limit = page_size if remaining is None else min(page_size, remaining)
+            page_query = query.copy(
+                update={
+                    "filter": self._pagination_filter(query.filter, order_by, last_key),
+                    "limit": str(limit),
+                }
+            )
+            return fetch(page_query), limit
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page, limit = fetch_page(None, remaining)
+            while len(page):
+                if remaining is not None:
+                    remaining -= len(page)
+                has_next = len(page) == limit and remaining != 0
+                if has_next:
+                    last_key = last_key_of(page, order_by.column)
+                    if executor:
+                        next_page = executor.submit(fetch_page, last_key, remaining)
+                yield page
+                if not has_next:
+                    return
+                page, limit = (
+                    next_page.result() if executor else fetch_page(last_key, remaining)
+                )
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _pagination_filter(
+        _filter: Optional[str], order_by: SQLQueryOrderBy, last_key
+    ) -> Optional[str]:
+        from rapid.items.query import SortDirection
+
+        if last_key is None:
+            return _filter
+        if hasattr(last_key, "item"):
+            last_key = last_key.item()
+        if isinstance(last_key, (int, float)) and not isinstance(last_key, bool):
+            value = str(last_key)
+        else:
+            value = "'" + str(last_key).replace("'", "''") + "'"
+        operator = (
+            ">" if SortDirection(order_by.direction) == SortDirection.ASC else "<"
+        )
+        key_filter = f"{order_by.column} {operator} {value}"
+        return f"({_filter}) AND {key_filter}" if _filter else key_filter
+
     def upload_dataframe(
-        self, domain: str, dataset: str, df: DataFrame, wait_to_complete: bool = True
+        self,
+        domain: str,
+        dataset: str,
+        df: Union[DataFrame, UploadPayload],
+        wait_to_complete: bool = True,
+        chunk_rows: Optional[int] = None,
+        max_workers: int = UPLOAD_MAX_WORKERS,
+        update_behaviour: Optional[Union[UpdateBehaviour, str]] = None,
     ):
         """
         Uploads a pandas DataFrame to a specified dataset in the API.
 
+        Very large DataFrames can be split into chunks of `chunk_rows` rows, which are serialised and
+        uploaded concurrently. Every chunk creates its own upload job, so chunked uploads are only
+        possible for datasets with an APPEND update behaviour, which must be passed as `update_behaviour`
+        whenever `chunk_rows` is set.
+
         Args:
             domain (str): The domain of the dataset to upload the DataFrame to.
             dataset (str): The name of the dataset to upload the DataFrame to.
-            df (DataFrame): The pandas DataFrame to upload.
+            df (Union[DataFrame, :class:`rapid.utils.payload.UploadPayload`]): The pandas DataFrame to upload, or a payload of it.
             wait_to_complete (bool, optional): Whether to wait for the upload job to complete before returning. Defaults to True.
+            chunk_rows (int, optional): The maximum number of rows sent in a single upload. Defaults to None, uploading the whole DataFrame at once.
+            max_workers (int, optional): The number of chunks uploaded concurrently. Defaults to 4.
+            update_behaviour (:class:`rapid.items.schema.UpdateBehaviour`, optional): The update behaviour of the dataset, required when `chunk_rows` is set. Defaults to None.
 
         Raises:
-        :class:`rapid.exceptions.DataFrameUploadValidationException`: If the DataFrame's schema is incorrect.
+        :class:`rapid.exceptions.DataFrameUploadValidationException`: If the DataFrame's schema is incorrect, or `chunk_rows` is set without an APPEND update behaviour.
         :class:`rapid.exceptions.DataFrameUploadFailedException`: If an unexpected error occurs while uploading the DataFrame.
+        :class:`rapid.exceptions.DataFrameChunkUploadFailedException`: If any chunk fails to upload, after all other chunks have finished.
 
         Returns:
             If wait_to_complete is True, returns "Success" if the upload is successful.
-            If wait_to_complete is False, returns the ID of the upload job if the upload is accepted.
+            If wait_to_complete is False, returns the ID of the upload job if the upload is accepted, or a list of job IDs for a chunked upload.
         """
+        frame = df.df if isinstance(df, UploadPayload) else df
+        if chunk_rows is not None and update_behaviour is None:
+            raise DataFrameUploadValidationException(
+                "Could not upload dataframe in chunks, the update behaviour of the dataset must be given as APPEND"
+            )
+        if chunk_rows is not None and len(frame) > chunk_rows:
+            from rapid.items.schema import UpdateBehaviour
+
+            return self._upload_dataframe_chunks(
+                domain,
+                dataset,
+                frame,
+                wait_to_complete,
+                chunk_rows,
+                max_workers,
+                UpdateBehaviour(update_behaviour),
+            )
+
+        job_id = self._submit_upload(domain, dataset, df)
+        if wait_to_complete:
+            self.wait_for_job_outcome(job_id)
+            return "Success"
+        return job_id
+
+    def _submit_upload(
+        self, domain: str, dataset: str, df: Union[DataFrame, UploadPayload]
+    ) -> str:
         url = f"{self.auth.url}/datasets/{domain}/{dataset}"
-        response = requests.post(
-            url,
-            headers=self.generate_headers(),
-            files=self.convert_dataframe_for_file_upload(df),
-            timeout=TIMEOUT_PERIOD,
-        )
+        response = self._upload_file(url, self.convert_dataframe_for_file_upload(df))
         data = json.loads(response.content.decode("utf-8"))
 
         if response.status_code == 202:
-            if wait_to_complete:
-                self.wait_for_job_outcome(data["details"]["job_id"])
-                return "Success"
-            return data["details"]["job_id"]
+            job_id = data["details"]["job_id"]
+            if self.cache:
+                with self._pending_lock:
+                    self._pending_uploads[job_id] = (domain, dataset)
+                self.cache.invalidate(domain, dataset)
+            return job_id
         if response.status_code == 422:
             raise DataFrameUploadValidationException(
                 "Could not upload dataframe due to an incorrect schema definition"
@@ -186,14 +964,182 @@ class Rapid:
             data["details"],
         )
 
-    def generate_info(self, df: DataFrame, domain: str, dataset: str):
+    def _upload_dataframe_chunks(
+        self,
+        domain: str,
+        dataset: str,
+        df: DataFrame,
+        wait_to_complete: bool,
+        chunk_rows: int,
+        max_workers: int,
+        update_behaviour: UpdateBehaviour,
+    ):
+        from rapid.items.schema import UpdateBehaviour
+
+        if update_behaviour == UpdateBehaviour.OVERWRITE:
+            raise DataFrameUploadValidationException(
+                "Could not upload dataframe in chunks, each chunk would overwrite the last for a dataset with an OVERWRITE update behaviour"
+            )
+
+        chunks = [
+            df.iloc[start : start + chunk_rows]
+            for start in range(0, len(df), chunk_rows)
+        ]
+        job_ids = {}
+        failures = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._submit_upload, domain, dataset, chunk): index
+                for index, chunk in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    job_ids[index] = future.result()
+                except Exception as exception:  # pylint: disable=broad-except
+                    failures[index] = exception
+
+        if wait_to_complete and job_ids:
+            outcomes = self.wait_for_jobs(list(job_ids.values()))
+            for index, job_id in job_ids.items():
+                if outcomes[job_id]["status"] == "FAILED":
+                    failures[index] = JobFailedException(
+                        "Upload failed", outcomes[job_id]
+                    )
+
+        if failures:
+            raise DataFrameChunkUploadFailedException(
+                f"{len(failures)} of {len(chunks)} chunks failed to upload",
+                {
+                    "failures": dict(sorted(failures.items())),
+                    "job_ids": [job_ids[index] for index in sorted(job_ids)],
+                },
+            )
+        if wait_to_complete:
+            return "Success"
+        return [job_ids[index] for index in sorted(job_ids)]
+
+    def upload_many(
+        self,
+        uploads: List[Tuple[str, str, Union[DataFrame, UploadPayload]]],
+        max_workers: int = UPLOAD_MAX_WORKERS,
+        max_inflight_bytes: int = UPLOAD_INFLIGHT_BYTES,
+        wait_to_complete: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[Dict]:
+        """
+        Uploads many pandas DataFrames, to any datasets, from a shared pool of workers that serialise
+        and upload them in parallel. The upload jobs are then waited on together.
+
+        The serialised DataFrames held in memory at once are bounded by `max_inflight_bytes`. Each upload
+        waits for an estimate of its size, taken from the DataFrame's memory usage, to fit within the budget
+        before it is serialised, and frees its share once it has been sent.
+
+        Failures do not stop the other uploads, every upload is reported on instead.
+
+        Args:
+            uploads (List[Tuple[str, str, DataFrame]]): The domain, dataset and DataFrame, or payload, of each upload.
+            max_workers (int, optional): The number of uploads serialised and sent concurrently. Defaults to 4.
+            max_inflight_bytes (int, optional): The approximate number of serialised bytes held in memory at once. Defaults to 256MB.
+            wait_to_complete (bool, optional): Whether to wait for the upload jobs to complete before returning. Defaults to True.
+            timeout (float, optional): The overall number of seconds to wait for the jobs. Defaults to None, waiting indefinitely.
+
+        Returns:
+            List[Dict]: A report for each upload, in the order given, with its "domain", "dataset", serialised "bytes",
+            "job_id", "status", "error" and final job "progress". The status is "SUCCESS" or "FAILED" once the job has
+            settled, "SUBMITTED" if not waiting, "TIMEOUT" if the job was still running after the timeout, or "ERROR" if
+            the upload itself failed, with the exception as the error.
+        """
+        budget = ByteBudget(max_inflight_bytes)
+        report = [
+            {
+                "domain": domain,
+                "dataset": dataset,
+                "bytes": None,
+                "job_id": None,
+                "status": None,
+                "error": None,
+                "progress": None,
+            }
+            for domain, dataset, _ in uploads
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._upload_within_budget, *upload, budget): index
+                for index, upload in enumerate(uploads)
+            }
+            for future in as_completed(futures):
+                result = report[futures[future]]
+                try:
+                    result["job_id"], result["bytes"] = future.result()
+                    result["status"] = "SUBMITTED"
+                except Exception as exception:  # pylint: disable=broad-except
+                    result["status"], result["error"] = "ERROR", exception
+
+        submitted = {
+            result["job_id"]: result
+            for result in report
+            if result["status"] == "SUBMITTED"
+        }
+        if not wait_to_complete or not submitted:
+            return report
+        try:
+            for job_id, progress in self.iter_job_outcomes(list(submitted), timeout):
+                submitted[job_id]["status"] = progress["status"]
+                submitted[job_id]["progress"] = progress
+        except JobTimeoutException as exception:
+            for job_id in exception.data:
+                submitted[job_id]["status"] = "TIMEOUT"
+                submitted[job_id]["error"] = exception
+        except Exception as exception:  # pylint: disable=broad-except
+            for result in submitted.values():
+                if result["status"] == "SUBMITTED":
+                    result["status"], result["error"] = "ERROR", exception
+        return report
+
+    def _upload_within_budget(
+        self,
+        domain: str,
+        dataset: str,
+        df: Union[DataFrame, UploadPayload],
+        budget: ByteBudget,
+    ) -> Tuple[str, int]:
+        if isinstance(df, UploadPayload):
+            held = df.size
+        else:
+            held = int(df.memory_usage(index=False, deep=True).sum())
+        budget.acquire(held)
+        try:
+            if isinstance(df, UploadPayload):
+                return self._submit_upload(domain, dataset, df), held
+            with self.prepare_payload(df) as payload:
+                size = payload.size
+                budget.adjust(size - held)
+                held = size
+                return self._submit_upload(domain, dataset, payload), size
+        finally:
+            budget.release(held)
+
+    def generate_info(
+        self,
+        df: Union[DataFrame, UploadPayload],
+        domain: str,
+        dataset: str,
+        sample: Union[bool, int] = False,
+        sample_max_bytes: Optional[int] = None,
+    ):
         """
         Generates metadata information for a pandas DataFrame and a specified dataset in the API.
 
+        With `sample` set only a representative sample of the DataFrame is sent, chosen by
+        :func:`rapid.utils.sampling.sample_dataframe`. Any row counts in the information then describe the sample.
+
         Args:
-            df (DataFrame): The pandas DataFrame to generate metadata for.
+            df (Union[DataFrame, :class:`rapid.utils.payload.UploadPayload`]): The pandas DataFrame to generate metadata for, or a payload of it.
             domain (str): The domain of the dataset to generate metadata for.
             dataset (str): The name of the dataset to generate metadata for.
+            sample (Union[bool, int], optional): Whether to send a sample of the DataFrame, or the maximum number of rows to sample. Defaults to False.
+            sample_max_bytes (int, optional): The approximate maximum size of the sample. Defaults to None.
 
         Raises:
             :class:`rapid.exceptions.DatasetInfoFailedException`: If an error occurs while generating the metadata information.
@@ -202,12 +1148,8 @@ class Rapid:
             A dictionary containing the metadata information for the DataFrame and dataset.
         """
         url = f"{self.auth.url}/datasets/{domain}/{dataset}/info"
-        response = requests.post(
-            url,
-            headers=self.generate_headers(),
-            files=self.convert_dataframe_for_file_upload(df),
-            timeout=TIMEOUT_PERIOD,
-        )
+        df = self._sample(df, sample, sample_max_bytes)
+        response = self._upload_file(url, self.convert_dataframe_for_file_upload(df))
         data = json.loads(response.content.decode("utf-8"))
         if response.status_code == 200:
             return data
@@ -216,35 +1158,106 @@ class Rapid:
             "Failed to gather the dataset info", data["details"]
         )
 
-    def convert_dataframe_for_file_upload(self, df: DataFrame):
+    @staticmethod
+    def _sample(
+        df: Union[DataFrame, UploadPayload],
+        sample: Union[bool, int],
+        sample_max_bytes: Optional[int],
+    ) -> Union[DataFrame, UploadPayload]:
+        if not sample and sample_max_bytes is None:
+            return df
+        from rapid.utils.sampling import sample_dataframe
+
+        if isinstance(df, UploadPayload):
+            df = df.df
+        max_rows = SAMPLE_ROWS if sample is True or not sample else sample
+        return sample_dataframe(df, max_rows, sample_max_bytes)
+
+    def convert_dataframe_for_file_upload(self, df: Union[DataFrame, UploadPayload]):
         """
-        Converts a pandas DataFrame to a format that can be used for file uploads to the API.
+        Converts a pandas DataFrame to a format that can be used for file uploads to the API. The
+        file is written in the client's `upload_format`. Files larger than the client's `upload_memory_limit`
+        are spooled to a temporary file, returned open, which is closed once uploaded. A payload is
+        returned as it was serialised.
 
         Args:
-            df (DataFrame): The pandas DataFrame to convert.
+            df (Union[DataFrame, :class:`rapid.utils.payload.UploadPayload`]): The pandas DataFrame to convert, or a payload of it.
 
         Returns:
             A dictionary containing the converted DataFrame in a format suitable for file uploads to the API.
         """
-        return {
-            "file": (
-                f"rapid-sdk-{int(datetime.now().timestamp())}.csv",
-                df.to_csv(index=False),
+        from rapid.utils.serialise import spool_dataframe
+
+        if isinstance(df, UploadPayload):
+            return df.files()
+        if not self.hooks:
+            return {
+                "file": spool_dataframe(
+                    df,
+                    self.upload_format,
+                    self.parquet_compression,
+                    self.upload_memory_limit,
+                )
+            }
+        start = time.perf_counter()
+        filename, content = spool_dataframe(
+            df, self.upload_format, self.parquet_compression, self.upload_memory_limit
+        )
+        self.hooks.emit(
+            Event(
+                EventPhase.SERIALISE,
+                time.perf_counter() - start,
+                request_bytes=(
+                    len(content)
+                    if isinstance(content, (str, bytes))
+                    else os.fstat(content.fileno()).st_size
+                ),
             )
-        }
+        )
+        return {"file": (filename, content)}
+
+    def prepare_payload(self, df: DataFrame) -> UploadPayload:
+        """
+        Serialises a pandas DataFrame once, in the client's `upload_format`, into a payload that
+        :meth:`upload_dataframe`, :meth:`generate_info` and :meth:`generate_schema` accept in place of the
+        DataFrame. Uploading the same DataFrame to several endpoints then only serialises it once.
+        The payload should be closed once it is no longer needed.
+
+        Args:
+            df (DataFrame): The pandas DataFrame to serialise.
+
+        Returns:
+            :class:`rapid.utils.payload.UploadPayload`: The serialised DataFrame.
+        """
+        filename, content = self.convert_dataframe_for_file_upload(df)["file"]
+        return UploadPayload(df, filename, content)
 
     def generate_schema(
-        self, df: DataFrame, domain: str, dataset: str, sensitivity: str
+        self,
+        df: Union[DataFrame, UploadPayload],
+        domain: str,
+        dataset: str,
+        sensitivity: str,
+        local: bool = False,
+        sample: Union[bool, int] = False,
+        sample_max_bytes: Optional[int] = None,
     ) -> Schema:
-
         """
         Generates a schema for a pandas DataFrame and a specified dataset in the API.
 
+        With `local` set the schema is inferred on the client by :func:`rapid.utils.inference.infer_schema`
+        without uploading the DataFrame. :func:`rapid.utils.inference.check_inference_parity` can be used to
+        check the local schema against the API on a sample of the data. With `sample` set only a representative
+        sample of the DataFrame is sent to the API, chosen by :func:`rapid.utils.sampling.sample_dataframe`.
+
         Args:
-            df (DataFrame): The pandas DataFrame to generate a schema for.
+            df (Union[DataFrame, :class:`rapid.utils.payload.UploadPayload`]): The pandas DataFrame to generate a schema for, or a payload of it.
             domain (str): The domain of the dataset to generate a schema for.
             dataset (str): The name of the dataset to generate a schema for.
             sensitivity (str): The sensitivity level of the schema to generate.
+            local (bool, optional): Whether to infer the schema locally instead of calling the API. Defaults to False.
+            sample (Union[bool, int], optional): Whether to send a sample of the DataFrame, or the maximum number of rows to sample. Defaults to False.
+            sample_max_bytes (int, optional): The approximate maximum size of the sample. Defaults to None.
 
         Raises:
             :class:`rapid.exceptions.SchemaGenerationFailedException`: If an error occurs while generating the schema.
@@ -252,14 +1265,17 @@ class Rapid:
         Returns:
             :class:`rapid.items.schema.Schema`: A Schema class type from the generated schema for the DataFrame and dataset.
         """
-        url = f"{self.auth.url}/schema/{sensitivity}/{domain}/{dataset}/generate"
+        from rapid.items.schema import Schema
 
-        response = requests.post(
-            url,
-            headers=self.generate_headers(),
-            files=self.convert_dataframe_for_file_upload(df),
-            timeout=TIMEOUT_PERIOD,
-        )
+        if local:
+            from rapid.utils.inference import infer_schema
+
+            if isinstance(df, UploadPayload):
+                df = df.df
+            return infer_schema(df, domain, dataset, sensitivity)
+        url = f"{self.auth.url}/schema/{sensitivity}/{domain}/{dataset}/generate"
+        df = self._sample(df, sample, sample_max_bytes)
+        response = self._upload_file(url, self.convert_dataframe_for_file_upload(df))
         data = json.loads(response.content.decode("utf-8"))
         if response.status_code == 200:
             return Schema(**data)
@@ -278,14 +1294,14 @@ class Rapid:
         """
         schema_dict = schema.dict()
         url = f"{self.auth.url}/schema"
-        response = requests.post(
+        response = self._request(
+            "POST",
             url,
-            headers=self.generate_headers(),
             data=json.dumps(schema_dict),
-            timeout=TIMEOUT_PERIOD,
+            idempotent=False,
         )
         if response.status_code == 200:
-            pass
+            self._schema_changes += 1
         elif response.status_code == 409:
             raise SchemaAlreadyExistsException("The schema already exists")
         else:
@@ -304,13 +1320,13 @@ class Rapid:
         """
         schema_dict = schema.dict()
         url = f"{self.auth.url}/schema"
-        response = requests.put(
+        response = self._request(
+            "PUT",
             url,
-            headers=self.generate_headers(),
             data=json.dumps(schema_dict),
-            timeout=TIMEOUT_PERIOD,
         )
         data = json.loads(response.content.decode("utf-8"))
         if response.status_code == 200:
+            self._schema_changes += 1
             return data
         raise SchemaUpdateFailedException("Could not update schema", data)
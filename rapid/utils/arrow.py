@@ -0,0 +1,221 @@
+import os
+from typing import Dict, Optional, Union
+
+from rapid.items.schema import Schema
+from rapid.utils.constants import FileFormat
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+def table_from_index_json(data: Dict[str, Dict], schema: Optional[Schema] = None):
+    """
+    Builds a pyarrow Table directly from an index oriented JSON payload of the form
+    `{index: {column: value}}`, as returned by the rAPId query endpoint, without a pandas DataFrame.
+    Requires the optional `pyarrow` dependency.
+
+    Args:
+        data (Dict[str, Dict]): The parsed index oriented payload.
+        schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset. When
+            passed, the column types are taken from the schema instead of being inferred. Defaults to None.
+
+    Returns:
+        pyarrow.Table: A table of the data.
+    """
+    if pa is None:
+        raise ImportError("Arrow downloads require the pyarrow package")
+    if not data:
+        return pa.table({})
+    table = pa.Table.from_pylist(list(data.values()))
+    if schema is not None:
+        table = apply_schema_types(table, schema)
+    return table
+
+
+def apply_schema_types(table, schema: Schema):
+    """
+    Casts the columns of a pyarrow Table to the Arrow types matching their rAPId data types, like
+    :func:`rapid.utils.decode.apply_schema_dtypes` does for DataFrames.
+
+    Args:
+        table (pyarrow.Table): The table to cast.
+        schema (:class:`rapid.items.schema.Schema`): The schema of the dataset.
+
+    Returns:
+        pyarrow.Table: The table with the schema types applied.
+    """
+    for column in schema.columns:
+        if column.name not in table.column_names:
+            continue
+        data_type = column.data_type.lower()
+        values = table.column(column.name)
+        if data_type.startswith("int"):
+            values = values.cast(pa.int64())
+        elif data_type.startswith("float") or data_type == "double":
+            values = values.cast(pa.float64())
+        elif data_type.startswith("bool"):
+            values = values.cast(pa.bool_())
+        elif data_type in ("date", "datetime", "timestamp"):
+            if column.format and pa.types.is_string(values.type):
+                values = pc.strptime(values, format=column.format, unit="ns")
+            else:
+                values = values.cast(pa.timestamp("ns"))
+        else:
+            continue
+        index = table.column_names.index(column.name)
+        table = table.set_column(index, column.name, values)
+    return table
+
+
+class ArrowFileWriter:
+    def __init__(
+        self,
+        path: str,
+        file_format: Union[FileFormat, str] = FileFormat.PARQUET,
+        compression: Optional[str] = None,
+    ) -> None:
+        """
+        Writes pyarrow Tables one after another to a single Parquet or Feather file, so that a download
+        can be written while later pages are still being fetched. Requires the optional `pyarrow` dependency.
+
+        The file takes the schema of the first table and later tables are cast to it. Pages of a download
+        can infer different types for a column, such as nulls before strings or integers before floats, so
+        when a later table needs a wider type the schema is widened and the rows already written are
+        rewritten with it, one row group at a time. Columns whose types cannot be unified are written as strings,
+        and columns first seen in a later table are added, with nulls for the rows before it.
+
+        Example::
+
+            with ArrowFileWriter("data.parquet") as writer:
+                for table in rapid.iter_arrow("domain", "dataset", query):
+                    writer.write(table)
+
+        Args:
+            path (str): The path of the file to write.
+            file_format (:class:`rapid.utils.constants.FileFormat`, optional): The file format to write. Defaults to Parquet.
+            compression (str, optional): The compression codec, "uncompressed" for none. Defaults to None, using
+                snappy for Parquet and lz4 for Feather files.
+        """
+        if pa is None:
+            raise ImportError("Arrow downloads require the pyarrow package")
+        self.path = os.path.expanduser(path)
+        self.file_format = FileFormat(file_format)
+        self.compression = compression
+        self.schema = None
+        self.rows = 0
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        self.close()
+        if exc_type is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def write(self, table, row_group_size: Optional[int] = None) -> None:
+        """
+        Appends a table to the file.
+
+        Args:
+            table (pyarrow.Table): The table to write.
+            row_group_size (int, optional): The maximum number of rows in each Parquet row group or Feather
+                record batch. Defaults to None, writing the table as one.
+        """
+        if self._writer is None:
+            self._open(table.schema)
+        elif table.schema != self.schema:
+            schema = self._unify(table.schema)
+            if schema != self.schema:
+                self._widen(schema)
+            table = _conform(table, self.schema)
+        self._write(table, row_group_size)
+        self.rows += table.num_rows
+
+    def close(self) -> None:
+        """
+        Closes the file, writing an empty file if no tables were written.
+        """
+        if self._writer is None:
+            self._open(pa.schema([]))
+        self._writer.close()
+
+    def _write(self, table, row_group_size: Optional[int] = None) -> None:
+        if self.file_format == FileFormat.PARQUET:
+            self._writer.write_table(table, row_group_size=row_group_size)
+        else:
+            # pylint cannot see the keyword arguments of the compiled pyarrow writer
+            self._writer.write_table(  # pylint: disable=unexpected-keyword-arg
+                table, max_chunksize=row_group_size
+            )
+
+    def _unify(self, schema):
+        fields = []
+        for field in self.schema:
+            if field.name not in schema.names:
+                fields.append(field)
+                continue
+            other = schema.field(field.name)
+            try:
+                fields.append(
+                    pa.unify_schemas(
+                        [pa.schema([field]), pa.schema([other])],
+                        promote_options="permissive",
+                    ).field(0)
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                fields.append(field.with_type(pa.string()))
+        extra = [field for field in schema if field.name not in self.schema.names]
+        return pa.schema(fields + extra, metadata=self.schema.metadata)
+
+    def _widen(self, schema) -> None:
+        # The rows already written are copied to a file with the wider schema, one row group or
+        # record batch at a time so that memory stays bounded
+        self._writer.close()
+        previous = f"{self.path}.previous"
+        os.replace(self.path, previous)
+        try:
+            self._open(schema)
+            if self.file_format == FileFormat.PARQUET:
+                file = pq.ParquetFile(previous)
+                for index in range(file.num_row_groups):
+                    self._write(_conform(file.read_row_group(index), schema))
+            else:
+                with pa.memory_map(previous) as source:
+                    reader = pa.ipc.open_file(source)
+                    for index in range(reader.num_record_batches):
+                        batch = reader.get_batch(index)
+                        self._write(_conform(pa.Table.from_batches([batch]), schema))
+        finally:
+            os.remove(previous)
+
+    def _open(self, schema) -> None:
+        self.schema = schema
+        if self.file_format == FileFormat.PARQUET:
+            compression = self.compression if self.compression else "snappy"
+            self._writer = pq.ParquetWriter(
+                self.path,
+                schema,
+                compression="none" if compression == "uncompressed" else compression,
+            )
+        else:
+            compression = self.compression if self.compression else "lz4"
+            self._writer = pa.ipc.new_file(
+                self.path,
+                schema,
+                options=pa.ipc.IpcWriteOptions(
+                    compression=None if compression == "uncompressed" else compression
+                ),
+            )
+
+
+def _conform(table, schema):
+    # Columns a table does not have, such as those first seen in a later page, are filled with nulls
+    for name in schema.names:
+        if name not in table.column_names:
+            table = table.append_column(name, pa.nulls(table.num_rows))
+    return table.select(schema.names).cast(schema)
@@ -0,0 +1,32 @@
+import random
+
+
+class Backoff:
+    def __init__(
+        self,
+        initial: float = 1,
+        factor: float = 2,
+        maximum: float = 30,
+        jitter: float = 0.1,
+    ) -> None:
+        """
+        An exponential backoff with jitter, used to space out repeated requests to the API.
+
+        Args:
+            initial (float, optional): The delay in seconds before the first repeat. Defaults to 1.
+            factor (float, optional): The factor the delay grows by after each attempt. Defaults to 2.
+            maximum (float, optional): The maximum delay in seconds. Defaults to 30.
+            jitter (float, optional): The fraction of the delay that is randomised, so that many clients
+                do not make their requests in lockstep. Defaults to 0.1.
+        """
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the number of seconds to wait before the given attempt, counting from zero.
+        """
+        delay = min(self.maximum, self.initial * self.factor**attempt)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))  # nosec
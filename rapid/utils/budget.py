@@ -0,0 +1,40 @@
+import threading
+
+
+class ByteBudget:
+    def __init__(self, limit: int) -> None:
+        """
+        A budget of bytes shared between threads, used to bound how much serialised data is held
+        in memory at once. A request larger than the whole budget is let through once nothing else
+        is held, so that it cannot wait forever.
+
+        Args:
+            limit (int): The number of bytes that can be held at once.
+        """
+        self.limit = limit
+        self.held = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int) -> None:
+        """
+        Waits until `size` bytes fit within the budget and holds them.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.held == 0 or self.held + size <= self.limit
+            )
+            self.held += size
+
+    def adjust(self, delta: int) -> None:
+        """
+        Changes the number of bytes held without waiting, once an estimate is replaced by a known size.
+        """
+        with self._condition:
+            self.held += delta
+            self._condition.notify_all()
+
+    def release(self, size: int) -> None:
+        """
+        Returns `size` bytes to the budget.
+        """
+        self.adjust(-size)
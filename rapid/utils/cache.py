@@ -0,0 +1,171 @@
+from hashlib import sha256
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from pandas import DataFrame
+
+from rapid.items.query import Query
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:  # pragma: no cover
+    pa = None
+
+INDEX_FILE = "index.json"
+
+
+class DownloadCache:
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 1024**3,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        A local on-disk cache of downloaded DataFrames, used by :class:`rapid.rapid.Rapid` when passed as its
+        `cache`. Results are keyed by the query url, dataset version and query, and stored as uncompressed Arrow
+        files that are memory mapped when read back. Requires the optional `pyarrow` dependency.
+
+        Once the cache grows beyond `max_bytes` the least recently used results are removed. Results for a
+        dataset are removed whenever the client uploads to it, and again when the upload job is seen to finish.
+
+        Example::
+
+            rapid = Rapid(cache=DownloadCache("~/.rapid/cache", ttl=3600))
+
+        Args:
+            directory (str): The directory to store cached results in, created if it does not exist.
+            max_bytes (int, optional): The maximum total size of the cached files. Defaults to 1GB.
+            ttl (float, optional): The number of seconds a result stays valid for. Defaults to None, never expiring.
+        """
+        if pa is None:
+            raise ImportError("The download cache requires the pyarrow package")
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._index = self._read_index()
+
+    @staticmethod
+    def key(url: str, version: Optional[int], query: Query) -> str:
+        """
+        Returns the cache key for a download, a hash of its url, version and canonical query.
+        """
+        canonical = json.dumps(
+            {
+                "url": url,
+                "version": version,
+                "query": json.loads(query.json(exclude_none=True)),
+            },
+            sort_keys=True,
+        )
+        return sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[DataFrame]:
+        """
+        Returns the cached DataFrame for a key, or None if it is missing or has expired.
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.time() - entry["created"] > self.ttl:
+                self._remove(key)
+                self._write_index()
+                return None
+            try:
+                table = feather.read_table(self._path(key), memory_map=True)
+            except (OSError, pa.ArrowInvalid):
+                self._remove(key)
+                self._write_index()
+                return None
+            entry["accessed"] = time.time()
+            self._write_index()
+        return table.to_pandas()
+
+    def put(self, key: str, domain: str, dataset: str, df: DataFrame):
+        """
+        Stores a downloaded DataFrame under a key, evicting the least recently used results if the
+        cache is over its size budget. DataFrames that cannot be converted to Arrow are not cached.
+        """
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return
+        with self._lock:
+            temporary_path = f"{self._path(key)}.tmp"
+            feather.write_feather(table, temporary_path, compression="uncompressed")
+            os.replace(temporary_path, self._path(key))
+            now = time.time()
+            self._index[key] = {
+                "domain": domain,
+                "dataset": dataset,
+                "size": os.path.getsize(self._path(key)),
+                "created": now,
+                "accessed": now,
+            }
+            self._evict()
+            self._write_index()
+
+    def invalidate(self, domain: str, dataset: Optional[str] = None):
+        """
+        Removes the cached results for a dataset, or for every dataset in a domain if no dataset is given.
+        """
+        with self._lock:
+            for key, entry in list(self._index.items()):
+                if entry["domain"] == domain and dataset in (None, entry["dataset"]):
+                    self._remove(key)
+            self._write_index()
+
+    def clear(self):
+        """
+        Removes every cached result.
+        """
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._write_index()
+
+    @property
+    def size(self) -> int:
+        return sum(entry["size"] for entry in self._index.values())
+
+    def _evict(self):
+        total = self.size
+        for key, entry in sorted(
+            self._index.items(), key=lambda item: item[1]["accessed"]
+        ):
+            if total <= self.max_bytes:
+                break
+            total -= entry["size"]
+            self._remove(key)
+
+    def _remove(self, key: str):
+        self._index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.arrow")
+
+    def _read_index(self) -> dict:
+        try:
+            with open(
+                os.path.join(self.directory, INDEX_FILE), encoding="utf-8"
+            ) as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_index(self):
+        path = os.path.join(self.directory, INDEX_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(self._index, file)
+        os.replace(f"{path}.tmp", path)
@@ -0,0 +1,73 @@
+import gzip
+import os
+import shutil
+from tempfile import SpooledTemporaryFile
+from typing import IO, Optional, Union
+
+from rapid.utils.constants import UPLOAD_MEMORY_LIMIT, Compression
+
+
+def compress(
+    data: bytes, compression: Union[Compression, str], level: Optional[int] = None
+) -> bytes:
+    """
+    Compresses a request body with the given codec.
+
+    Args:
+        data (bytes): The data to compress.
+        compression (:class:`rapid.utils.constants.Compression`): The codec to compress with, zstd requires the optional `zstandard` dependency.
+        level (int, optional): The compression level. Defaults to None, using the codec's default level.
+
+    Returns:
+        bytes: The compressed data.
+    """
+    if Compression(compression) == Compression.ZSTD:
+        return _zstd_compressor(level).compress(data)
+    return gzip.compress(data, compresslevel=level if level is not None else 6)
+
+
+def compress_file(
+    source: IO[bytes],
+    compression: Union[Compression, str],
+    level: Optional[int] = None,
+    memory_limit: int = UPLOAD_MEMORY_LIMIT,
+) -> IO[bytes]:
+    """
+    Compresses a request body read from a file, without holding it in memory. The compressed
+    data is written to a temporary file that moves to disk once it grows beyond `memory_limit` bytes.
+
+    Args:
+        source (IO[bytes]): The binary file to compress, read from its current position.
+        compression (:class:`rapid.utils.constants.Compression`): The codec to compress with, zstd requires the optional `zstandard` dependency.
+        level (int, optional): The compression level. Defaults to None, using the codec's default level.
+        memory_limit (int, optional): The number of bytes kept in memory before spooling to disk. Defaults to 16MB.
+
+    Returns:
+        IO[bytes]: The compressed data, positioned at the start. The caller should close it once used.
+    """
+    # The file is returned open for the caller to upload
+    file = SpooledTemporaryFile(  # pylint: disable=consider-using-with
+        max_size=memory_limit
+    )
+    if Compression(compression) == Compression.ZSTD:
+        # Recording the size in the frame lets the API decompress it in one call
+        position = source.tell()
+        size = source.seek(0, os.SEEK_END) - position
+        source.seek(position)
+        writer = _zstd_compressor(level).stream_writer(file, size=size, closefd=False)
+    else:
+        writer = gzip.GzipFile(
+            fileobj=file, mode="wb", compresslevel=level if level is not None else 6
+        )
+    with writer:
+        shutil.copyfileobj(source, writer)
+    file.seek(0)
+    return file
+
+
+def _zstd_compressor(level: Optional[int]):
+    try:
+        import zstandard
+    except ImportError as error:  # pragma: no cover
+        raise ImportError("zstd compression requires the zstandard package") from error
+    return zstandard.ZstdCompressor(level=level if level is not None else 3)
@@ -1 +1,44 @@
+from enum import Enum
+
 TIMEOUT_PERIOD = 30
+TOKEN_EXPIRY_MARGIN = 60
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+UPLOAD_MAX_WORKERS = 4
+UPLOAD_MEMORY_LIMIT = 16 * 1024 * 1024
+UPLOAD_BLOCK_ROWS = 50000
+UPLOAD_INFLIGHT_BYTES = 256 * 1024 * 1024
+MANIFEST_COMPACT_SEGMENTS = 16
+DOWNLOAD_PAGE_SIZE = 50000
+SAMPLE_ROWS = 10000
+SAMPLE_CATEGORY_THRESHOLD = 50
+COMPACT_CATEGORY_RATIO = 0.5
+RETRY_MAX_ATTEMPTS = 4
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+RETRY_UNSENT_STATUS_CODES = (429, 503)
+RETRY_METHODS = ("GET", "POST", "PUT")
+RETRY_BUDGET = 60
+
+
+class UploadFormat(Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+class Compression(Enum):
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+class EventPhase(Enum):
+    TOKEN = "token"
+    SERIALISE = "serialise"
+    REQUEST = "request"
+    DECODE = "decode"
+    JOB = "job"
+    RETRY = "retry"
+
+
+class FileFormat(Enum):
+    PARQUET = "parquet"
+    FEATHER = "feather"
@@ -0,0 +1,262 @@
+import json
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+from pandas.api import types
+
+from rapid.items.schema import Schema
+from rapid.utils.constants import COMPACT_CATEGORY_RATIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads(content: Union[bytes, str]):
+    """
+    Parses a JSON response body, using orjson when it is installed and the standard library
+    otherwise.
+
+    Args:
+        content (Union[bytes, str]): The raw JSON content.
+
+    Returns:
+        The parsed JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    return json.loads(content)
+
+
+def dataframe_from_index_json(
+    data: Dict[str, Dict], schema: Optional[Schema] = None, raw: bool = False
+) -> DataFrame:
+    """
+    Builds a pandas DataFrame directly from an index oriented JSON payload of the form
+    `{index: {column: value}}`, as returned by the rAPId query endpoint.
+
+    The column dtypes are set by :func:`set_dtypes`, from the schema when one is passed and otherwise
+    inferred as `pd.read_json` infers them.
+
+    Args:
+        data (Dict[str, Dict]): The parsed index oriented payload.
+        schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset. When
+            passed, the column dtypes are taken from the schema instead of being inferred. Defaults to None.
+        raw (bool, optional): Whether to leave the values as they were decoded, so that :func:`set_dtypes`
+            can be applied later. Defaults to False.
+
+    Returns:
+        DataFrame: A pandas DataFrame of the data.
+    """
+    if not data:
+        return DataFrame()
+    index = list(data.keys())
+    df = DataFrame.from_records(list(data.values()), index=index)
+    try:
+        df.index = pd.Index(index).astype("int64")
+    except ValueError:
+        pass
+    return df if raw else set_dtypes(df, schema)
+
+
+def set_dtypes(df: DataFrame, schema: Optional[Schema] = None) -> DataFrame:
+    """
+    Sets the dtypes of a DataFrame decoded from a query response. Columns in the schema are cast to
+    their rAPId data types by :func:`apply_schema_dtypes` and are never inferred, so a string column of
+    numeric looking values stays a string column. Other columns are inferred as `pd.read_json` infers
+    them: numeric strings become numbers and date-like columns, such as `date` or names ending in `_at`,
+    become datetimes.
+
+    Args:
+        df (DataFrame): The pandas DataFrame, with its values as decoded.
+        schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset. Defaults to None.
+
+    Returns:
+        DataFrame: The pandas DataFrame with its dtypes set.
+    """
+    df = infer_dtypes(df, schema)
+    return apply_schema_dtypes(df, schema) if schema else df
+
+
+def infer_dtypes(df: DataFrame, schema: Optional[Schema] = None) -> DataFrame:
+    """
+    Infers the dtypes of the columns of a DataFrame decoded from a query response as `pd.read_json`
+    infers them. Columns in the schema are left with their values as decoded, ready to be cast by
+    :func:`apply_schema_dtypes` or :func:`compact_dtypes`.
+
+    Args:
+        df (DataFrame): The pandas DataFrame, with its values as decoded.
+        schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset. Defaults to None.
+
+    Returns:
+        DataFrame: The pandas DataFrame with the dtypes of the columns missing from the schema inferred.
+    """
+    typed = {column.name for column in schema.columns} if schema else set()
+    for name in df.columns:
+        if name not in typed:
+            df[name] = _infer_dtype(name, df[name])
+    return df
+
+
+def _is_date_column(name) -> bool:
+    if not isinstance(name, str):
+        return False
+    name = name.lower()
+    return (
+        name.endswith(("_at", "_time"))
+        or name in ("modified", "date", "datetime")
+        or name.startswith("timestamp")
+    )
+
+
+def _infer_dtype(name, values: Series) -> Series:
+    # Mirrors the dtype inference of pd.read_json, which the query responses were read with before
+    if values.empty:
+        return values
+    if _is_date_column(name):
+        dates = _to_datetime(values)
+        if dates is not None:
+            return dates
+    if types.is_object_dtype(values):
+        try:
+            values = values.astype("float64")
+        except (TypeError, ValueError):
+            return values
+    if types.is_float_dtype(values):
+        try:
+            integers = values.astype("int64")
+        except (TypeError, ValueError, OverflowError):
+            return values
+        if (integers == values).all():
+            return integers
+    return values
+
+
+def _to_datetime(values: Series) -> Optional[Series]:
+    numbers = values
+    if types.is_object_dtype(values):
+        try:
+            numbers = values.astype("int64")
+        except OverflowError:
+            return None
+        except (TypeError, ValueError):
+            pass
+    if types.is_numeric_dtype(numbers) and not types.is_bool_dtype(numbers):
+        # Numbers are only epoch timestamps when they are after the first year of the epoch
+        if not (numbers.isna() | (numbers > 31536000)).all():
+            return None
+    for unit in ("s", "ms", "us", "ns"):
+        try:
+            return pd.to_datetime(numbers, errors="raise", unit=unit)
+        except (ValueError, OverflowError, TypeError):
+            continue
+    return None
+
+
+def apply_schema_dtypes(df: DataFrame, schema: Schema) -> DataFrame:
+    """
+    Casts the columns of a DataFrame to the pandas dtypes matching their rAPId data types.
+    Columns missing from the schema, or with a data type that has no pandas equivalent, are left as they are.
+
+    Args:
+        df (DataFrame): The pandas DataFrame to cast.
+        schema (:class:`rapid.items.schema.Schema`): The schema of the dataset.
+
+    Returns:
+        DataFrame: The pandas DataFrame with the schema dtypes applied.
+    """
+    for column in schema.columns:
+        if column.name not in df.columns:
+            continue
+        data_type = column.data_type.lower()
+        if data_type.startswith("int"):
+            df[column.name] = df[column.name].astype("Int64")
+        elif data_type.startswith("float") or data_type == "double":
+            df[column.name] = df[column.name].astype("Float64")
+        elif data_type.startswith("bool"):
+            df[column.name] = df[column.name].astype("boolean")
+        elif data_type in ("date", "datetime", "timestamp"):
+            df[column.name] = pd.to_datetime(df[column.name], format=column.format)
+    return df
+
+
+def compact_dtypes(
+    df: DataFrame,
+    schema: Optional[Schema] = None,
+    category_ratio: float = COMPACT_CATEGORY_RATIO,
+) -> DataFrame:
+    """
+    Casts the columns of a DataFrame to the smallest dtypes that hold their values. Integers are
+    downcast, floats become float32 when no precision is lost, strings with few distinct values become
+    categoricals and dates become datetimes. With a schema the rAPId data types decide how each column
+    is treated and `allow_null` decides whether integers and booleans get nullable dtypes, so the column
+    values are best passed as decoded rather than already cast. Without a schema the current dtype
+    decides, and nullable dtypes are used for columns with nulls.
+
+    The memory used before and after, and the bytes saved, are recorded in `df.attrs["memory_usage"]`.
+
+    Args:
+        df (DataFrame): The pandas DataFrame to compact.
+        schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset. Defaults to None.
+        category_ratio (float, optional): The largest ratio of distinct values to rows for which a string
+            column becomes a categorical. Defaults to 0.5.
+
+    Returns:
+        DataFrame: The pandas DataFrame with compact dtypes.
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    columns = {column.name: column for column in schema.columns} if schema else {}
+    for name in df.columns:
+        values = df[name]
+        column = columns.get(name)
+        data_type = column.data_type.lower() if column else ""
+        # A column the schema declares non-nullable still falls back to a nullable dtype if it has nulls
+        nullable = values.hasnans or bool(column and column.allow_null)
+        if data_type in ("date", "datetime", "timestamp"):
+            df[name] = pd.to_datetime(values, format=column.format)
+        elif data_type.startswith("bool") or types.is_bool_dtype(values):
+            df[name] = values.astype("boolean" if nullable else "bool")
+        elif data_type.startswith("int") or (
+            not data_type and types.is_integer_dtype(values)
+        ):
+            df[name] = _compact_integers(pd.to_numeric(values), nullable)
+        elif (
+            data_type.startswith("float")
+            or data_type == "double"
+            or (not data_type and types.is_float_dtype(values))
+        ):
+            df[name] = _compact_floats(pd.to_numeric(values))
+        elif types.is_object_dtype(values) or types.is_string_dtype(values):
+            if len(values) and values.nunique() <= category_ratio * len(values):
+                df[name] = values.astype("category")
+    after = int(df.memory_usage(deep=True).sum())
+    df.attrs["memory_usage"] = {
+        "before": before,
+        "after": after,
+        "saved": before - after,
+    }
+    return df
+
+
+def _compact_integers(values: Series, nullable: bool) -> Series:
+    present = values.dropna()
+    low, high = (present.min(), present.max()) if len(present) else (0, 0)
+    for dtype in ("int8", "int16", "int32"):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            break
+    else:
+        dtype = "int64"
+    return values.astype(dtype.capitalize() if nullable else dtype)
+
+
+def _compact_floats(values: Series) -> Series:
+    narrow = values.astype("float32")
+    if ((narrow.astype("float64") == values) | values.isna()).all():
+        return narrow
+    return values.astype("float64")
@@ -0,0 +1,173 @@
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rapid.utils.constants import EventPhase
+
+HISTOGRAM_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10)
+ENDPOINT_PATTERNS = [
+    (re.compile(r"^/jobs/[^/]+$"), "/jobs/{id}"),
+    (
+        re.compile(r"^/schema/[^/]+/[^/]+/[^/]+/generate$"),
+        "/schema/{sensitivity}/{domain}/{dataset}/generate",
+    ),
+    (re.compile(r"^/datasets/[^/]+/[^/]+(/\w+)?$"), r"/datasets/{domain}/{dataset}\1"),
+]
+
+
+class Event:
+    def __init__(
+        self,
+        phase: EventPhase,
+        duration: float,
+        endpoint: Optional[str] = None,
+        method: Optional[str] = None,
+        status_code: Optional[int] = None,
+        request_bytes: Optional[int] = None,
+        response_bytes: Optional[int] = None,
+        job_id: Optional[str] = None,
+    ) -> None:
+        """
+        A timing event emitted by :class:`rapid.rapid.Rapid` for one phase of a call.
+
+        Args:
+            phase (:class:`rapid.utils.constants.EventPhase`): The phase that was timed.
+            duration (float): The number of seconds the phase took.
+            endpoint (str, optional): The API endpoint, with path parameters replaced by placeholders
+                such as `/datasets/{domain}/{dataset}/query`. Defaults to None.
+            method (str, optional): The HTTP method of a request. Defaults to None.
+            status_code (int, optional): The status code of a response. Defaults to None.
+            request_bytes (int, optional): The size of the request body, or of a serialised file. Defaults to None.
+            response_bytes (int, optional): The size of the response body. Defaults to None.
+            job_id (str, optional): The ID of the job a request or outcome belongs to. Defaults to None.
+        """
+        self.phase = phase
+        self.duration = duration
+        self.endpoint = endpoint
+        self.method = method
+        self.status_code = status_code
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+        self.job_id = job_id
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}"
+            for name, value in vars(self).items()
+            if value is not None
+        )
+        return f"Event({fields})"
+
+
+class Hooks:
+    def __init__(self, hooks: Optional[List[Callable[[Event], None]]] = None) -> None:
+        """
+        The hooks registered on a client, each called with every :class:`Event` it emits. A client
+        with no hooks skips timing altogether, so instrumentation costs nothing until it is used.
+
+        Args:
+            hooks (List[Callable[[Event], None]], optional): The hooks to register. Defaults to None.
+        """
+        self._hooks = list(hooks) if hooks else []
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def register(self, hook: Callable[[Event], None]) -> Callable[[Event], None]:
+        """
+        Registers a hook, returning it so this can be used as a decorator.
+        """
+        self._hooks = [*self._hooks, hook]
+        return hook
+
+    def unregister(self, hook: Callable[[Event], None]) -> None:
+        self._hooks = [registered for registered in self._hooks if registered != hook]
+
+    def emit(self, event: Event) -> None:
+        for hook in self._hooks:
+            hook(event)
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Replaces the path parameters of a rAPId API path with placeholders, so that requests to the
+    same endpoint can be grouped.
+    """
+    for pattern, template in ENDPOINT_PATTERNS:
+        if pattern.match(path):
+            return pattern.sub(template, path)
+    return path
+
+
+class LatencyAggregator:
+    def __init__(self) -> None:
+        """
+        A hook that collects the duration of every event by phase and endpoint, and reports them as
+        latency histograms::
+
+            aggregator = LatencyAggregator()
+            rapid.hooks.register(aggregator)
+            rapid.upload_dataframe("domain", "dataset", df)
+            aggregator.print_report()
+        """
+        self.durations: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> None:
+        if event.phase == EventPhase.REQUEST:
+            key = (event.phase.value, f"{event.method} {event.endpoint}")
+        else:
+            key = (event.phase.value, event.endpoint or "")
+        with self._lock:
+            self.durations.setdefault(key, []).append(event.duration)
+
+    def histogram(self, durations: List[float]) -> List[Tuple[str, int]]:
+        """
+        Returns the number of durations in each latency bucket, labelled by the bucket's upper bound.
+        """
+        counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        for duration in durations:
+            index = next(
+                (i for i, bound in enumerate(HISTOGRAM_BUCKETS) if duration <= bound),
+                len(HISTOGRAM_BUCKETS),
+            )
+            counts[index] += 1
+        labels = [f"<= {bound * 1000:g}ms" for bound in HISTOGRAM_BUCKETS] + [
+            f"> {HISTOGRAM_BUCKETS[-1] * 1000:g}ms"
+        ]
+        return list(zip(labels, counts))
+
+    def report(self, width: int = 40) -> str:
+        """
+        Returns a text report with a summary and a histogram for each phase and endpoint.
+
+        Args:
+            width (int, optional): The width of the longest histogram bar. Defaults to 40.
+        """
+        lines = []
+        with self._lock:
+            durations = {key: sorted(values) for key, values in self.durations.items()}
+        for (phase, endpoint), values in sorted(durations.items()):
+            total = sum(values)
+            p50 = values[len(values) // 2]
+            p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+            lines.append(
+                f"{phase} {endpoint}".rstrip()
+                + f": count={len(values)} total={total * 1000:.1f}ms"
+                + f" p50={p50 * 1000:.1f}ms p95={p95 * 1000:.1f}ms max={values[-1] * 1000:.1f}ms"
+            )
+            histogram = self.histogram(values)
+            largest = max(count for _, count in histogram)
+            first = next(i for i, (_, count) in enumerate(histogram) if count)
+            last = max(i for i, (_, count) in enumerate(histogram) if count)
+            for label, count in histogram[first : last + 1]:
+                bar = "#" * round(width * count / largest)
+                lines.append(f"  {label:>10} | {bar} {count}")
+        return "\n".join(lines)
+
+    def print_report(self, width: int = 40) -> None:
+        print(self.report(width))
+
+    def reset(self) -> None:
+        with self._lock:
+            self.durations = {}
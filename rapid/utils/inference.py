@@ -0,0 +1,151 @@
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import pandas as pd
+from pandas import DataFrame, Series
+
+from rapid.items.schema import Column, Owner, Schema, SchemaMetadata
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rapid.rapid import Rapid
+
+DATE_FORMATS = {
+    "%Y-%m-%d": r"\d{4}-\d{2}-\d{2}",
+    "%d/%m/%Y": r"\d{2}/\d{2}/\d{4}",
+}
+PLACEHOLDER_OWNER = Owner(name="change_me", email="change_me@email.com")
+
+
+def infer_schema(
+    df: DataFrame,
+    domain: str,
+    dataset: str,
+    sensitivity: str,
+    infer_nullability: bool = False,
+) -> Schema:
+    """
+    Infers a rAPId schema from a pandas DataFrame locally, without uploading the data to the API.
+    Columns are given the same data types the API would generate from the DataFrame's csv: "Int64",
+    "Float64", "boolean", "date" with its format, or "object". Like the API, the schema owners are
+    set to a placeholder that should be replaced.
+
+    Args:
+        df (DataFrame): The pandas DataFrame to infer a schema for.
+        domain (str): The domain of the dataset.
+        dataset (str): The name of the dataset.
+        sensitivity (str): The sensitivity level of the dataset.
+        infer_nullability (bool, optional): Whether to only allow nulls in columns that contain them. Defaults
+            to False, allowing nulls in every column as the API does.
+
+    Returns:
+        :class:`rapid.items.schema.Schema`: The inferred schema.
+    """
+    columns = []
+    for name in df.columns:
+        series = df[name]
+        data_type, _format = infer_data_type(series)
+        columns.append(
+            Column(
+                name=str(name),
+                data_type=data_type,
+                allow_null=bool(series.isna().any()) if infer_nullability else True,
+                format=_format,
+            )
+        )
+    return Schema(
+        metadata=SchemaMetadata(
+            domain=domain,
+            dataset=dataset,
+            sensitivity=sensitivity,
+            owners=[PLACEHOLDER_OWNER],
+        ),
+        columns=columns,
+    )
+
+
+def infer_data_type(series: Series) -> Tuple[str, Optional[str]]:
+    """
+    Returns the rAPId data type and date format of a pandas Series.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(series.cat.categories.dtype)
+    values = series.dropna()
+    if values.empty:
+        return "object", None
+    if pd.api.types.is_bool_dtype(series):
+        return "boolean", None
+    if pd.api.types.is_integer_dtype(series):
+        return "Int64", None
+    if pd.api.types.is_float_dtype(series):
+        return ("Int64" if (values % 1 == 0).all() else "Float64"), None
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return "date", "%Y-%m-%d"
+    return _infer_object_data_type(values)
+
+
+def _infer_object_data_type(values: Series) -> Tuple[str, Optional[str]]:
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred == "boolean":
+        return "boolean", None
+    if inferred == "integer":
+        return "Int64", None
+    if inferred in ("date", "datetime", "datetime64"):
+        return "date", "%Y-%m-%d"
+    strings = values.astype(str).str.strip()
+    if strings.str.lower().isin(["true", "false"]).all():
+        return "boolean", None
+    numbers = pd.to_numeric(strings, errors="coerce")
+    if numbers.notna().all():
+        return ("Int64" if (numbers % 1 == 0).all() else "Float64"), None
+    for _format, pattern in DATE_FORMATS.items():
+        if strings.str.fullmatch(pattern).all() and (
+            pd.to_datetime(strings, format=_format, errors="coerce").notna().all()
+        ):
+            return "date", _format
+    return "object", None
+
+
+def check_inference_parity(
+    rapid: "Rapid",
+    df: DataFrame,
+    domain: str,
+    dataset: str,
+    sensitivity: str,
+    sample_rows: int = 1000,
+) -> Dict[str, Dict[str, Optional[Column]]]:
+    """
+    Compares the locally inferred schema with the schema the API generates for a random sample of the
+    DataFrame, to check that local inference can be relied on for a dataset.
+
+    Args:
+        rapid (:class:`rapid.rapid.Rapid`): An instance of the rAPId SDK's main class.
+        df (DataFrame): The pandas DataFrame to compare the schemas of.
+        domain (str): The domain of the dataset.
+        dataset (str): The name of the dataset.
+        sensitivity (str): The sensitivity level of the dataset.
+        sample_rows (int, optional): The number of rows sent to the API. Defaults to 1000.
+
+    Returns:
+        Dict[str, Dict[str, Optional[Column]]]: The columns whose local and generated definitions differ,
+            keyed by column name with the "local" and "server" columns. Empty if the schemas match.
+    """
+    if len(df) > sample_rows:
+        df = df.sample(n=sample_rows, random_state=0).sort_index()
+    local = {
+        column.name: column
+        for column in infer_schema(df, domain, dataset, sensitivity).columns
+    }
+    server = {
+        column.name: column
+        for column in rapid.generate_schema(df, domain, dataset, sensitivity).columns
+    }
+    mismatches = {}
+    for name in dict.fromkeys([*local, *server]):
+        local_column, server_column = local.get(name), server.get(name)
+        if (
+            local_column is None
+            or server_column is None
+            or local_column.data_type != server_column.data_type
+            or local_column.format != server_column.format
+        ):
+            mismatches[name] = {"local": local_column, "server": server_column}
+    return mismatches
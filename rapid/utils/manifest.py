@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from pandas.api import types
+from pandas.util import hash_array, hash_pandas_object
+
+from rapid.utils.constants import DOWNLOAD_PAGE_SIZE, MANIFEST_COMPACT_SEGMENTS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rapid.items.schema import Schema
+    from rapid.rapid import Rapid
+
+BASE_FILE = "base.npy"
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".npy"
+NULL_HASH = np.uint64(0)
+
+
+class UploadManifest:
+    def __init__(
+        self, directory: str, compact_segments: int = MANIFEST_COMPACT_SEGMENTS
+    ) -> None:
+        """
+        A local on-disk record of the rows already uploaded to each dataset, used to upload only new rows
+        to APPEND datasets with :func:`rapid.patterns.data.upload_dataframe_delta`. Each row is recorded as a
+        64 bit hash of its key columns, so the manifest takes 8 bytes a row.
+
+        Hashes of each upload are written to a new segment file, and once a dataset has more than
+        `compact_segments` segments they are merged into one sorted file. If the manifest is lost it can be
+        rebuilt from the dataset with :meth:`rebuild`.
+
+        Example::
+
+            manifest = UploadManifest("~/.rapid/manifest")
+            upload_dataframe_delta(rapid, manifest, "domain", "dataset", df, key_columns=["id"])
+
+        Args:
+            directory (str): The directory to store the manifest in, created if it does not exist.
+            compact_segments (int, optional): The number of segments a dataset can have before they are compacted. Defaults to 16.
+        """
+        self.directory = os.path.expanduser(directory)
+        self.compact_segments = compact_segments
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def hash_rows(df: DataFrame, key_columns: Optional[List[str]] = None):
+        """
+        Hashes the key columns of each row of a DataFrame. Values are normalised first, so that a row
+        hashes the same whether its integers are nullable or not, or stored as whole floats, and its
+        strings are objects, strings or categories. Each value is normalised on its own, so a row hashes
+        the same whatever the other rows uploaded with it.
+
+        Args:
+            df (DataFrame): The pandas DataFrame to hash.
+            key_columns (List[str], optional): The columns that identify a row. Defaults to None, using every column.
+
+        Returns:
+            numpy.ndarray: The uint64 hash of each row.
+        """
+        keys = df[key_columns] if key_columns else df
+        hashes = {}
+        for name in keys.columns:
+            values = keys[name]
+            nulls = values.isna().to_numpy()
+            if types.is_bool_dtype(values):
+                array = values.astype("boolean").to_numpy("bool", na_value=False)
+            elif types.is_integer_dtype(values):
+                array = values.astype("Int64").to_numpy("int64", na_value=0)
+            elif types.is_numeric_dtype(values):
+                array = _normalise_floats(
+                    values.astype("Float64").to_numpy("float64", na_value=0)
+                )
+            elif types.is_datetime64_any_dtype(values):
+                array = values.astype("datetime64[ns]").to_numpy().view("int64")
+            else:
+                array = values.astype("string").to_numpy(object, na_value="")
+            # Hashing plain numpy arrays is much faster than hashing nullable pandas arrays
+            hashed = hash_array(array)
+            hashed[nulls] = NULL_HASH
+            hashes[name] = hashed
+        return hash_pandas_object(DataFrame(hashes), index=False).to_numpy()
+
+    def contains(self, domain: str, dataset: str, hashes) -> np.ndarray:
+        """
+        Returns whether each of the given row hashes has been recorded for a dataset.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        base, segments = self._load(domain, dataset)
+        found = np.zeros(len(hashes), dtype=bool)
+        if len(base):
+            # Searching for the hashes in order keeps the lookups into the base cache friendly
+            order = np.argsort(hashes)
+            positions = np.searchsorted(base, hashes[order]).clip(max=len(base) - 1)
+            found[order] = base[positions] == hashes[order]
+        if len(segments):
+            found |= np.isin(hashes, segments)
+        return found
+
+    def new_rows(
+        self,
+        domain: str,
+        dataset: str,
+        df: DataFrame,
+        key_columns: Optional[List[str]] = None,
+    ) -> Tuple[DataFrame, np.ndarray]:
+        """
+        Returns the rows of a DataFrame that have not been recorded for a dataset, keeping only the
+        first row for each key, along with their hashes.
+
+        Args:
+            domain (str): The domain of the dataset.
+            dataset (str): The name of the dataset.
+            df (DataFrame): The pandas DataFrame to filter.
+            key_columns (List[str], optional): The columns that identify a row. Defaults to None, using every column.
+
+        Returns:
+            Tuple[DataFrame, numpy.ndarray]: The new rows and their hashes.
+        """
+        hashes = self.hash_rows(df, key_columns)
+        new = ~self.contains(domain, dataset, hashes) & ~pd.Series(hashes).duplicated()
+        mask = new.to_numpy()
+        return df[mask], hashes[mask]
+
+    def add(self, domain: str, dataset: str, hashes) -> None:
+        """
+        Records row hashes for a dataset, compacting its segments once there are too many.
+        """
+        hashes = np.unique(np.asarray(hashes, dtype=np.uint64))
+        if hashes.size == 0:
+            return
+        directory = self._directory(domain, dataset)
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            self._write(
+                os.path.join(
+                    directory, f"{SEGMENT_PREFIX}{uuid.uuid4().hex}{SEGMENT_SUFFIX}"
+                ),
+                hashes,
+            )
+            if len(self._segment_files(directory)) > self.compact_segments:
+                self._compact(directory)
+
+    def compact(self, domain: str, dataset: str) -> None:
+        """
+        Merges the segments of a dataset into a single sorted file of unique hashes.
+        """
+        directory = self._directory(domain, dataset)
+        with self._lock:
+            if os.path.isdir(directory):
+                self._compact(directory)
+
+    def rows(self, domain: str, dataset: str) -> int:
+        """
+        Returns the number of distinct rows recorded for a dataset.
+        """
+        self.compact(domain, dataset)
+        return len(self._load(domain, dataset)[0])
+
+    def clear(self, domain: str, dataset: str) -> None:
+        """
+        Removes everything recorded for a dataset.
+        """
+        directory = self._directory(domain, dataset)
+        with self._lock:
+            if not os.path.isdir(directory):
+                return
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+
+    def rebuild(
+        self,
+        rapid: Rapid,
+        domain: str,
+        dataset: str,
+        key_columns: Optional[List[str]] = None,
+        schema: Optional[Schema] = None,
+        page_size: int = DOWNLOAD_PAGE_SIZE,
+    ) -> int:
+        """
+        Replaces the record of a dataset with the rows it currently holds. Only the key columns are
+        downloaded. With a single key column they are downloaded page by page, ordered by the key, with
+        :meth:`rapid.rapid.Rapid.iter_dataframe` and hashed as each page arrives. Several key columns cannot
+        be paged through by one of them, so they are downloaded at once with :meth:`rapid.rapid.Rapid.download_dataframe`.
+
+        Args:
+            rapid (:class:`rapid.rapid.Rapid`): The client to download the dataset with.
+            domain (str): The domain of the dataset.
+            dataset (str): The name of the dataset.
+            key_columns (List[str], optional): The columns that identify a row. Defaults to None, using every column.
+            schema (:class:`rapid.items.schema.Schema`, optional): The schema of the dataset, used to give the
+                downloaded columns the same dtypes as uploaded DataFrames. Defaults to None.
+            page_size (int, optional): The number of rows downloaded at a time with a single key column. Defaults to 50000.
+
+        Returns:
+            int: The number of distinct rows recorded.
+        """
+        from rapid.items.query import Query, SQLQueryOrderBy
+
+        if key_columns and len(key_columns) == 1:
+            query = Query(
+                select_columns=key_columns,
+                order_by_columns=[SQLQueryOrderBy(column=key_columns[0])],
+            )
+            pages = rapid.iter_dataframe(
+                domain, dataset, query, page_size=page_size, schema=schema
+            )
+        else:
+            query = Query(select_columns=key_columns) if key_columns else Query()
+            pages = [
+                rapid.download_dataframe(domain, dataset, query=query, schema=schema)
+            ]
+        # The hashes take 8 bytes a row, so they are kept until every page has arrived and the
+        # record is only replaced once the download has succeeded
+        hashes = [self.hash_rows(page, key_columns) for page in pages if len(page)]
+        self.clear(domain, dataset)
+        self.add(domain, dataset, np.concatenate(hashes) if hashes else [])
+        return self.rows(domain, dataset)
+
+    def _directory(self, domain: str, dataset: str) -> str:
+        return os.path.join(self.directory, domain, dataset)
+
+    @staticmethod
+    def _segment_files(directory: str) -> List[str]:
+        return [
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            # Temporary files left by an interrupted write are ignored
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        ]
+
+    def _load(self, domain: str, dataset: str):
+        directory = self._directory(domain, dataset)
+        with self._lock:
+            if not os.path.isdir(directory):
+                return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.uint64)
+            base_path = os.path.join(directory, BASE_FILE)
+            base = (
+                np.load(base_path)
+                if os.path.exists(base_path)
+                else np.empty(0, dtype=np.uint64)
+            )
+            segments = [np.load(path) for path in self._segment_files(directory)]
+        return base, (
+            np.concatenate(segments) if segments else np.empty(0, dtype=np.uint64)
+        )
+
+    def _compact(self, directory: str) -> None:
+        base_path = os.path.join(directory, BASE_FILE)
+        segment_files = self._segment_files(directory)
+        if not segment_files:
+            return
+        parts = [np.load(path) for path in segment_files]
+        if os.path.exists(base_path):
+            parts.append(np.load(base_path))
+        self._write(base_path, np.unique(np.concatenate(parts)))
+        for path in segment_files:
+            os.remove(path)
+
+    @staticmethod
+    def _write(path: str, hashes: np.ndarray) -> None:
+        # Written to a temporary file first so that a crash never leaves a partial file
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as file:
+            np.save(file, hashes)
+        os.replace(temporary, path)
+
+
+def _normalise_floats(values: np.ndarray) -> np.ndarray:
+    # Whole floats take the bits of the equal integer, so 1.0 hashes like 1 in any batch
+    integral = (
+        np.isfinite(values)
+        & (values == np.round(values))
+        & (np.abs(values) < 2.0**63)
+    )
+    integers = np.where(integral, values, 0).astype("int64").view("uint64")
+    return np.where(integral, integers, values.view("uint64"))
@@ -0,0 +1,76 @@
+from io import BytesIO
+import os
+from typing import IO, Dict, List, Tuple
+
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+
+class StreamBody:
+    def __init__(self, parts: List[IO[bytes]]) -> None:
+        """
+        A request body that reads a sequence of binary files one after another, so that requests
+        streams it to the API without joining them in memory. The body has a known length and can be
+        rewound with `seek(0)` to send it again.
+
+        Args:
+            parts (List[IO[bytes]]): The seekable binary files to read, in order.
+        """
+        self.parts = parts
+        self.sizes = [part.seek(0, os.SEEK_END) for part in parts]
+        self._position = 0
+        self.seek(0)
+
+    def __len__(self) -> int:
+        return sum(self.sizes)
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self)
+        self._position = max(0, min(offset, len(self)))
+        start = 0
+        for part, size in zip(self.parts, self.sizes):
+            part.seek(min(max(self._position - start, 0), size))
+            start += size
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        start = 0
+        for part, part_size in zip(self.parts, self.sizes):
+            end = start + part_size
+            if self._position < end and size != 0:
+                chunk = part.read(size if size > 0 else -1)
+                self._position += len(chunk)
+                chunks.append(chunk)
+                if size > 0:
+                    size -= len(chunk)
+            start = end
+        return b"".join(chunks)
+
+
+def multipart_body(files: Dict[str, Tuple[str, IO[bytes]]]) -> Tuple[StreamBody, str]:
+    """
+    Builds a multipart/form-data body around files without reading them into memory. The body
+    is encoded exactly as requests encodes a `files` argument.
+
+    Args:
+        files (Dict[str, Tuple[str, IO[bytes]]]): The file name and seekable binary content of each form field.
+
+    Returns:
+        Tuple[:class:`StreamBody`, str]: The body and its Content-Type header.
+    """
+    boundary = choose_boundary()
+    parts = []
+    for name, (filename, content) in files.items():
+        field = RequestField(name=name, data=b"", filename=filename)
+        field.make_multipart()
+        header = f"--{boundary}\r\n{field.render_headers()}".encode("utf-8")
+        parts.extend([BytesIO(header), content, BytesIO(b"\r\n")])
+    parts.append(BytesIO(f"--{boundary}--\r\n".encode("latin-1")))
+    return StreamBody(parts), f"multipart/form-data; boundary={boundary}"
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import IO, TYPE_CHECKING, Dict, Tuple, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+
+
+class UploadPayload:
+    def __init__(
+        self, df: DataFrame, filename: str, content: Union[str, bytes, IO[bytes]]
+    ) -> None:
+        """
+        A DataFrame serialised once for upload, so that it can be sent to several endpoints, and
+        resent on retry, without being serialised again. Create one with
+        :meth:`rapid.rapid.Rapid.prepare_payload` and pass it anywhere a DataFrame is uploaded.
+
+        Example::
+
+            with rapid.prepare_payload(df) as payload:
+                schema = rapid.generate_schema(payload, "domain", "dataset", "PUBLIC")
+                rapid.create_schema(schema)
+                rapid.upload_dataframe("domain", "dataset", payload)
+
+        A payload spooled to a temporary file is read from one position, so it should not be uploaded
+        from several threads at once.
+
+        Args:
+            df (DataFrame): The DataFrame that was serialised.
+            filename (str): The file name the DataFrame is uploaded as.
+            content (Union[str, bytes, IO[bytes]]): The serialised DataFrame, or an open binary file holding it.
+        """
+        self.df = df
+        self.filename = filename
+        self.content = content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the serialised DataFrame in bytes.
+        """
+        if isinstance(self.content, str):
+            return len(self.content.encode("utf-8"))
+        if isinstance(self.content, bytes):
+            return len(self.content)
+        position = self.content.tell()
+        size = self.content.seek(0, 2)
+        self.content.seek(position)
+        return size
+
+    def files(self) -> Dict[str, Tuple[str, Union[str, bytes, IO[bytes]]]]:
+        """
+        Returns the payload as the files of a multipart upload, like
+        :meth:`rapid.rapid.Rapid.convert_dataframe_for_file_upload`. A spooled payload is
+        wrapped so that the upload does not close it.
+        """
+        if isinstance(self.content, (str, bytes)):
+            return {"file": (self.filename, self.content)}
+        self.content.seek(0)
+        return {"file": (self.filename, _SharedFile(self.content))}
+
+    def close(self) -> None:
+        """
+        Releases the temporary file of a spooled payload.
+        """
+        if hasattr(self.content, "close"):
+            self.content.close()
+
+
+class _SharedFile:
+    def __init__(self, file: IO[bytes]) -> None:
+        self._file = file
+
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,148 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+
+from rapid.utils.backoff import Backoff
+from rapid.utils.constants import (
+    RETRY_BUDGET,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_METHODS,
+    RETRY_STATUS_CODES,
+    RETRY_UNSENT_STATUS_CODES,
+)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        statuses: Iterable[int] = RETRY_STATUS_CODES,
+        methods: Iterable[str] = RETRY_METHODS,
+        unsent_statuses: Iterable[int] = RETRY_UNSENT_STATUS_CODES,
+        backoff: Optional[Backoff] = None,
+        budget: Optional[float] = RETRY_BUDGET,
+        respect_retry_after: bool = True,
+    ) -> None:
+        """
+        Decides whether and when a request to the API that hit a transient failure is sent again.
+        Responses with a retryable status and connection errors are retried with an exponential
+        backoff, until either the maximum number of attempts is reached or the next attempt would
+        start after the time budget has run out.
+
+        Requests that are not idempotent, like uploads that each start a job, are only retried when the
+        API cannot have acted on them: on a status in `unsent_statuses` or when no connection could be made.
+        A 429 or 503 from a proxy in front of the API could still follow an upload that reached it, so a
+        retried upload may, rarely, create a duplicate job. Pass `unsent_statuses=[]` to retry uploads only
+        when no connection could be made.
+
+        Retried uploads resend the file that was already serialised, so a DataFrame is only written
+        once however many attempts an upload takes.
+
+        Args:
+            max_attempts (int, optional): The maximum number of times a request is sent, including the first. Defaults to 4.
+            statuses (Iterable[int], optional): The response status codes that are retried. Defaults to 429, 502, 503 and 504.
+            methods (Iterable[str], optional): The HTTP methods that are retried. Defaults to GET, POST and PUT, as the
+                rAPId API uses POST for queries as well as uploads.
+            unsent_statuses (Iterable[int], optional): The response status codes that are retried for requests that are
+                not idempotent. Defaults to 429 and 503.
+            backoff (:class:`rapid.utils.backoff.Backoff`, optional): The backoff between attempts. Defaults to
+                a backoff starting at 0.5 seconds and growing to at most 10 seconds.
+            budget (float, optional): The total number of seconds to spend on a request, including waits. Defaults to 60, None is unlimited.
+            respect_retry_after (bool, optional): Whether to wait as long as a `Retry-After` header asks. Defaults to True.
+        """
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.unsent_statuses = frozenset(unsent_statuses)
+        self.backoff = backoff if backoff else Backoff(initial=0.5, maximum=10)
+        self.budget = budget
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable(
+        self,
+        method: str,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+        idempotent: bool = True,
+    ) -> bool:
+        """
+        Returns whether a request that got the given response, or raised the given error, can be retried.
+        Requests that are not idempotent are only retried when the API cannot have acted on them.
+        """
+        if method.upper() not in self.methods:
+            return False
+        if error is not None:
+            if idempotent:
+                return isinstance(error, requests.ConnectionError)
+            return not_connected(error)
+        statuses = self.statuses if idempotent else self.unsent_statuses
+        return response is not None and response.status_code in statuses
+
+    def delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+        idempotent: bool = True,
+    ) -> Optional[float]:
+        """
+        Returns the number of seconds to wait before sending a request again, or None if it should not be retried.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of the attempt that failed, counting from zero.
+            elapsed (float): The number of seconds spent on the request so far.
+            response (requests.Response, optional): The response to the failed attempt. Defaults to None.
+            error (Exception, optional): The error raised by the failed attempt. Defaults to None.
+            idempotent (bool, optional): Whether sending the request again is safe once the API may have received it. Defaults to True.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if not self.is_retryable(method, response, error, idempotent):
+            return None
+        delay = self.backoff.delay(attempt)
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+        if self.budget is not None and elapsed + delay > self.budget:
+            return None
+        return delay
+
+
+def not_connected(error: Exception) -> bool:
+    """
+    Returns whether a request error happened before a connection was made, so the request was never sent.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.ConnectionError) or not error.args:
+        return False
+    # requests wraps the urllib3 error, whose reason is a ConnectTimeoutError, or the NewConnectionError
+    # subclass of it, when the connection could not be made
+    return isinstance(getattr(error.args[0], "reason", None), ConnectTimeoutError)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Returns the number of seconds a `Retry-After` header asks to wait, given as either a number of
+    seconds or an HTTP date. Returns None for a missing or invalid header.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,71 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from rapid.utils.constants import SAMPLE_CATEGORY_THRESHOLD, SAMPLE_ROWS
+
+
+def sample_dataframe(
+    df: DataFrame,
+    max_rows: int = SAMPLE_ROWS,
+    max_bytes: Optional[int] = None,
+    category_threshold: int = SAMPLE_CATEGORY_THRESHOLD,
+    random_state: int = 0,
+) -> DataFrame:
+    """
+    Takes a representative sample of a DataFrame for type detection. The sample always includes, for
+    every column, a row containing a null if the column has any, the rows holding its minimum and maximum
+    values, and a row for each distinct value of columns with at most `category_threshold` distinct values.
+    The remainder of the budget is filled with randomly chosen rows. Rows keep their original order.
+
+    The guaranteed rows are kept even if they exceed the budget.
+
+    Args:
+        df (DataFrame): The pandas DataFrame to sample.
+        max_rows (int, optional): The maximum number of rows in the sample. Defaults to 10000.
+        max_bytes (int, optional): The approximate maximum size of the sample as csv. Defaults to None.
+        category_threshold (int, optional): The maximum number of distinct values for a column to have
+            every value included. Defaults to 50.
+        random_state (int, optional): The seed used to choose the random rows. Defaults to 0.
+
+    Returns:
+        DataFrame: The sampled pandas DataFrame.
+    """
+    if max_bytes is not None and len(df):
+        head = df.head(100)
+        row_bytes = len(head.to_csv(index=False).encode("utf-8")) / len(head)
+        max_rows = min(max_rows, max(1, int(max_bytes / row_bytes)))
+    if len(df) <= max_rows:
+        return df
+
+    required = np.zeros(len(df), dtype=bool)
+    for name in df.columns:
+        series = df[name].reset_index(drop=True)
+        nulls = series.isna().to_numpy()
+        if nulls.any():
+            required[nulls.argmax()] = True
+        values = series[~nulls]
+        if values.empty:
+            continue
+        if pd.api.types.is_numeric_dtype(
+            values
+        ) or pd.api.types.is_datetime64_any_dtype(values):
+            if not pd.api.types.is_bool_dtype(values):
+                required[[values.idxmin(), values.idxmax()]] = True
+        try:
+            distinct = values.nunique()
+        except TypeError:
+            continue
+        if distinct <= category_threshold:
+            required[values[~values.duplicated()].index] = True
+
+    remaining = max_rows - required.sum()
+    if remaining > 0:
+        candidates = np.flatnonzero(~required)
+        chosen = np.random.default_rng(random_state).choice(
+            candidates, size=min(remaining, len(candidates)), replace=False
+        )
+        required[chosen] = True
+    return df.iloc[np.flatnonzero(required)]
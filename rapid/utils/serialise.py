@@ -0,0 +1,108 @@
+from datetime import datetime
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import IO, Tuple, Union
+import warnings
+
+from pandas import DataFrame
+
+from rapid.utils.constants import UPLOAD_BLOCK_ROWS, UPLOAD_MEMORY_LIMIT, UploadFormat
+
+
+def serialise_dataframe(
+    df: DataFrame,
+    upload_format: UploadFormat = UploadFormat.CSV,
+    parquet_compression: str = "snappy",
+) -> Tuple[str, Union[str, bytes]]:
+    """
+    Serialises a pandas DataFrame into a file that can be uploaded to the API.
+
+    Parquet files are columnar and compressed, so they are usually much smaller and faster to
+    write than csv for numeric data. If no parquet engine is installed the DataFrame is written
+    as csv instead.
+
+    Args:
+        df (DataFrame): The pandas DataFrame to serialise.
+        upload_format (:class:`rapid.utils.constants.UploadFormat`, optional): The file format to write. Defaults to csv.
+        parquet_compression (str, optional): The compression codec used for parquet files, one of
+            "snappy", "gzip", "brotli", "zstd", "lz4" or None. Defaults to "snappy".
+
+    Returns:
+        Tuple[str, Union[str, bytes]]: The file name and the file content.
+    """
+    timestamp = int(datetime.now().timestamp())
+    if UploadFormat(upload_format) == UploadFormat.PARQUET:
+        buffer = BytesIO()
+        try:
+            df.to_parquet(buffer, index=False, compression=parquet_compression)
+            return f"rapid-sdk-{timestamp}.parquet", buffer.getvalue()
+        except ImportError:
+            warnings.warn(
+                "No parquet engine is installed, falling back to csv. Install pyarrow to upload parquet files."
+            )
+    return f"rapid-sdk-{timestamp}.csv", df.to_csv(index=False)
+
+
+def spool_dataframe(
+    df: DataFrame,
+    upload_format: UploadFormat = UploadFormat.CSV,
+    parquet_compression: str = "snappy",
+    memory_limit: int = UPLOAD_MEMORY_LIMIT,
+    block_rows: int = UPLOAD_BLOCK_ROWS,
+) -> Tuple[str, Union[str, bytes, IO[bytes]]]:
+    """
+    Serialises a pandas DataFrame like :func:`serialise_dataframe`, but bounds the memory used for
+    large DataFrames. csv files are written `block_rows` rows at a time into a temporary file that
+    is kept in memory up to `memory_limit` bytes and moved to disk beyond that.
+
+    Only csv files are written in blocks. Parquet files are spooled the same way, but the whole
+    DataFrame is converted to an Arrow table while writing them, so their peak memory still grows
+    with the size of the DataFrame.
+
+    Files no larger than `memory_limit` are returned as a string or bytes, exactly as
+    :func:`serialise_dataframe` returns them. Larger files are returned as a binary file positioned
+    at the start, which the caller should close once it has been uploaded.
+
+    Args:
+        df (DataFrame): The pandas DataFrame to serialise.
+        upload_format (:class:`rapid.utils.constants.UploadFormat`, optional): The file format to write. Defaults to csv.
+        parquet_compression (str, optional): The compression codec used for parquet files. Defaults to "snappy".
+        memory_limit (int, optional): The number of bytes kept in memory before spooling to disk. Defaults to 16MB.
+        block_rows (int, optional): The number of rows converted to csv at a time. Defaults to 50,000.
+
+    Returns:
+        Tuple[str, Union[str, bytes, IO[bytes]]]: The file name and the file content.
+    """
+    timestamp = int(datetime.now().timestamp())
+    # The file is returned open for the caller to upload, or closed by _spooled_content
+    file = SpooledTemporaryFile(  # pylint: disable=consider-using-with
+        max_size=memory_limit
+    )
+    if UploadFormat(upload_format) == UploadFormat.PARQUET:
+        try:
+            df.to_parquet(file, index=False, compression=parquet_compression)
+            return f"rapid-sdk-{timestamp}.parquet", _spooled_content(
+                file, memory_limit
+            )
+        except ImportError:
+            warnings.warn(
+                "No parquet engine is installed, falling back to csv. Install pyarrow to upload parquet files."
+            )
+    for start in range(0, max(len(df), 1), block_rows):
+        block = df.iloc[start : start + block_rows]
+        file.write(block.to_csv(index=False, header=start == 0).encode("utf-8"))
+    content = _spooled_content(file, memory_limit)
+    return f"rapid-sdk-{timestamp}.csv", (
+        content.decode("utf-8") if isinstance(content, bytes) else content
+    )
+
+
+def _spooled_content(
+    file: SpooledTemporaryFile, memory_limit: int
+) -> Union[bytes, IO[bytes]]:
+    size = file.tell()
+    file.seek(0)
+    if size > memory_limit:
+        return file
+    with file:
+        return file.read()
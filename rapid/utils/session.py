@@ -0,0 +1,34 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from rapid.utils.constants import POOL_CONNECTIONS, POOL_MAXSIZE
+
+
+def create_session(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    pool_block: bool = False,
+) -> requests.Session:
+    """
+    Creates a requests session that keeps connections alive and pools them per host, so
+    repeated calls to the rAPId API reuse an open TCP and TLS connection.
+
+    Args:
+        pool_connections (int, optional): The number of hosts to keep connection pools for. Defaults to 10.
+        pool_maxsize (int, optional): The maximum number of connections kept open to a single host. Defaults to 10.
+        pool_block (bool, optional): Whether to block when a host's pool is exhausted instead of opening
+            a short lived extra connection. Defaults to False.
+
+    Returns:
+        requests.Session: The pooled session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
@@ -10,5 +10,11 @@ setup(
     license="MIT",
     packages=find_packages(include=["rapid", "rapid.*"], exclude=["tests"]),
     install_requires=["pandas", "requests", "deepdiff"],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "orjson": ["orjson"],
+        "async": ["httpx"],
+        "zstd": ["zstandard"],
+    },
     include_package_data=True,
 )
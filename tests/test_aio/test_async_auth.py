@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx
+import pytest
+
+from rapid.aio import AsyncRapidAuth
+from rapid.exceptions import AuthenticationErrorException
+from tests.conftest import RAPID_URL, RAPID_CLIENT_ID, RAPID_CLIENT_SECRET
+
+
+def create_auth(handler) -> AsyncRapidAuth:
+    return AsyncRapidAuth(
+        url=RAPID_URL,
+        client_id=RAPID_CLIENT_ID,
+        client_secret=RAPID_CLIENT_SECRET,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+class TestAsyncAuth:
+    def test_fetch_token_reuses_cached_token(self):
+        requests = []
+
+        def handler(request: httpx.Request):
+            requests.append(request)
+            return httpx.Response(
+                200, json={"access_token": "token", "expires_in": 3600}
+            )
+
+        auth = create_auth(handler)
+
+        async def fetch_tokens():
+            return await asyncio.gather(*[auth.fetch_token() for _ in range(5)])
+
+        assert asyncio.run(fetch_tokens()) == ["token"] * 5
+        assert len(requests) == 1
+        assert requests[0].url.path.endswith("/oauth2/token")
+
+    def test_validate_credentials_failure(self):
+        auth = create_auth(lambda request: httpx.Response(401, json={}))
+
+        with pytest.raises(AuthenticationErrorException):
+            asyncio.run(auth.validate_credentials())
+
+    def test_client_is_created_on_first_use(self):
+        auth = AsyncRapidAuth(
+            url=RAPID_URL, client_id=RAPID_CLIENT_ID, client_secret=RAPID_CLIENT_SECRET
+        )
+        assert auth._client is None
+        assert isinstance(auth.client, httpx.AsyncClient)
+        assert auth.client is auth.client
@@ -0,0 +1,156 @@
+import asyncio
+
+import httpx
+from mock import AsyncMock, Mock
+from pandas import DataFrame
+import pytest
+
+from rapid.aio import AsyncRapid
+from rapid.items.schema import Schema
+from rapid.exceptions import (
+    DataFrameUploadFailedException,
+    DataFrameUploadValidationException,
+    DatasetNotFoundException,
+    JobFailedException,
+    SchemaAlreadyExistsException,
+    SchemaGenerationFailedException,
+)
+from tests.conftest import RAPID_URL, RAPID_TOKEN
+from tests.test_rapid import DUMMY_SCHEMA
+
+
+def create_rapid(handler, **kwargs) -> AsyncRapid:
+    auth = Mock()
+    auth.url = RAPID_URL
+    auth.fetch_token = AsyncMock(return_value=RAPID_TOKEN)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncRapid(auth, client=client, **kwargs)
+
+
+class TestAsyncRapid:
+    def test_list_datasets(self):
+        def handler(request: httpx.Request):
+            assert request.headers["Authorization"] == f"Bearer {RAPID_TOKEN}"
+            return httpx.Response(200, json=[{"domain": "test"}])
+
+        rapid = create_rapid(handler)
+        assert asyncio.run(rapid.list_datasets()) == [{"domain": "test"}]
+
+    def test_download_dataframe_success(self):
+        def handler(request: httpx.Request):
+            assert request.url.params["version"] == "2"
+            return httpx.Response(
+                200,
+                json={
+                    "0": {"column1": "value1", "column2": "value2"},
+                    "1": {"column1": "value3", "column2": "value4"},
+                },
+            )
+
+        rapid = create_rapid(handler)
+        res = asyncio.run(rapid.download_dataframe("domain", "dataset", version=2))
+        assert res.shape == (2, 2)
+        assert list(res.columns) == ["column1", "column2"]
+
+    def test_download_dataframe_failure(self):
+        rapid = create_rapid(lambda request: httpx.Response(400, json={}))
+
+        with pytest.raises(DatasetNotFoundException):
+            asyncio.run(rapid.download_dataframe("domain", "dataset"))
+
+    def test_upload_dataframe_success_after_waiting(self):
+        statuses = iter(["IN PROGRESS", "SUCCESS"])
+
+        def handler(request: httpx.Request):
+            if request.url.path.endswith("/jobs/1234"):
+                return httpx.Response(200, json={"status": next(statuses)})
+            assert b"column_a" in request.content
+            return httpx.Response(202, json={"details": {"job_id": "1234"}})
+
+        rapid = create_rapid(handler)
+
+        async def upload():
+            rapid.wait_for_job_outcome = Mock(wraps=rapid.wait_for_job_outcome)
+            return await rapid.upload_dataframe(
+                "domain", "dataset", DataFrame({"column_a": [1]})
+            )
+
+        assert asyncio.run(upload()) == "Success"
+
+    def test_upload_dataframe_no_waiting(self):
+        rapid = create_rapid(
+            lambda request: httpx.Response(202, json={"details": {"job_id": "1234"}})
+        )
+        res = asyncio.run(
+            rapid.upload_dataframe("domain", "dataset", DataFrame(), False)
+        )
+        assert res == "1234"
+
+    @pytest.mark.parametrize(
+        "status_code, exception",
+        [
+            (422, DataFrameUploadValidationException),
+            (400, DataFrameUploadFailedException),
+        ],
+    )
+    def test_upload_dataframe_failure(self, status_code, exception):
+        rapid = create_rapid(
+            lambda request: httpx.Response(status_code, json={"details": "error"})
+        )
+        with pytest.raises(exception):
+            asyncio.run(rapid.upload_dataframe("domain", "dataset", DataFrame()))
+
+    def test_wait_for_job_outcome_failure(self):
+        rapid = create_rapid(
+            lambda request: httpx.Response(200, json={"status": "FAILED"})
+        )
+        with pytest.raises(JobFailedException):
+            asyncio.run(rapid.wait_for_job_outcome("1234", interval=0.01))
+
+    def test_generate_schema(self):
+        rapid = create_rapid(lambda request: httpx.Response(200, json=DUMMY_SCHEMA))
+        res = asyncio.run(
+            rapid.generate_schema(DataFrame(), "domain", "dataset", "PUBLIC")
+        )
+        assert res == Schema(**DUMMY_SCHEMA)
+
+    def test_generate_schema_failure(self):
+        rapid = create_rapid(lambda request: httpx.Response(400, json={}))
+        with pytest.raises(SchemaGenerationFailedException):
+            asyncio.run(
+                rapid.generate_schema(DataFrame(), "domain", "dataset", "PUBLIC")
+            )
+
+    def test_create_schema_already_exists(self):
+        rapid = create_rapid(lambda request: httpx.Response(409, json={}))
+        with pytest.raises(SchemaAlreadyExistsException):
+            asyncio.run(rapid.create_schema(Schema(**DUMMY_SCHEMA)))
+
+    def test_update_schema(self):
+        def handler(request: httpx.Request):
+            assert request.method == "PUT"
+            return httpx.Response(200, json={"data": "dummy"})
+
+        rapid = create_rapid(handler)
+        res = asyncio.run(rapid.update_schema(Schema(**DUMMY_SCHEMA)))
+        assert res == {"data": "dummy"}
+
+    def test_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(_request: httpx.Request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=[])
+
+        rapid = create_rapid(handler, max_concurrency=2)
+
+        async def fan_out():
+            await asyncio.gather(*[rapid.list_datasets() for _ in range(6)])
+
+        asyncio.run(fan_out())
+        assert peak == 2
@@ -1,10 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 import json
+import time
 
-from mock import Mock
+from mock import Mock, patch
 import pytest
 
 from rapid import RapidAuth
 from rapid.exceptions import AuthenticationErrorException, CannotFindCredentialException
+from tests.conftest import RAPID_URL, RAPID_CLIENT_ID, RAPID_CLIENT_SECRET, RAPID_TOKEN
 
 
 class MockRequestResponse:
@@ -33,10 +36,55 @@ class TestAuth:
         assert result == value
 
     def test_validate_credentials_success(self, rapid_auth: RapidAuth):
-        rapid_auth.request_token = Mock(return_value=MockRequestResponse(200))
+        rapid_auth.request_token = Mock(
+            return_value=MockRequestResponse(
+                200,
+                json.dumps({"access_token": "token", "expires_in": 3600}).encode(
+                    "utf-8"
+                ),
+            )
+        )
         rapid_auth.validate_credentials()
         rapid_auth.request_token.assert_called_once()
 
+        assert rapid_auth.fetch_token() == "token"
+        rapid_auth.request_token.assert_called_once()
+
+    def test_lazy_auth_makes_no_request(self, requests_mock):
+        RapidAuth(
+            url=RAPID_URL,
+            client_id=RAPID_CLIENT_ID,
+            client_secret=RAPID_CLIENT_SECRET,
+            lazy=True,
+        )
+        assert not requests_mock.called
+
+    def test_lazy_auth_validates_on_first_token(self, requests_mock):
+        requests_mock.post(f"{RAPID_URL}/oauth2/token", status_code=401, json={})
+        rapid_auth = RapidAuth(
+            url=RAPID_URL,
+            client_id=RAPID_CLIENT_ID,
+            client_secret=RAPID_CLIENT_SECRET,
+            lazy=True,
+        )
+        with pytest.raises(AuthenticationErrorException):
+            rapid_auth.fetch_token()
+
+    def test_lazy_auth_reuses_first_token(self, requests_mock):
+        mock = requests_mock.post(
+            f"{RAPID_URL}/oauth2/token",
+            json={"access_token": RAPID_TOKEN, "expires_in": 3600},
+        )
+        rapid_auth = RapidAuth(
+            url=RAPID_URL,
+            client_id=RAPID_CLIENT_ID,
+            client_secret=RAPID_CLIENT_SECRET,
+            lazy=True,
+        )
+        assert rapid_auth.fetch_token() == RAPID_TOKEN
+        assert rapid_auth.fetch_token() == RAPID_TOKEN
+        assert mock.call_count == 1
+
     def test_validate_credentials_failure(self, rapid_auth: RapidAuth):
         rapid_auth.request_token = Mock(return_value=MockRequestResponse(401))
         with pytest.raises(AuthenticationErrorException):
@@ -50,3 +98,60 @@ class TestAuth:
         rapid_auth.request_token = Mock(return_value=mocked_response)
         res = rapid_auth.fetch_token()
         assert res == "token"
+
+    def test_fetch_token_reuses_cached_token(self, rapid_auth: RapidAuth):
+        mocked_response = MockRequestResponse(
+            content=json.dumps({"access_token": "token", "expires_in": 3600}).encode(
+                "utf-8"
+            )
+        )
+        rapid_auth.request_token = Mock(return_value=mocked_response)
+        assert rapid_auth.fetch_token() == "token"
+        assert rapid_auth.fetch_token() == "token"
+        rapid_auth.request_token.assert_called_once()
+
+    def test_fetch_token_refreshes_expiring_token(self, rapid_auth: RapidAuth):
+        rapid_auth.request_token = Mock(
+            side_effect=[
+                MockRequestResponse(
+                    content=json.dumps(
+                        {"access_token": "old", "expires_in": 3600}
+                    ).encode("utf-8")
+                ),
+                MockRequestResponse(
+                    content=json.dumps(
+                        {"access_token": "new", "expires_in": 3600}
+                    ).encode("utf-8")
+                ),
+            ]
+        )
+        with patch("rapid.auth.time.monotonic", return_value=1000):
+            assert rapid_auth.fetch_token() == "old"
+        with patch("rapid.auth.time.monotonic", return_value=1000 + 3600 - 30):
+            assert rapid_auth.fetch_token() == "new"
+        assert rapid_auth.request_token.call_count == 2
+
+    def test_fetch_token_without_expiry_is_not_cached(self, rapid_auth: RapidAuth):
+        mocked_response = MockRequestResponse(
+            content=json.dumps({"access_token": "token"}).encode("utf-8")
+        )
+        rapid_auth.request_token = Mock(return_value=mocked_response)
+        rapid_auth.fetch_token()
+        rapid_auth.fetch_token()
+        assert rapid_auth.request_token.call_count == 2
+
+    def test_fetch_token_single_refresh_across_threads(self, rapid_auth: RapidAuth):
+        def slow_request_token():
+            time.sleep(0.05)
+            return MockRequestResponse(
+                content=json.dumps(
+                    {"access_token": "token", "expires_in": 3600}
+                ).encode("utf-8")
+            )
+
+        rapid_auth.request_token = Mock(side_effect=slow_request_token)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(lambda _: rapid_auth.fetch_token(), range(8)))
+
+        assert tokens == ["token"] * 8
+        rapid_auth.request_token.assert_called_once()
@@ -0,0 +1,141 @@
+from mock import patch
+import pytest
+from requests_mock import Mocker
+
+from rapid.catalogue import DatasetCatalogue
+from rapid.exceptions import SchemaCreateFailedException
+from rapid.items.schema import Schema
+from .conftest import RAPID_URL
+from .test_rapid import DUMMY_SCHEMA
+
+SCHEMA = Schema(**DUMMY_SCHEMA)
+
+DATASETS = [
+    {
+        "domain": "sales",
+        "dataset": "orders",
+        "version": 1,
+        "key_value_tags": {"team": "data"},
+        "key_only_tags": ["daily"],
+    },
+    {
+        "domain": "sales",
+        "dataset": "orders",
+        "version": 2,
+        "key_value_tags": {"team": "data"},
+        "key_only_tags": ["daily"],
+    },
+    {
+        "domain": "sales",
+        "dataset": "refunds",
+        "version": 1,
+        "key_value_tags": {"team": "finance"},
+        "key_only_tags": ["daily"],
+    },
+    {"domain": "hr", "dataset": "staff", "version": 3},
+]
+
+
+@pytest.fixture
+def catalogue(rapid, requests_mock: Mocker) -> DatasetCatalogue:
+    requests_mock.post(f"{RAPID_URL}/datasets", json=DATASETS)
+    return DatasetCatalogue(rapid)
+
+
+class TestDatasetCatalogue:
+    def test_lookups_fetch_once(self, catalogue, requests_mock: Mocker):
+        assert catalogue.exists("sales", "orders")
+        assert catalogue.exists("sales", "orders", version=1)
+        assert not catalogue.exists("sales", "orders", version=3)
+        assert not catalogue.exists("sales", "missing")
+        assert requests_mock.call_count == 1
+
+    def test_get_returns_latest_version(self, catalogue):
+        assert catalogue.get("sales", "orders") == DATASETS[1]
+        assert catalogue.get("sales", "orders", 1) == DATASETS[0]
+        assert catalogue.get("hr", "missing") is None
+        assert catalogue.versions("sales", "orders") == [1, 2]
+        assert catalogue.versions("hr", "missing") == []
+
+    def test_datasets(self, catalogue):
+        assert catalogue.datasets() == [DATASETS[1], DATASETS[2], DATASETS[3]]
+        assert catalogue.datasets("hr") == [DATASETS[3]]
+        assert catalogue.datasets("missing") == []
+
+    def test_find_by_tags(self, catalogue):
+        assert catalogue.find(key_only_tags=["daily"]) == [DATASETS[1], DATASETS[2]]
+        assert catalogue.find(key_value_tags={"team": "finance"}) == [DATASETS[2]]
+        assert catalogue.find(key_only_tags=["team"]) == [DATASETS[1], DATASETS[2]]
+        assert catalogue.find(
+            key_value_tags={"team": "data"}, key_only_tags=["daily"]
+        ) == [DATASETS[1]]
+        assert catalogue.find(key_value_tags={"team": "other"}) == []
+        assert len(catalogue.find()) == 3
+
+    def test_find_uses_tags_of_latest_version(self, rapid, requests_mock: Mocker):
+        latest = {"domain": "sales", "dataset": "orders", "version": 2}
+        requests_mock.post(f"{RAPID_URL}/datasets", json=[DATASETS[0], latest])
+        catalogue = DatasetCatalogue(rapid)
+
+        assert not catalogue.find(key_only_tags=["daily"])
+        assert not catalogue.find(key_value_tags={"team": "data"})
+        assert catalogue.get("sales", "orders") == latest
+
+    def test_find_with_combined_tags(self, rapid, requests_mock: Mocker):
+        requests_mock.post(
+            f"{RAPID_URL}/datasets",
+            json=[
+                {
+                    "Domain": "sales",
+                    "Dataset": "orders",
+                    "Version": "1",
+                    "Tags": {"team": "data", "daily": ""},
+                }
+            ],
+        )
+        catalogue = DatasetCatalogue(rapid)
+        assert catalogue.find(key_value_tags={"team": "data"}, key_only_tags=["daily"])
+        assert catalogue.exists("sales", "orders", 1)
+
+    def test_refresh_after_ttl(self, rapid, requests_mock: Mocker):
+        requests_mock.post(f"{RAPID_URL}/datasets", json=DATASETS)
+        catalogue = DatasetCatalogue(rapid, ttl=60)
+        with patch("rapid.catalogue.time.monotonic", return_value=100):
+            catalogue.exists("sales", "orders")
+        with patch("rapid.catalogue.time.monotonic", return_value=150):
+            catalogue.exists("sales", "orders")
+        assert requests_mock.call_count == 1
+        with patch("rapid.catalogue.time.monotonic", return_value=161):
+            catalogue.exists("sales", "orders")
+        assert requests_mock.call_count == 2
+
+    def test_refresh_on_demand(self, catalogue, requests_mock: Mocker):
+        assert not catalogue.exists("hr", "payroll")
+        requests_mock.post(
+            f"{RAPID_URL}/datasets",
+            json=[*DATASETS, {"domain": "hr", "dataset": "payroll", "version": 1}],
+        )
+        catalogue.refresh()
+        assert catalogue.exists("hr", "payroll")
+
+    def test_schema_changes_invalidate(self, catalogue, rapid, requests_mock: Mocker):
+        catalogue.exists("sales", "orders")
+        requests_mock.post(f"{RAPID_URL}/schema", status_code=200)
+        requests_mock.put(f"{RAPID_URL}/schema", status_code=200, json={})
+        rapid.create_schema(SCHEMA)
+        catalogue.exists("sales", "orders")
+        rapid.update_schema(SCHEMA)
+        catalogue.exists("sales", "orders")
+        assert requests_mock.call_count == 5
+        assert requests_mock.request_history[-1].path.endswith("/datasets")
+
+    def test_failed_schema_changes_do_not_invalidate(
+        self, catalogue, rapid, requests_mock: Mocker
+    ):
+        catalogue.exists("sales", "orders")
+        requests_mock.post(f"{RAPID_URL}/schema", status_code=400, json={})
+        with pytest.raises(SchemaCreateFailedException):
+            rapid.create_schema(SCHEMA)
+        catalogue.exists("sales", "orders")
+        assert requests_mock.call_count == 2
+        assert not rapid.hooks
@@ -0,0 +1,18 @@
+import subprocess
+import sys
+
+
+HEAVY_MODULES = ["pandas", "numpy", "pydantic", "pyarrow", "orjson", "zstandard"]
+
+
+class TestImport:
+    def test_import_does_not_load_heavy_dependencies(self):
+        code = (
+            "import sys\n"
+            "from rapid import Rapid, RapidAuth\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
@@ -1,7 +1,14 @@
 import pytest
 from pydantic import ValidationError
 
-from rapid.items.schema import Schema, SchemaMetadata, Column, Owner, SensitivityLevel
+from rapid.items.schema import (
+    Schema,
+    SchemaMetadata,
+    Column,
+    ColumnChangeType,
+    Owner,
+    SensitivityLevel,
+)
 
 
 DUMMY_COLUMNS = [
@@ -257,3 +264,101 @@ class TestSchema:
             ],
         }
         assert schema.dict() == expected_dict
+
+
+class TestSchemaDiff:
+    def test_diff_no_changes_ignores_order(self, schema):
+        diff = schema.diff(list(reversed(DUMMY_COLUMNS)))
+        assert not diff.has_changes
+        assert schema.are_columns_the_same(list(reversed(DUMMY_COLUMNS)))
+
+    def test_diff_added_and_removed(self, schema):
+        diff = schema.diff(
+            [
+                DUMMY_COLUMNS[0],
+                {"name": "column_c", "data_type": "Float64"},
+                {"name": "column_d", "data_type": "Float64", "allow_null": False},
+            ]
+        )
+        assert [change.name for change in diff.added] == ["column_c", "column_d"]
+        assert [change.breaking for change in diff.added] == [False, True]
+        assert [change.name for change in diff.removed] == ["column_b"]
+        assert diff.removed[0].old == DUMMY_COLUMNS[1]
+        assert diff.is_breaking
+
+    @pytest.mark.parametrize(
+        "old_type, new_type, breaking",
+        [
+            ("Int64", "Float64", False),
+            ("int32", "int64", False),
+            ("int", "bigint", False),
+            ("float", "double", False),
+            ("date", "string", False),
+            ("int64", "int64", False),
+            ("Int64", "int64", False),
+            ("Float64", "Int64", True),
+            ("int64", "int32", True),
+            ("int64", "float32", True),
+            ("object", "date", True),
+            ("boolean", "Int64", True),
+        ],
+    )
+    def test_diff_type_changes(self, old_type, new_type, breaking):
+        schema = Schema(
+            metadata=DUMMY_METADATA, columns=[Column(name="a", data_type=old_type)]
+        )
+        diff = schema.diff([Column(name="a", data_type=new_type)])
+        if old_type == new_type:
+            assert not diff.has_changes
+        else:
+            assert len(diff.type_changed) == 1
+            assert diff.type_changed[0].old.data_type == old_type
+            assert diff.is_breaking is breaking
+
+    def test_diff_nullability_partition_and_format(self):
+        schema = Schema(
+            metadata=DUMMY_METADATA,
+            columns=[
+                Column(name="a", data_type="Int64", allow_null=False),
+                Column(name="b", data_type="Int64"),
+                Column(name="c", data_type="date", format="%Y-%m-%d"),
+            ],
+        )
+        relaxed = schema.diff(
+            [
+                Column(name="a", data_type="Int64"),
+                Column(name="b", data_type="Int64"),
+                Column(name="c", data_type="date", format="%Y-%m-%d"),
+            ]
+        )
+        assert [change.change_type for change in relaxed.changes] == [
+            ColumnChangeType.NULLABILITY_CHANGED
+        ]
+        assert not relaxed.is_breaking
+
+        diff = schema.diff(
+            [
+                Column(name="a", data_type="Int64", allow_null=False),
+                Column(
+                    name="b", data_type="Int64", allow_null=False, partition_index=0
+                ),
+                Column(name="c", data_type="date", format="%d/%m/%Y"),
+            ]
+        )
+        assert [change.change_type for change in diff.changes] == [
+            ColumnChangeType.NULLABILITY_CHANGED,
+            ColumnChangeType.PARTITION_CHANGED,
+            ColumnChangeType.FORMAT_CHANGED,
+        ]
+        assert all(change.breaking for change in diff.changes)
+        assert diff.nullability_changed[0].name == "b"
+        assert diff.partition_changed[0].new.partition_index == 0
+        assert diff.format_changed[0].name == "c"
+
+    def test_diff_many_columns(self):
+        columns = [Column(name=f"column_{i}", data_type="Int64") for i in range(5000)]
+        schema = Schema(metadata=DUMMY_METADATA, columns=columns)
+        diff = schema.diff(
+            [*reversed(columns[1:]), Column(name="new", data_type="Int64")]
+        )
+        assert [change.name for change in diff.changes] == ["new", "column_0"]
@@ -4,7 +4,13 @@ from pandas import DataFrame
 from requests_mock import Mocker
 
 from rapid.items.schema import Owner, SchemaMetadata, SensitivityLevel, Column
-from rapid.patterns.data import upload_and_create_dataframe, update_schema_dataframe
+from rapid.patterns.data import (
+    upload_and_create_dataframe,
+    upload_dataframe_delta,
+    update_schema_dataframe,
+)
+from rapid.utils.manifest import UploadManifest
+from rapid.utils.serialise import spool_dataframe
 from rapid.exceptions import (
     ColumnNotDifferentException,
     DataFrameUploadValidationException,
@@ -78,9 +84,30 @@ class TestUtils:
         rapid.upload_dataframe = Mock()
         upload_and_create_dataframe(rapid, metadata, df)
 
-        rapid.upload_dataframe.assert_called_once_with(
-            metadata.domain, metadata.dataset, df
-        )
+        rapid.upload_dataframe.assert_called_once()
+        domain, dataset, payload = rapid.upload_dataframe.call_args.args
+        assert (domain, dataset) == (metadata.domain, metadata.dataset)
+        assert payload.df is df
+
+    def test_upload_and_create_dataframe_local_schema(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        create_schema = requests_mock.post(f"{RAPID_URL}/schema")
+        rapid.upload_dataframe = Mock()
+        upload_and_create_dataframe(rapid, metadata, df, local_schema=True)
+
+        assert create_schema.call_count == 1
+        assert [
+            column["name"] for column in create_schema.last_request.json()["columns"]
+        ] == [
+            "column_a",
+            "column_b",
+            "column_c",
+        ]
+        rapid.upload_dataframe.assert_called_once()
+        domain, dataset, payload = rapid.upload_dataframe.call_args.args
+        assert (domain, dataset) == (metadata.domain, metadata.dataset)
+        assert payload.df is df
 
     def test_upload_and_create_dataframe_fails(
         self, requests_mock: Mocker, rapid: Rapid
@@ -111,6 +138,45 @@ class TestUtils:
         upload_and_create_dataframe(rapid, metadata, df, upgrade_schema_on_fail=True)
         mocked_update_schema_dataframe.assert_called_once()
 
+    def test_upload_and_create_dataframe_serialises_once(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        generate = requests_mock.post(
+            f"{RAPID_URL}/schema/{metadata.sensitivity}/{metadata.domain}"
+            + f"/{metadata.dataset}/generate",
+            json={
+                **mock_response,
+                "columns": [
+                    {**column, "data_type": "string"}
+                    for column in mock_response["columns"]
+                ],
+            },
+        )
+        requests_mock.post(f"{RAPID_URL}/schema")
+        upload = requests_mock.post(
+            f"{RAPID_URL}/datasets/{metadata.domain}/{metadata.dataset}",
+            status_code=422,
+            json={"details": "Invalid schema"},
+        )
+        info = requests_mock.post(
+            f"{RAPID_URL}/datasets/{metadata.domain}/{metadata.dataset}/info",
+            json=mock_response,
+        )
+        update = requests_mock.put(f"{RAPID_URL}/schema", json={"dummy": "data"})
+
+        with patch(
+            "rapid.utils.serialise.spool_dataframe",
+            wraps=spool_dataframe,
+        ) as spool:
+            upload_and_create_dataframe(
+                rapid, metadata, df, upgrade_schema_on_fail=True
+            )
+
+        assert spool.call_count == 1
+        assert update.call_count == 1
+        for request in [generate, upload, info]:
+            assert df.to_csv(index=False).encode("utf-8") in request.last_request.body
+
     def test_update_schema_dataframe(self, requests_mock: Mocker, rapid: Rapid):
         new_columns = [
             Column(
@@ -140,7 +206,9 @@ class TestUtils:
             json=mock_response,
         )
         requests_mock.put(f"{RAPID_URL}/schema", json={"dummy": "data"})
-        update_schema_dataframe(rapid, metadata, df, new_columns)
+        diff = update_schema_dataframe(rapid, metadata, df, new_columns)
+        assert [change.name for change in diff.type_changed] == ["column_a"]
+        assert diff.is_breaking
 
     def test_update_schema_dataframe_fail(self, requests_mock: Mocker, rapid: Rapid):
         requests_mock.post(
@@ -150,3 +218,47 @@ class TestUtils:
         requests_mock.put(f"{RAPID_URL}/schema", json={"dummy": "data"})
         with pytest.raises(ColumnNotDifferentException):
             update_schema_dataframe(rapid, metadata, df, mock_response["columns"])
+
+    def test_upload_dataframe_delta(self, tmp_path, rapid: Rapid):
+        manifest = UploadManifest(str(tmp_path))
+        rapid.upload_dataframe = Mock()
+
+        assert (
+            upload_dataframe_delta(
+                rapid, manifest, "domain", "dataset", df, key_columns=["column_a"]
+            )
+            == 3
+        )
+        more = DataFrame(
+            {
+                "column_a": ["three", "four"],
+                "column_b": ["three", "four"],
+                "column_c": ["three", "four"],
+            }
+        )
+        assert (
+            upload_dataframe_delta(
+                rapid, manifest, "domain", "dataset", more, key_columns=["column_a"]
+            )
+            == 1
+        )
+        assert (
+            upload_dataframe_delta(
+                rapid, manifest, "domain", "dataset", df, key_columns=["column_a"]
+            )
+            == 0
+        )
+
+        assert rapid.upload_dataframe.call_count == 2
+        uploaded = rapid.upload_dataframe.call_args.args[2]
+        assert uploaded["column_a"].tolist() == ["four"]
+
+    def test_upload_dataframe_delta_records_nothing_on_failure(
+        self, tmp_path, rapid: Rapid
+    ):
+        manifest = UploadManifest(str(tmp_path))
+        rapid.upload_dataframe = Mock(side_effect=DataFrameUploadValidationException)
+
+        with pytest.raises(DataFrameUploadValidationException):
+            upload_dataframe_delta(rapid, manifest, "domain", "dataset", df)
+        assert manifest.rows("domain", "dataset") == 0
@@ -1,12 +1,29 @@
-from mock import Mock, call
+import gzip
+import os
+import threading
+import time
+
+from mock import MagicMock, Mock, call, patch
 from pandas import DataFrame
+import pyarrow as pa
+from pyarrow import feather
+import pyarrow.parquet as pq
 import pytest
+import requests
 from requests_mock import Mocker
 
-from rapid import Rapid
-from rapid.items.schema import Schema
+from rapid import Rapid, RapidAuth
+from rapid.items.query import Query, SQLQueryOrderBy
+from rapid.items.schema import Schema, UpdateBehaviour
+from rapid.utils.backoff import Backoff
+from rapid.utils.cache import DownloadCache
+from rapid.utils.constants import Compression, EventPhase, FileFormat, UploadFormat
+from rapid.utils.retry import RetryPolicy
+from rapid.utils.serialise import spool_dataframe
 from rapid.exceptions import (
+    DataFrameChunkUploadFailedException,
     DataFrameUploadFailedException,
+    DataFrameUploadValidationException,
     JobFailedException,
     SchemaGenerationFailedException,
     SchemaAlreadyExistsException,
@@ -14,8 +31,11 @@ from rapid.exceptions import (
     SchemaUpdateFailedException,
     UnableToFetchJobStatusException,
     DatasetInfoFailedException,
+    DatasetNotFoundException,
+    InvalidPaginationQueryException,
+    JobTimeoutException,
 )
-from .conftest import RAPID_URL, RAPID_TOKEN
+from .conftest import RAPID_CLIENT_ID, RAPID_URL, RAPID_TOKEN
 
 DUMMY_SCHEMA = {
     "metadata": {
@@ -47,6 +67,51 @@ DUMMY_SCHEMA = {
 
 
 class TestRapid:
+    def test_session_is_shared_with_auth(self):
+        auth = MagicMock()
+        rapid = Rapid(auth, pool_maxsize=32)
+
+        assert auth.session is rapid.session
+        assert rapid.session.get_adapter(RAPID_URL)._pool_maxsize == 32
+
+    def test_replaced_auth_session_is_closed(self, rapid_auth):
+        session = rapid_auth.session
+        session.close = Mock()
+        rapid = Rapid(rapid_auth)
+
+        session.close.assert_called_once()
+        assert rapid_auth.session is rapid.session
+
+    def test_provided_auth_session_is_not_closed(self):
+        session = MagicMock()
+        auth = RapidAuth(
+            RAPID_CLIENT_ID, "secret", RAPID_URL, session=session, lazy=True
+        )
+        Rapid(auth)
+
+        session.close.assert_not_called()
+
+    def test_context_manager_closes_owned_session(self):
+        rapid = Rapid(MagicMock())
+        rapid.session = MagicMock()
+        with rapid as client:
+            assert client is rapid
+        rapid.session.close.assert_called_once()
+
+    def test_close_does_not_close_provided_session(self):
+        session = MagicMock()
+        rapid = Rapid(MagicMock(), session=session)
+        rapid.close()
+        session.close.assert_not_called()
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_requests_use_session(self, requests_mock: Mocker, rapid: Rapid):
+        requests_mock.post(f"{RAPID_URL}/datasets", json={})
+        rapid.session = Mock(wraps=rapid.session)
+
+        rapid.list_datasets()
+        rapid.session.request.assert_called_once()
+
     @pytest.mark.usefixtures("rapid")
     def test_generate_headers(self, rapid: Rapid):
         expected = {"Authorization": f"Bearer {RAPID_TOKEN}"}
@@ -70,6 +135,63 @@ class TestRapid:
         res = rapid.fetch_job_progress(job_id)
         assert res == expected
 
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_request_emits_events_to_hooks(self, requests_mock: Mocker, rapid: Rapid):
+        events = []
+        rapid.hooks.register(events.append)
+        requests_mock.get(f"{RAPID_URL}/jobs/1234", json={"status": "SUCCESS"})
+
+        rapid.fetch_job_progress("1234")
+
+        token, request = events  # pylint: disable=unbalanced-tuple-unpacking
+        assert token.phase == EventPhase.TOKEN
+        assert request.phase == EventPhase.REQUEST
+        assert request.endpoint == "/jobs/{id}"
+        assert request.method == "GET"
+        assert request.status_code == 200
+        assert request.response_bytes == len(b'{"status": "SUCCESS"}')
+        assert request.job_id == "1234"
+        assert request.duration >= 0
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_dataframe_emits_decode_event(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        events = []
+        rapid.hooks.register(events.append)
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/test_domain/test_dataset/query",
+            json={"0": {"column1": "value1"}},
+        )
+
+        rapid.download_dataframe("test_domain", "test_dataset")
+
+        assert [event.phase for event in events] == [
+            EventPhase.TOKEN,
+            EventPhase.REQUEST,
+            EventPhase.DECODE,
+        ]
+        assert events[1].request_bytes == len(Query().json(exclude_none=True))
+        assert events[2].endpoint == "/datasets/{domain}/{dataset}/query"
+
+    @pytest.mark.usefixtures("rapid")
+    def test_job_outcome_and_serialise_emit_events(self, rapid: Rapid):
+        events = []
+        rapid.hooks.register(events.append)
+        rapid.fetch_job_progress = Mock(return_value={"status": "SUCCESS"})
+
+        rapid.wait_for_job_outcome("1234")
+        rapid.wait_for_jobs(["5678"])
+        _, content = rapid.convert_dataframe_for_file_upload(
+            DataFrame({"column_a": [1]})
+        )["file"]
+
+        job, other_job, serialise = events  # pylint: disable=unbalanced-tuple-unpacking
+        assert (job.phase, job.job_id) == (EventPhase.JOB, "1234")
+        assert (other_job.phase, other_job.job_id) == (EventPhase.JOB, "5678")
+        assert serialise.phase == EventPhase.SERIALISE
+        assert serialise.request_bytes == len(content)
+
     @pytest.mark.usefixtures("requests_mock", "rapid")
     def test_fetch_job_progress_fail(self, requests_mock: Mocker, rapid: Rapid):
         job_id = 1234
@@ -140,6 +262,286 @@ class TestRapid:
         assert res.shape == (3, 2)
         assert list(res.columns) == ["column1", "column2"]
 
+    @pytest.mark.parametrize("prefetch", [False, True])
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_iter_dataframe(self, requests_mock: Mocker, rapid: Rapid, prefetch: bool):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        queries = []
+
+        def query_page(request, _context):
+            query = request.json()
+            queries.append(query)
+            start = int(query["filter"].split(" > ")[1]) + 1 if "filter" in query else 0
+            end = min(start + int(query["limit"]), 10)
+            return {str(i): {"id": i, "value": f"value{i}"} for i in range(start, end)}
+
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}/query", json=query_page
+        )
+        query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+
+        pages = list(
+            rapid.iter_dataframe(domain, dataset, query, page_size=4, prefetch=prefetch)
+        )
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert pages[2]["id"].tolist() == [8, 9]
+        assert [query.get("filter") for query in queries] == [None, "id > 3", "id > 7"]
+        assert all(query["limit"] == "4" for query in queries)
+
+    @pytest.mark.usefixtures("rapid")
+    def test_iter_dataframe_respects_query_limit(self, rapid: Rapid):
+        rapid.download_dataframe = Mock(
+            side_effect=[
+                DataFrame({"id": ["a", "b"]}),
+                DataFrame({"id": ["c"]}),
+            ]
+        )
+        query = Query(
+            filter="value = 1",
+            order_by_columns=[SQLQueryOrderBy(column="id", direction="DESC")],
+            limit="3",
+        )
+
+        pages = list(rapid.iter_dataframe("domain", "dataset", query, page_size=2))
+        assert [len(page) for page in pages] == [2, 1]
+        second_query = rapid.download_dataframe.call_args_list[1][0][3]
+        assert second_query.filter == "(value = 1) AND id < 'b'"
+        assert second_query.limit == "1"
+
+    @pytest.mark.usefixtures("rapid")
+    def test_iter_dataframe_empty(self, rapid: Rapid):
+        rapid.download_dataframe = Mock(return_value=DataFrame())
+        query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+
+        assert not list(rapid.iter_dataframe("domain", "dataset", query))
+        rapid.download_dataframe.assert_called_once()
+
+    @pytest.mark.usefixtures("rapid")
+    def test_iter_dataframe_without_order_by(self, rapid: Rapid):
+        with pytest.raises(InvalidPaginationQueryException):
+            next(rapid.iter_dataframe("domain", "dataset", Query()))
+
+    @pytest.mark.usefixtures("rapid")
+    def test_iter_dataframe_key_not_selected(self, rapid: Rapid):
+        query = Query(
+            select_columns=["value"],
+            order_by_columns=[SQLQueryOrderBy(column="id")],
+        )
+        with pytest.raises(InvalidPaginationQueryException):
+            next(rapid.iter_dataframe("domain", "dataset", query))
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_arrow(self, requests_mock: Mocker, rapid: Rapid):
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/test_domain/test_dataset/query",
+            json={
+                "0": {"id": 1, "date": "2023-01-02", "value": None},
+                "1": {"id": 2, "date": "2023-01-03", "value": 1.5},
+            },
+        )
+        schema = Schema(**DUMMY_SCHEMA)
+        schema.columns[0].name, schema.columns[0].data_type = "id", "int"
+        schema.columns[1].name, schema.columns[1].data_type = "date", "date"
+        schema.columns[1].format = "%Y-%m-%d"
+
+        table = rapid.download_arrow("test_domain", "test_dataset", schema=schema)
+        assert table.column_names == ["id", "date", "value"]
+        assert table.column("id").to_pylist() == [1, 2]
+        assert table.schema.field("date").type == pa.timestamp("ns")
+        assert table.column("value").to_pylist() == [None, 1.5]
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_arrow_not_found(self, requests_mock: Mocker, rapid: Rapid):
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/test_domain/test_dataset/query",
+            status_code=400,
+            json={"details": "not found"},
+        )
+        with pytest.raises(DatasetNotFoundException):
+            rapid.download_arrow("test_domain", "test_dataset")
+
+    def mock_paged_query(self, requests_mock: Mocker, rows: int = 10):
+        queries = []
+
+        def query_page(request, _context):
+            query = request.json()
+            queries.append(query)
+            start = int(query["filter"].split(" > ")[1]) + 1 if "filter" in query else 0
+            end = min(start + int(query.get("limit", rows)), rows)
+            return {str(i): {"id": i, "value": i / 2} for i in range(start, end)}
+
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/test_domain/test_dataset/query", json=query_page
+        )
+        return queries
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_iter_arrow(self, requests_mock: Mocker, rapid: Rapid):
+        queries = self.mock_paged_query(requests_mock)
+        query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+
+        tables = list(
+            rapid.iter_arrow("test_domain", "test_dataset", query, page_size=4)
+        )
+        assert [table.num_rows for table in tables] == [4, 4, 2]
+        assert [query.get("filter") for query in queries] == [None, "id > 3", "id > 7"]
+
+    @pytest.mark.parametrize(
+        "file_format, read",
+        [
+            (FileFormat.PARQUET, pq.read_table),
+            (FileFormat.FEATHER, feather.read_table),
+        ],
+    )
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_to_file_in_pages(
+        self, requests_mock: Mocker, rapid: Rapid, tmp_path, file_format, read
+    ):
+        queries = self.mock_paged_query(requests_mock)
+        path = str(tmp_path / "data")
+        query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+
+        rows = rapid.download_to_file(
+            "test_domain", "test_dataset", path, file_format, query, chunk_rows=4
+        )
+        assert rows == 10
+        assert len(queries) == 3
+        assert (
+            read(path)
+            .to_pandas()
+            .equals(DataFrame({"id": range(10), "value": [i / 2 for i in range(10)]}))
+        )
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_to_file_without_order_by(
+        self, requests_mock: Mocker, rapid: Rapid, tmp_path
+    ):
+        queries = self.mock_paged_query(requests_mock)
+        path = str(tmp_path / "data.parquet")
+
+        assert (
+            rapid.download_to_file("test_domain", "test_dataset", path, chunk_rows=4)
+            == 10
+        )
+        assert len(queries) == 1
+        assert pq.ParquetFile(path).num_row_groups == 3
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_to_file_widens_page_types(
+        self, requests_mock: Mocker, rapid: Rapid, tmp_path
+    ):
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/test_domain/test_dataset/query",
+            [
+                {"json": {"0": {"id": 0, "name": None}, "1": {"id": 1, "name": None}}},
+                {"json": {"2": {"id": 2, "name": "c"}, "3": {"id": 3.5, "name": "d"}}},
+                {"json": {}},
+            ],
+        )
+        path = str(tmp_path / "data.parquet")
+        query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+
+        rows = rapid.download_to_file(
+            "test_domain", "test_dataset", path, query=query, chunk_rows=2
+        )
+        assert rows == 4
+        assert pq.read_table(path).to_pydict() == {
+            "id": [0, 1, 2, 3.5],
+            "name": [None, None, "c", "d"],
+        }
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_to_file_removes_partial_file(
+        self, requests_mock: Mocker, rapid: Rapid, tmp_path
+    ):
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/test_domain/test_dataset/query",
+            [
+                {"json": {"0": {"id": 0}, "1": {"id": 1}}},
+                {"status_code": 400, "json": {"details": "failed"}},
+            ],
+        )
+        path = str(tmp_path / "data.parquet")
+        query = Query(order_by_columns=[SQLQueryOrderBy(column="id")])
+
+        with pytest.raises(DatasetNotFoundException):
+            rapid.download_to_file(
+                "test_domain", "test_dataset", path, query=query, chunk_rows=2
+            )
+        assert not os.path.exists(path)
+
+    def test_pagination_filter_escapes_strings(self):
+        order_by = SQLQueryOrderBy(column="name")
+        assert Rapid._pagination_filter(None, order_by, "o'neil") == "name > 'o''neil'"
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_dataframe_from_cache(
+        self, requests_mock: Mocker, rapid: Rapid, tmp_path
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        rapid.cache = DownloadCache(str(tmp_path))
+        mock = requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}/query",
+            json={"0": {"column1": "value1"}, "1": {"column1": "value2"}},
+        )
+
+        first = rapid.download_dataframe(domain, dataset)
+        second = rapid.download_dataframe(domain, dataset)
+        assert mock.call_count == 1
+        assert second.equals(first)
+
+        rapid.download_dataframe(domain, dataset, query=Query(limit="1"))
+        assert mock.call_count == 2
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_invalidates_cache(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        rapid.cache = Mock()
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}",
+            json={"details": {"job_id": 1234}},
+            status_code=202,
+        )
+
+        rapid.upload_dataframe(domain, dataset, DataFrame(), wait_to_complete=False)
+        rapid.cache.invalidate.assert_called_once_with(domain, dataset)
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_dataframe_not_cached_until_upload_job_settles(
+        self, requests_mock: Mocker, rapid: Rapid, tmp_path
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        rapid.cache = DownloadCache(str(tmp_path))
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}",
+            json={"details": {"job_id": "1234"}},
+            status_code=202,
+        )
+        query = requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}/query",
+            [
+                {"json": {"0": {"column1": "old"}}},
+                {"json": {"0": {"column1": "new"}}},
+            ],
+        )
+        requests_mock.get(f"{RAPID_URL}/jobs/1234", json={"status": "SUCCESS"})
+
+        job_id = rapid.upload_dataframe(
+            domain, dataset, DataFrame({"column1": ["new"]}), wait_to_complete=False
+        )
+        assert rapid.download_dataframe(domain, dataset)["column1"][0] == "old"
+        rapid.wait_for_job_outcome(job_id)
+
+        assert rapid.download_dataframe(domain, dataset)["column1"][0] == "new"
+        assert rapid.download_dataframe(domain, dataset)["column1"][0] == "new"
+        assert query.call_count == 2
+
     @pytest.mark.usefixtures("requests_mock", "rapid")
     def test_upload_dataframe_success_after_waiting(
         self, requests_mock: Mocker, rapid: Rapid
@@ -180,6 +582,374 @@ class TestRapid:
         assert res == job_id
         rapid.convert_dataframe_for_file_upload.assert_called_once_with(df)
 
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_retries_with_serialised_file(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        df = DataFrame({"column_a": [1, 2]})
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}",
+            [
+                {"status_code": 503, "json": {"details": "unavailable"}},
+                {
+                    "status_code": 429,
+                    "json": {"details": "slow down"},
+                    "headers": {"Retry-After": "3"},
+                },
+                {"status_code": 202, "json": {"details": {"job_id": 1234}}},
+            ],
+        )
+        events = []
+        rapid.hooks.register(events.append)
+        rapid.retry = RetryPolicy(backoff=Backoff(initial=1, jitter=0))
+
+        with patch.object(DataFrame, "to_csv", wraps=df.to_csv) as to_csv, patch(
+            "rapid.rapid.time.sleep"
+        ) as sleep:
+            res = rapid.upload_dataframe(domain, dataset, df, wait_to_complete=False)
+
+        assert res == 1234
+        assert to_csv.call_count == 1
+        assert sleep.call_args_list == [call(1), call(3)]
+        bodies = [request.body for request in requests_mock.request_history]
+        assert bodies[0] == bodies[1] == bodies[2]
+        retries = [event for event in events if event.phase == EventPhase.RETRY]
+        assert [(event.duration, event.status_code) for event in retries] == [
+            (1, 503),
+            (3, 429),
+        ]
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_does_not_retry_gateway_errors(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        mock = requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/dataset",
+            status_code=502,
+            json={"details": "bad gateway"},
+        )
+        rapid.retry = RetryPolicy(backoff=Backoff(initial=0))
+
+        with pytest.raises(DataFrameUploadFailedException):
+            rapid.upload_dataframe("domain", "dataset", DataFrame({"column_a": [1]}))
+        assert mock.call_count == 1
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_streams_spooled_file(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        df = DataFrame({"column_a": range(100)})
+        rapid.upload_memory_limit = 10
+        rapid.retry = RetryPolicy(backoff=Backoff(initial=0))
+        uploaded = []
+
+        def upload(request, context):
+            uploaded.append(request.body.read())
+            context.status_code = 503 if len(uploaded) == 1 else 202
+            return {"details": {"job_id": 1234}}
+
+        requests_mock.post(f"{RAPID_URL}/datasets/{domain}/{dataset}", json=upload)
+        convert = rapid.convert_dataframe_for_file_upload
+        files = []
+
+        def convert_and_keep(df):
+            converted = convert(df)
+            files.append(converted["file"][1])
+            return converted
+
+        rapid.convert_dataframe_for_file_upload = convert_and_keep
+
+        res = rapid.upload_dataframe(domain, dataset, df, wait_to_complete=False)
+
+        assert res == 1234
+        assert uploaded[0] == uploaded[1]
+        assert df.to_csv(index=False).encode() in uploaded[0]
+        assert int(requests_mock.last_request.headers["Content-Length"]) == len(
+            uploaded[0]
+        )
+        assert files[0].closed
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_streams_compressed_file(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        df = DataFrame({"column_a": range(100)})
+        rapid.upload_memory_limit = 10
+        rapid.compression = Compression.GZIP
+        uploaded = []
+
+        def upload(request, context):
+            uploaded.append(request.body.read())
+            context.status_code = 202
+            return {"details": {"job_id": 1234}}
+
+        requests_mock.post(f"{RAPID_URL}/datasets/{domain}/{dataset}", json=upload)
+
+        rapid.upload_dataframe(domain, dataset, df, wait_to_complete=False)
+        assert df.to_csv(index=False).encode() in gzip.decompress(uploaded[0])
+        assert requests_mock.last_request.headers["Content-Encoding"] == "gzip"
+
+    def test_payload_is_reused_across_uploads_and_retries(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        df = DataFrame({"column_a": range(100)})
+        rapid.upload_memory_limit = 10
+        rapid.retry = RetryPolicy(backoff=Backoff(initial=0))
+        uploaded = []
+
+        def upload(request, context):
+            uploaded.append(request.body.read())
+            context.status_code = 503 if len(uploaded) == 1 else 202
+            return {"details": {"job_id": 1234}}
+
+        def info(request, _context):
+            uploaded.append(request.body.read())
+            return {"columns": []}
+
+        upload_matcher = requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}", json=upload
+        )
+        info_matcher = requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}/info", json=info
+        )
+
+        with patch(
+            "rapid.utils.serialise.spool_dataframe",
+            wraps=spool_dataframe,
+        ) as spool:
+            with rapid.prepare_payload(df) as payload:
+                rapid.upload_dataframe(domain, dataset, payload, wait_to_complete=False)
+                rapid.generate_info(payload, domain, dataset)
+                assert not payload.content.closed
+            assert payload.content.closed
+
+        assert spool.call_count == 1
+        assert upload_matcher.call_count == 2
+        assert info_matcher.call_count == 1
+        assert len(uploaded) == 3
+        for body in uploaded:
+            assert df.to_csv(index=False).encode() in body
+
+    def test_payload_chunks_and_samples_the_dataframe(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        df = DataFrame({"column_a": range(1000)})
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/dataset",
+            json={"details": {"job_id": 1234}},
+            status_code=202,
+        )
+        info = requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/dataset/info", json={"columns": []}
+        )
+        with rapid.prepare_payload(df) as payload:
+            job_ids = rapid.upload_dataframe(
+                "domain",
+                "dataset",
+                payload,
+                wait_to_complete=False,
+                chunk_rows=500,
+                update_behaviour="APPEND",
+            )
+            rapid.generate_info(payload, "domain", "dataset", sample=10)
+        assert job_ids == [1234, 1234]
+        assert df.to_csv(index=False).encode() not in info.last_request.body
+
+    def test_upload_many_reports_every_upload(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        df = DataFrame({"column_a": range(10)})
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/one",
+            json={"details": {"job_id": "1"}},
+            status_code=202,
+        )
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/two",
+            json={"details": "Invalid schema"},
+            status_code=422,
+        )
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/three",
+            json={"details": {"job_id": "3"}},
+            status_code=202,
+        )
+        rapid.fetch_job_progress = Mock(
+            side_effect=lambda _id: {"status": "SUCCESS" if _id == "1" else "FAILED"}
+        )
+
+        report = rapid.upload_many(
+            [
+                ("domain", "one", df),
+                ("domain", "two", df),
+                ("domain", "three", rapid.prepare_payload(df)),
+            ],
+            max_workers=2,
+        )
+
+        assert [result["dataset"] for result in report] == ["one", "two", "three"]
+        assert [result["status"] for result in report] == [
+            "SUCCESS",
+            "ERROR",
+            "FAILED",
+        ]
+        assert report[0]["job_id"] == "1"
+        assert report[0]["bytes"] == len(df.to_csv(index=False))
+        assert report[2]["progress"] == {"status": "FAILED"}
+        assert isinstance(report[1]["error"], DataFrameUploadValidationException)
+
+    def test_upload_many_without_waiting_and_timeout(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        df = DataFrame({"column_a": range(10)})
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/one",
+            json={"details": {"job_id": "1"}},
+            status_code=202,
+        )
+        rapid.fetch_job_progress = Mock(return_value={"status": "IN PROGRESS"})
+
+        report = rapid.upload_many([("domain", "one", df)], wait_to_complete=False)
+        assert report[0]["status"] == "SUBMITTED"
+        rapid.fetch_job_progress.assert_not_called()
+
+        report = rapid.upload_many([("domain", "one", df)], timeout=0)
+        assert report[0]["status"] == "TIMEOUT"
+        assert isinstance(report[0]["error"], JobTimeoutException)
+
+    def test_upload_many_bounds_inflight_bytes(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        payloads = [
+            rapid.prepare_payload(DataFrame({"column_a": range(1000)}))
+            for _ in range(6)
+        ]
+        size = payloads[0].size
+        inflight = []
+        peak = []
+        lock = threading.Lock()
+
+        def upload(_request, context):
+            with lock:
+                inflight.append(1)
+                peak.append(len(inflight))
+            time.sleep(0.01)
+            with lock:
+                inflight.pop()
+            context.status_code = 202
+            return {"details": {"job_id": "1"}}
+
+        requests_mock.post(f"{RAPID_URL}/datasets/domain/dataset", json=upload)
+
+        report = rapid.upload_many(
+            [("domain", "dataset", payload) for payload in payloads],
+            max_workers=6,
+            max_inflight_bytes=2 * size,
+            wait_to_complete=False,
+        )
+        assert [result["status"] for result in report] == ["SUBMITTED"] * 6
+        assert max(peak) <= 2
+
+    def test_download_dataframe_compact(self, requests_mock: Mocker, rapid: Rapid):
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/dataset/query",
+            json={
+                "0": {"column_a": 1, "column_b": "a"},
+                "1": {"column_a": 2, "column_b": "a"},
+                "2": {"column_a": None, "column_b": "b"},
+                "3": {"column_a": 4, "column_b": "a"},
+            },
+        )
+        schema = Schema(
+            **{
+                **DUMMY_SCHEMA,
+                "columns": [
+                    {"name": "column_a", "data_type": "Int64"},
+                    {"name": "column_b", "data_type": "object"},
+                ],
+            }
+        )
+
+        df = rapid.download_dataframe("domain", "dataset", schema=schema, compact=True)
+
+        assert str(df["column_a"].dtype) == "Int8"
+        assert str(df["column_b"].dtype) == "category"
+        assert df.attrs["memory_usage"]["saved"] > 0
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_download_dataframe_schema_decides_dtypes(
+        self, requests_mock: Mocker, rapid: Rapid, tmp_path
+    ):
+        rapid.cache = DownloadCache(str(tmp_path))
+        mock = requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/dataset/query",
+            json={
+                "0": {"zip": "00123", "count": "1"},
+                "1": {"zip": "00456", "count": "2"},
+            },
+        )
+        schema = Schema(
+            **{**DUMMY_SCHEMA, "columns": [{"name": "zip", "data_type": "string"}]}
+        )
+
+        for _ in range(2):
+            df = rapid.download_dataframe("domain", "dataset", schema=schema)
+            assert df["zip"].tolist() == ["00123", "00456"]
+            assert str(df["count"].dtype) == "int64"
+        compact = rapid.download_dataframe(
+            "domain", "dataset", schema=schema, compact=True
+        )
+        assert compact["zip"].astype(str).tolist() == ["00123", "00456"]
+        assert mock.call_count == 1
+        assert (
+            str(rapid.download_dataframe("domain", "dataset")["zip"].dtype) == "int64"
+        )
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_request_retries_connection_errors(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        requests_mock.post(
+            f"{RAPID_URL}/datasets",
+            [{"exc": requests.ConnectionError}, {"json": [{"dataset": "a"}]}],
+        )
+        with patch("rapid.rapid.time.sleep"):
+            assert rapid.list_datasets() == [{"dataset": "a"}]
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_request_gives_up_after_max_attempts(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        requests_mock.get(
+            f"{RAPID_URL}/jobs/1234", status_code=503, json={"details": "unavailable"}
+        )
+        rapid.retry = RetryPolicy(max_attempts=2)
+
+        with patch("rapid.rapid.time.sleep") as sleep:
+            with pytest.raises(UnableToFetchJobStatusException):
+                rapid.fetch_job_progress("1234")
+        assert requests_mock.call_count == 2
+        assert sleep.call_count == 1
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_request_raises_connection_error_once_retries_are_exhausted(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        requests_mock.post(f"{RAPID_URL}/datasets", exc=requests.ConnectionError)
+        rapid.retry = RetryPolicy(max_attempts=1)
+
+        with pytest.raises(requests.ConnectionError):
+            rapid.list_datasets()
+        assert requests_mock.call_count == 1
+
     @pytest.mark.usefixtures("requests_mock", "rapid")
     def test_upload_dataframe_failure(self, requests_mock: Mocker, rapid: Rapid):
         domain = "test_domain"
@@ -197,6 +967,317 @@ class TestRapid:
             rapid.upload_dataframe(domain, dataset, df, wait_to_complete=False)
             rapid.convert_dataframe_for_file_upload.assert_called_once_with(df)
 
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_in_chunks(self, requests_mock: Mocker, rapid: Rapid):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        df = DataFrame({"column_a": range(10)})
+        uploaded = []
+
+        def accept_upload(request, context):
+            uploaded.append(request.body)
+            context.status_code = 202
+            return {"details": {"job_id": f"job-{len(uploaded)}"}}
+
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}", json=accept_upload
+        )
+        rapid.wait_for_jobs = Mock(
+            side_effect=lambda job_ids: {
+                job_id: {"status": "SUCCESS"} for job_id in job_ids
+            }
+        )
+
+        res = rapid.upload_dataframe(
+            domain, dataset, df, chunk_rows=4, max_workers=2, update_behaviour="APPEND"
+        )
+        assert res == "Success"
+        assert len(uploaded) == 3
+        assert sorted(rapid.wait_for_jobs.call_args[0][0]) == [
+            "job-1",
+            "job-2",
+            "job-3",
+        ]
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_in_chunks_no_waiting(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        df = DataFrame({"column_a": range(10)})
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}",
+            json={"details": {"job_id": "job"}},
+            status_code=202,
+        )
+        rapid.wait_for_jobs = Mock()
+
+        res = rapid.upload_dataframe(
+            domain,
+            dataset,
+            df,
+            wait_to_complete=False,
+            chunk_rows=5,
+            update_behaviour="APPEND",
+        )
+        assert res == ["job", "job"]
+        rapid.wait_for_jobs.assert_not_called()
+
+    @pytest.mark.usefixtures("rapid")
+    def test_upload_dataframe_in_chunks_aggregates_failures(self, rapid: Rapid):
+        df = DataFrame({"column_a": range(9)})
+        rapid._submit_upload = Mock(
+            side_effect=[
+                "job-1",
+                DataFrameUploadFailedException("Upload failed", {}),
+                "job-3",
+            ]
+        )
+        rapid.wait_for_jobs = Mock(
+            return_value={
+                "job-1": {"status": "SUCCESS"},
+                "job-3": {"status": "FAILED"},
+            }
+        )
+
+        with pytest.raises(DataFrameChunkUploadFailedException) as exc_info:
+            rapid.upload_dataframe(
+                "domain",
+                "dataset",
+                df,
+                chunk_rows=3,
+                max_workers=1,
+                update_behaviour="APPEND",
+            )
+
+        assert set(exc_info.value.data["failures"]) == {1, 2}
+        assert isinstance(exc_info.value.data["failures"][2], JobFailedException)
+        assert exc_info.value.data["job_ids"] == ["job-1", "job-3"]
+
+    @pytest.mark.usefixtures("rapid")
+    def test_upload_dataframe_in_chunks_overwrite(self, rapid: Rapid):
+        df = DataFrame({"column_a": range(10)})
+        rapid._submit_upload = Mock()
+
+        with pytest.raises(DataFrameUploadValidationException):
+            rapid.upload_dataframe(
+                "domain",
+                "dataset",
+                df,
+                chunk_rows=5,
+                update_behaviour=UpdateBehaviour.OVERWRITE,
+            )
+        rapid._submit_upload.assert_not_called()
+
+    @pytest.mark.usefixtures("rapid")
+    def test_upload_dataframe_in_chunks_requires_update_behaviour(self, rapid: Rapid):
+        df = DataFrame({"column_a": range(10)})
+        rapid._submit_upload = Mock()
+
+        with pytest.raises(DataFrameUploadValidationException):
+            rapid.upload_dataframe("domain", "dataset", df, chunk_rows=5)
+        rapid._submit_upload.assert_not_called()
+
+    @pytest.mark.usefixtures("rapid")
+    def test_upload_dataframe_smaller_than_chunk(self, rapid: Rapid):
+        df = DataFrame({"column_a": range(3)})
+        rapid._submit_upload = Mock(return_value="job")
+        rapid.wait_for_job_outcome = Mock()
+
+        res = rapid.upload_dataframe(
+            "domain",
+            "dataset",
+            df,
+            chunk_rows=5,
+            update_behaviour=UpdateBehaviour.OVERWRITE,
+        )
+        assert res == "Success"
+        rapid.wait_for_job_outcome.assert_called_once_with("job")
+
+    @pytest.mark.usefixtures("rapid")
+    def test_wait_for_jobs(self, rapid: Rapid):
+        rapid.fetch_job_progress = Mock(
+            side_effect=[
+                {"status": "IN PROGRESS"},
+                {"status": "FAILED"},
+                {"status": "SUCCESS"},
+            ]
+        )
+        callback = Mock()
+
+        res = rapid.wait_for_jobs(
+            ["job-1", "job-2"], backoff=Backoff(initial=0.01), callback=callback
+        )
+        assert res == {"job-1": {"status": "SUCCESS"}, "job-2": {"status": "FAILED"}}
+        assert rapid.fetch_job_progress.call_args_list == [
+            call("job-1"),
+            call("job-2"),
+            call("job-1"),
+        ]
+        assert callback.call_args_list == [
+            call("job-2", {"status": "FAILED"}),
+            call("job-1", {"status": "SUCCESS"}),
+        ]
+
+    @pytest.mark.usefixtures("rapid")
+    def test_wait_for_jobs_backs_off(self, rapid: Rapid):
+        rapid.fetch_job_progress = Mock(
+            side_effect=[{"status": "IN PROGRESS"}] * 3 + [{"status": "SUCCESS"}]
+        )
+        backoff = Backoff()
+        backoff.delay = Mock(return_value=0)
+
+        rapid.wait_for_jobs(["job-1"], backoff=backoff)
+        assert backoff.delay.call_args_list == [call(0), call(1), call(2)]
+
+    @pytest.mark.usefixtures("rapid")
+    def test_wait_for_jobs_timeout(self, rapid: Rapid):
+        rapid.fetch_job_progress = Mock(return_value={"status": "IN PROGRESS"})
+
+        with pytest.raises(JobTimeoutException) as exc_info:
+            rapid.wait_for_jobs(
+                ["job-1", "job-2"], timeout=0.05, backoff=Backoff(initial=0.01)
+            )
+        assert exc_info.value.data == ["job-1", "job-2"]
+
+    @pytest.mark.usefixtures("rapid")
+    def test_watch_jobs(self, rapid: Rapid):
+        rapid.fetch_job_progress = Mock(
+            side_effect=[
+                {"status": "IN PROGRESS"},
+                {"status": "FAILED"},
+                {"status": "SUCCESS"},
+            ]
+        )
+
+        futures = rapid.watch_jobs(["job-1", "job-2"], backoff=Backoff(initial=0.01))
+        assert futures["job-1"].result(timeout=1) == {"status": "SUCCESS"}
+        with pytest.raises(JobFailedException):
+            futures["job-2"].result(timeout=1)
+
+    @pytest.mark.usefixtures("rapid")
+    def test_watch_jobs_timeout(self, rapid: Rapid):
+        rapid.fetch_job_progress = Mock(return_value={"status": "IN PROGRESS"})
+
+        futures = rapid.watch_jobs(
+            ["job-1"], timeout=0.02, backoff=Backoff(initial=0.01)
+        )
+        with pytest.raises(JobTimeoutException):
+            futures["job-1"].result(timeout=1)
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_compressed(self, requests_mock: Mocker, rapid: Rapid):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        rapid.compression = Compression.GZIP
+        mock = requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}",
+            json={"details": {"job_id": 1234}},
+            status_code=202,
+        )
+
+        rapid.upload_dataframe(
+            domain, dataset, DataFrame({"column_a": [1, 2]}), wait_to_complete=False
+        )
+        request = mock.last_request
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        assert b"column_a\n1\n2\n" in gzip.decompress(request.body)
+
+        rapid.upload_dataframe(domain, dataset, DataFrame(), wait_to_complete=False)
+        assert mock.call_count == 2
+        assert rapid._compression_accepted
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_compression_rejected(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        rapid.compression = Compression.GZIP
+
+        def upload(request, context):
+            if "Content-Encoding" in request.headers:
+                context.status_code = 415
+                return {"details": "Unsupported media type"}
+            context.status_code = 202
+            return {"details": {"job_id": 1234}}
+
+        mock = requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}", json=upload
+        )
+
+        res = rapid.upload_dataframe(
+            domain, dataset, DataFrame({"column_a": [1]}), wait_to_complete=False
+        )
+        assert res == 1234
+        assert mock.call_count == 2
+        assert rapid.compression is None
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    @pytest.mark.parametrize(
+        "status_code, details",
+        [(400, "There was an error parsing the body"), (422, "Field required: file")],
+    )
+    def test_upload_dataframe_compressed_body_not_read(
+        self, requests_mock: Mocker, rapid: Rapid, status_code, details
+    ):
+        rapid.compression = Compression.GZIP
+        mock = requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/dataset",
+            [
+                {"status_code": status_code, "json": {"details": details}},
+                {"status_code": 202, "json": {"details": {"job_id": 1234}}},
+            ],
+        )
+
+        res = rapid.upload_dataframe(
+            "domain", "dataset", DataFrame({"column_a": [1]}), wait_to_complete=False
+        )
+        assert res == 1234
+        assert "Content-Encoding" not in mock.last_request.headers
+        assert rapid.compression is None
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_compressed_schema_error(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        rapid.compression = Compression.GZIP
+        mock = requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/dataset",
+            status_code=422,
+            json={"details": "Incorrect schema"},
+        )
+
+        with pytest.raises(DataFrameUploadValidationException):
+            rapid.upload_dataframe("domain", "dataset", DataFrame({"column_a": [1]}))
+        assert mock.call_count == 2
+        assert rapid.compression == Compression.GZIP
+        assert not rapid._compression_accepted
+
+        rapid._compression_accepted = True
+        with pytest.raises(DataFrameUploadValidationException):
+            rapid.upload_dataframe("domain", "dataset", DataFrame({"column_a": [1]}))
+        assert mock.call_count == 3
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_upload_dataframe_compressed_server_error_not_accepted(
+        self, requests_mock: Mocker, rapid: Rapid
+    ):
+        rapid.compression = Compression.GZIP
+        rapid.retry = RetryPolicy(max_attempts=1)
+        mock = requests_mock.post(
+            f"{RAPID_URL}/datasets/domain/dataset",
+            status_code=500,
+            json={"details": "error"},
+        )
+
+        with pytest.raises(DataFrameUploadFailedException):
+            rapid.upload_dataframe("domain", "dataset", DataFrame({"column_a": [1]}))
+        assert mock.call_count == 1
+        assert not rapid._compression_accepted
+
     @pytest.mark.usefixtures("requests_mock", "rapid")
     def test_generate_info_success(self, requests_mock: Mocker, rapid: Rapid):
         domain = "test_domain"
@@ -212,6 +1293,34 @@ class TestRapid:
         res = rapid.generate_info(df, domain, dataset)
         assert res == mocked_response
 
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_generate_info_sample(self, requests_mock: Mocker, rapid: Rapid):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        df = DataFrame({"column_a": range(100)})
+        requests_mock.post(
+            f"{RAPID_URL}/datasets/{domain}/{dataset}/info", json={}, status_code=200
+        )
+        rapid.convert_dataframe_for_file_upload = Mock(return_value={})
+
+        rapid.generate_info(df, domain, dataset, sample=10)
+        assert len(rapid.convert_dataframe_for_file_upload.call_args[0][0]) == 10
+
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_generate_schema_sample(self, requests_mock: Mocker, rapid: Rapid):
+        domain = "test_domain"
+        dataset = "test_dataset"
+        sensitivity = "PUBLIC"
+        df = DataFrame({"column_a": range(20000)})
+        requests_mock.post(
+            f"{RAPID_URL}/schema/{sensitivity}/{domain}/{dataset}/generate",
+            json=DUMMY_SCHEMA,
+        )
+        rapid.convert_dataframe_for_file_upload = Mock(return_value={})
+
+        rapid.generate_schema(df, domain, dataset, sensitivity, sample=True)
+        assert len(rapid.convert_dataframe_for_file_upload.call_args[0][0]) == 10000
+
     @pytest.mark.usefixtures("requests_mock", "rapid")
     def test_generate_info_failure(self, requests_mock: Mocker, rapid: Rapid):
         domain = "test_domain"
@@ -236,6 +1345,15 @@ class TestRapid:
         assert filename.startswith("rapid-sdk") and filename.endswith(".csv")
         assert data == "\n"
 
+    @pytest.mark.usefixtures("rapid")
+    def test_convert_dataframe_for_file_upload_parquet(self, rapid: Rapid):
+        rapid.upload_format = UploadFormat.PARQUET
+        res = rapid.convert_dataframe_for_file_upload(DataFrame({"column_a": [1]}))
+        filename = res["file"][0]
+        data = res["file"][1]
+        assert filename.startswith("rapid-sdk") and filename.endswith(".parquet")
+        assert data.startswith(b"PAR1")
+
     @pytest.mark.usefixtures("requests_mock", "rapid")
     def test_generate_schema_success(self, requests_mock: Mocker, rapid: Rapid):
         domain = "test_domain"
@@ -281,6 +1399,14 @@ class TestRapid:
         assert res.columns[0].name == "column_a"
         assert res.columns[1].name == "column_b"
 
+    @pytest.mark.usefixtures("requests_mock", "rapid")
+    def test_generate_schema_local(self, requests_mock: Mocker, rapid: Rapid):
+        df = DataFrame({"column_a": [1, 2], "column_b": ["one", "two"]})
+
+        res = rapid.generate_schema(df, "domain", "dataset", "PUBLIC", local=True)
+        assert [column.data_type for column in res.columns] == ["Int64", "object"]
+        assert not requests_mock.called
+
     @pytest.mark.usefixtures("requests_mock", "rapid")
     def test_generate_schema_failure(self, requests_mock: Mocker, rapid: Rapid):
         domain = "test_domain"
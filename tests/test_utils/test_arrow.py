@@ -0,0 +1,147 @@
+import os
+
+import pyarrow as pa
+from pyarrow import feather
+import pyarrow.parquet as pq
+import pytest
+
+from rapid.items.schema import Column, Owner, Schema, SchemaMetadata
+from rapid.utils.arrow import (
+    ArrowFileWriter,
+    apply_schema_types,
+    table_from_index_json,
+)
+from rapid.utils.constants import FileFormat
+
+
+def schema(*columns) -> Schema:
+    return Schema(
+        metadata=SchemaMetadata(
+            domain="domain",
+            dataset="dataset",
+            sensitivity="PUBLIC",
+            owners=[Owner(name="owner", email="owner@email.com")],
+        ),
+        columns=[
+            Column(name=name, data_type=data_type, format=_format, allow_null=True)
+            for name, data_type, _format in columns
+        ],
+    )
+
+
+class TestTableFromIndexJson:
+    def test_empty(self):
+        assert table_from_index_json({}).num_rows == 0
+
+    def test_infers_types(self):
+        table = table_from_index_json(
+            {"0": {"a": 1, "b": "x"}, "1": {"a": None, "b": "y"}}
+        )
+        assert table.schema == pa.schema([("a", pa.int64()), ("b", pa.string())])
+        assert table.column("a").to_pylist() == [1, None]
+
+    def test_applies_schema(self):
+        table = table_from_index_json(
+            {"0": {"a": 1, "b": "1.5", "c": "02/01/2023", "d": "text"}},
+            schema(
+                ("a", "Float64", None),
+                ("b", "double", None),
+                ("c", "date", "%d/%m/%Y"),
+                ("d", "object", None),
+                ("missing", "int", None),
+            ),
+        )
+        assert table.schema.types == [
+            pa.float64(),
+            pa.float64(),
+            pa.timestamp("ns"),
+            pa.string(),
+        ]
+        assert str(table.column("c")[0].as_py()) == "2023-01-02 00:00:00"
+
+
+class TestApplySchemaTypes:
+    def test_casts_null_columns(self):
+        table = pa.table({"a": pa.nulls(2), "b": ["true", "false"]})
+        table = apply_schema_types(
+            table, schema(("a", "int", None), ("b", "boolean", None))
+        )
+        assert table.schema == pa.schema([("a", pa.int64()), ("b", pa.bool_())])
+
+
+class TestArrowFileWriter:
+    @pytest.mark.parametrize(
+        "file_format, read",
+        [(FileFormat.PARQUET, pq.read_table), (FileFormat.FEATHER, feather.read_table)],
+    )
+    def test_writes_tables_to_one_file(self, tmp_path, file_format, read):
+        path = str(tmp_path / "data")
+        with ArrowFileWriter(path, file_format) as writer:
+            writer.write(pa.table({"a": [1, 2], "b": ["x", "y"]}))
+            writer.write(pa.table({"b": [None], "a": pa.nulls(1)}))
+
+        assert writer.rows == 3
+        table = read(path)
+        assert table.schema == pa.schema([("a", pa.int64()), ("b", pa.string())])
+        assert table.column("a").to_pylist() == [1, 2, None]
+
+    @pytest.mark.parametrize(
+        "file_format, read",
+        [(FileFormat.PARQUET, pq.read_table), (FileFormat.FEATHER, feather.read_table)],
+    )
+    def test_widens_schema_of_later_tables(self, tmp_path, file_format, read):
+        path = str(tmp_path / "data")
+        with ArrowFileWriter(path, file_format) as writer:
+            writer.write(pa.table({"a": pa.nulls(2), "b": [1, 2], "c": [1, 2]}))
+            writer.write(pa.table({"a": ["x"], "b": [2.5], "c": ["three"]}))
+            writer.write(pa.table({"a": ["y"], "b": [4], "c": [4]}))
+
+        assert writer.rows == 4
+        table = read(path)
+        assert table.schema == pa.schema(
+            [("a", pa.string()), ("b", pa.float64()), ("c", pa.string())]
+        )
+        assert table.to_pydict() == {
+            "a": [None, None, "x", "y"],
+            "b": [1.0, 2.0, 2.5, 4.0],
+            "c": ["1", "2", "three", "4"],
+        }
+        assert os.listdir(tmp_path) == ["data"]
+
+    @pytest.mark.parametrize(
+        "file_format, read",
+        [(FileFormat.PARQUET, pq.read_table), (FileFormat.FEATHER, feather.read_table)],
+    )
+    def test_adds_columns_of_later_tables(self, tmp_path, file_format, read):
+        path = str(tmp_path / "data")
+        with ArrowFileWriter(path, file_format) as writer:
+            writer.write(pa.table({"a": [1, 2]}))
+            writer.write(pa.table({"a": [3], "b": ["x"]}))
+            writer.write(pa.table({"a": [4]}))
+
+        assert read(path).to_pydict() == {
+            "a": [1, 2, 3, 4],
+            "b": [None, None, "x", None],
+        }
+
+    def test_writes_empty_file(self, tmp_path):
+        path = str(tmp_path / "data.parquet")
+        with ArrowFileWriter(path):
+            pass
+        assert pq.read_table(path).num_rows == 0
+
+    @pytest.mark.parametrize("compression", ["uncompressed", "zstd"])
+    def test_compression(self, tmp_path, compression):
+        path = str(tmp_path / "data.parquet")
+        with ArrowFileWriter(path, compression=compression) as writer:
+            writer.write(pa.table({"a": [1, 2]}))
+        codec = pq.ParquetFile(path).metadata.row_group(0).column(0).compression
+        assert codec == ("UNCOMPRESSED" if compression == "uncompressed" else "ZSTD")
+
+    def test_removes_file_on_error(self, tmp_path):
+        path = tmp_path / "data.feather"
+        with pytest.raises(ValueError):
+            with ArrowFileWriter(str(path), "feather") as writer:
+                writer.write(pa.table({"a": [1]}))
+                raise ValueError()
+        assert not path.exists()
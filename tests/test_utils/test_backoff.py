@@ -0,0 +1,17 @@
+from rapid.utils.backoff import Backoff
+
+
+class TestBackoff:
+    def test_delay_grows_exponentially(self):
+        backoff = Backoff(initial=1, factor=2, maximum=100, jitter=0)
+        assert [backoff.delay(attempt) for attempt in range(4)] == [1, 2, 4, 8]
+
+    def test_delay_is_capped(self):
+        backoff = Backoff(initial=1, factor=2, maximum=5, jitter=0)
+        assert backoff.delay(10) == 5
+
+    def test_delay_jitter(self):
+        backoff = Backoff(initial=10, factor=1, jitter=0.1)
+        delays = [backoff.delay(0) for _ in range(100)]
+        assert all(9 <= delay <= 11 for delay in delays)
+        assert len(set(delays)) > 1
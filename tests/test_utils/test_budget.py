@@ -0,0 +1,30 @@
+import threading
+
+from rapid.utils.budget import ByteBudget
+
+
+class TestByteBudget:
+    def test_acquire_waits_for_release(self):
+        budget = ByteBudget(10)
+        budget.acquire(6)
+        acquired = threading.Event()
+
+        def acquire():
+            budget.acquire(6)
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.05)
+        budget.release(6)
+        assert acquired.wait(1)
+        thread.join()
+        assert budget.held == 6
+
+    def test_oversized_request_passes_when_empty(self):
+        budget = ByteBudget(10)
+        budget.acquire(100)
+        assert budget.held == 100
+        budget.adjust(-40)
+        budget.release(60)
+        assert budget.held == 0
@@ -0,0 +1,97 @@
+import os
+
+from mock import patch
+import pandas as pd
+from pandas import DataFrame
+import pytest
+
+from rapid.items.query import Query, SQLQueryOrderBy
+from rapid.utils.cache import DownloadCache
+
+
+df = DataFrame({"column_a": [1, 2, 3], "column_b": ["one", "two", "three"]})
+
+
+@pytest.fixture
+def cache(tmp_path) -> DownloadCache:
+    return DownloadCache(str(tmp_path))
+
+
+class TestDownloadCache:
+    def test_key_is_canonical(self):
+        query = Query(
+            select_columns=["a"], order_by_columns=[SQLQueryOrderBy(column="a")]
+        )
+        same_query = Query(
+            order_by_columns=[SQLQueryOrderBy(column="a")], select_columns=["a"]
+        )
+        assert DownloadCache.key("url", 1, query) == DownloadCache.key(
+            "url", 1, same_query
+        )
+        assert DownloadCache.key("url", 1, query) != DownloadCache.key("url", 2, query)
+        assert DownloadCache.key("url", 1, query) != DownloadCache.key(
+            "url", 1, Query()
+        )
+
+    def test_put_and_get(self, cache: DownloadCache):
+        indexed = df.set_axis([0, 2, 5])
+        cache.put("key", "domain", "dataset", indexed)
+        pd.testing.assert_frame_equal(cache.get("key"), indexed)
+
+    def test_get_missing(self, cache: DownloadCache):
+        assert cache.get("missing") is None
+
+    def test_get_is_memory_mapped(self, cache: DownloadCache):
+        cache.put("key", "domain", "dataset", df)
+        with patch("rapid.utils.cache.feather.read_table") as read_table:
+            read_table.return_value.to_pandas.return_value = df
+            cache.get("key")
+        assert read_table.call_args[1]["memory_map"] is True
+
+    def test_index_persists(self, cache: DownloadCache):
+        cache.put("key", "domain", "dataset", df)
+        pd.testing.assert_frame_equal(DownloadCache(cache.directory).get("key"), df)
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = DownloadCache(str(tmp_path), ttl=60)
+        with patch("rapid.utils.cache.time.time", return_value=1000):
+            cache.put("key", "domain", "dataset", df)
+        with patch("rapid.utils.cache.time.time", return_value=1030):
+            assert cache.get("key") is not None
+        with patch("rapid.utils.cache.time.time", return_value=1061):
+            assert cache.get("key") is None
+        assert not os.path.exists(cache._path("key"))
+
+    def test_lru_eviction(self, cache: DownloadCache):
+        cache.put("first", "domain", "dataset", df)
+        cache.max_bytes = cache.size * 2
+        cache.put("second", "domain", "dataset", df)
+        cache.get("first")
+        cache.put("third", "domain", "dataset", df)
+
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+
+    def test_invalidate(self, cache: DownloadCache):
+        cache.put("first", "domain", "dataset", df)
+        cache.put("second", "domain", "other", df)
+        cache.put("third", "other", "dataset", df)
+
+        cache.invalidate("domain", "dataset")
+        assert cache.get("first") is None
+        assert cache.get("second") is not None
+
+        cache.invalidate("domain")
+        assert cache.get("second") is None
+        assert cache.get("third") is not None
+
+    def test_clear(self, cache: DownloadCache):
+        cache.put("key", "domain", "dataset", df)
+        cache.clear()
+        assert cache.get("key") is None
+        assert cache.size == 0
+
+    def test_put_skips_unconvertible_dataframe(self, cache: DownloadCache):
+        cache.put("key", "domain", "dataset", DataFrame({"column_a": [1, "one"]}))
+        assert cache.get("key") is None
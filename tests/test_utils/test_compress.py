@@ -0,0 +1,39 @@
+import gzip
+from io import BytesIO
+
+import pytest
+import zstandard
+
+from rapid.utils.compress import compress, compress_file
+from rapid.utils.constants import Compression
+
+
+DATA = b"column_a,column_b\n" + b"1,one\n" * 1000
+
+
+class TestCompress:
+    def test_compress_gzip(self):
+        compressed = compress(DATA, Compression.GZIP)
+        assert len(compressed) < len(DATA)
+        assert gzip.decompress(compressed) == DATA
+
+    def test_compress_gzip_level(self):
+        assert gzip.decompress(compress(DATA, "gzip", level=1)) == DATA
+
+    def test_compress_zstd(self):
+        compressed = compress(DATA, Compression.ZSTD, level=10)
+        assert len(compressed) < len(DATA)
+        assert zstandard.ZstdDecompressor().decompress(compressed) == DATA
+
+    def test_compress_invalid_codec(self):
+        with pytest.raises(ValueError):
+            compress(DATA, "brotli")
+
+    def test_compress_file_gzip(self):
+        with compress_file(BytesIO(DATA), Compression.GZIP, memory_limit=10) as file:
+            assert gzip.decompress(file.read()) == DATA
+
+    def test_compress_file_zstd(self):
+        with compress_file(BytesIO(DATA), "zstd") as file:
+            compressed = file.read()
+        assert zstandard.ZstdDecompressor().decompress(compressed) == DATA
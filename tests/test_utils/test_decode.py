@@ -0,0 +1,203 @@
+from io import StringIO
+import json
+
+from mock import patch
+import pandas as pd
+from pandas import DataFrame
+
+from rapid.items.schema import Column, Owner, Schema, SchemaMetadata, SensitivityLevel
+from rapid.utils.decode import (
+    apply_schema_dtypes,
+    compact_dtypes,
+    dataframe_from_index_json,
+    loads,
+    set_dtypes,
+)
+
+
+DUMMY_METADATA = SchemaMetadata(
+    domain="test",
+    dataset="rapid_sdk",
+    sensitivity=SensitivityLevel.PUBLIC,
+    owners=[Owner(name="Test", email="test@email.com")],
+)
+
+DUMMY_DATA = {
+    "0": {"column_a": 1, "column_b": 1.5, "column_c": "2023-01-01", "column_d": "a"},
+    "2": {"column_a": None, "column_b": 2.5, "column_c": "2023-01-02", "column_d": "b"},
+}
+
+
+class TestDecode:
+    def test_loads_bytes(self):
+        assert loads(b'{"a": 1}') == {"a": 1}
+
+    @patch("rapid.utils.decode.orjson", None)
+    def test_loads_without_orjson(self):
+        assert loads(b'{"a": 1}') == {"a": 1}
+        assert loads('{"a": 1}') == {"a": 1}
+
+    def test_dataframe_from_index_json(self):
+        df = dataframe_from_index_json(DUMMY_DATA)
+
+        assert df.shape == (2, 4)
+        assert list(df.columns) == ["column_a", "column_b", "column_c", "column_d"]
+        assert list(df.index) == [0, 2]
+        assert df.loc[2, "column_d"] == "b"
+
+    def test_dataframe_from_index_json_infers_dtypes_like_read_json(self):
+        data = {
+            "0": {"count": "1", "created_at": "2023-01-01", "date": 1672531200000},
+            "1": {"count": "2", "created_at": None, "date": 1672617600000},
+        }
+        df = dataframe_from_index_json(data)
+        expected = pd.read_json(StringIO(json.dumps(data)), orient="index")
+
+        pd.testing.assert_frame_equal(df, expected)
+        assert str(df["count"].dtype) == "int64"
+        assert pd.api.types.is_datetime64_any_dtype(df["created_at"])
+        assert pd.api.types.is_datetime64_any_dtype(df["date"])
+
+    def test_set_dtypes_skips_inference_for_schema_columns(self):
+        data = {
+            "0": {"zip": "00123", "count": "1"},
+            "1": {"zip": "00456", "count": "2"},
+        }
+        raw = dataframe_from_index_json(data, raw=True)
+        assert raw["count"].tolist() == ["1", "2"]
+
+        schema = Schema(
+            metadata=DUMMY_METADATA, columns=[Column(name="zip", data_type="string")]
+        )
+        df = set_dtypes(raw, schema)
+        assert df["zip"].tolist() == ["00123", "00456"]
+        assert str(df["count"].dtype) == "int64"
+
+    def test_dataframe_from_index_json_non_numeric_index(self):
+        df = dataframe_from_index_json({"a": {"column_a": 1}})
+        assert list(df.index) == ["a"]
+
+    def test_dataframe_from_index_json_empty(self):
+        df = dataframe_from_index_json({})
+        assert df.empty
+
+    def test_dataframe_from_index_json_with_schema(self):
+        schema = Schema(
+            metadata=DUMMY_METADATA,
+            columns=[
+                Column(name="column_a", data_type="Int64"),
+                Column(name="column_b", data_type="Float64"),
+                Column(name="column_c", data_type="date", format="%Y-%m-%d"),
+                Column(name="column_d", data_type="object"),
+                Column(name="column_e", data_type="Int64"),
+            ],
+        )
+        df = dataframe_from_index_json(DUMMY_DATA, schema)
+
+        assert str(df["column_a"].dtype) == "Int64"
+        assert df["column_a"].isna().tolist() == [False, True]
+        assert str(df["column_b"].dtype) == "Float64"
+        assert pd.api.types.is_datetime64_any_dtype(df["column_c"])
+        assert df["column_d"].dtype == object
+
+    def test_apply_schema_dtypes_boolean(self):
+        schema = Schema(
+            metadata=DUMMY_METADATA,
+            columns=[Column(name="column_a", data_type="boolean")],
+        )
+        df = apply_schema_dtypes(DataFrame({"column_a": [True, None]}), schema)
+        assert str(df["column_a"].dtype) == "boolean"
+
+
+class TestCompactDtypes:
+    def test_compact_dtypes_with_schema(self):
+        schema = Schema(
+            metadata=DUMMY_METADATA,
+            columns=[
+                Column(name="small", data_type="Int64", allow_null=False),
+                Column(name="nullable", data_type="Int64"),
+                Column(name="wide", data_type="Int64", allow_null=False),
+                Column(name="half", data_type="Float64"),
+                Column(name="precise", data_type="Float64"),
+                Column(name="flag", data_type="boolean"),
+                Column(name="date", data_type="date", format="%Y-%m-%d"),
+                Column(name="category", data_type="object"),
+                Column(name="unique", data_type="object"),
+            ],
+        )
+        df = DataFrame(
+            {
+                "small": [1, 2, 3, 4],
+                "nullable": [1, None, 300, 4],
+                "wide": [1, 2, 3, 2**40],
+                "half": [0.5, 1.5, None, 2.25],
+                "precise": [0.1, 0.2, 0.3, 0.4],
+                "flag": [True, None, False, True],
+                "date": ["2023-01-01", "2023-01-02", "2023-01-03", "2023-01-04"],
+                "category": ["a", "b", "a", "a"],
+                "unique": ["a", "b", "c", "d"],
+            }
+        )
+
+        df = compact_dtypes(df, schema)
+
+        assert df.dtypes.astype(str).to_dict() == {
+            "small": "int8",
+            "nullable": "Int16",
+            "wide": "int64",
+            "half": "float32",
+            "precise": "float64",
+            "flag": "boolean",
+            "date": "datetime64[ns]",
+            "category": "category",
+            "unique": "object",
+        }
+        assert df["nullable"].isna().tolist() == [False, True, False, False]
+
+    def test_compact_dtypes_nullability_from_schema(self):
+        schema = Schema(
+            metadata=DUMMY_METADATA,
+            columns=[
+                Column(name="allowed", data_type="Int64", allow_null=True),
+                Column(name="required", data_type="Int64", allow_null=False),
+                Column(name="missing", data_type="Int64", allow_null=False),
+                Column(name="flag", data_type="boolean", allow_null=True),
+            ],
+        )
+        df = DataFrame.from_records(
+            [
+                {"allowed": 1, "required": 1, "missing": 1, "flag": True},
+                {"allowed": 2, "required": 2, "missing": None, "flag": False},
+            ]
+        )
+
+        df = compact_dtypes(df, schema)
+
+        assert df.dtypes.astype(str).to_dict() == {
+            "allowed": "Int8",
+            "required": "int8",
+            "missing": "Int8",
+            "flag": "boolean",
+        }
+
+    def test_compact_dtypes_without_schema_reports_memory(self):
+        df = DataFrame(
+            {
+                "count": list(range(1000)),
+                "category": ["alpha", "beta"] * 500,
+                "flag": [True] * 1000,
+            }
+        )
+        before = int(df.memory_usage(deep=True).sum())
+
+        df = compact_dtypes(df)
+
+        assert df.dtypes.astype(str).to_dict() == {
+            "count": "int16",
+            "category": "category",
+            "flag": "bool",
+        }
+        usage = df.attrs["memory_usage"]
+        assert usage["before"] == before
+        assert usage["after"] == int(df.memory_usage(deep=True).sum())
+        assert usage["saved"] == before - usage["after"] > 0
@@ -0,0 +1,90 @@
+from mock import Mock
+import pytest
+
+from rapid.utils.constants import EventPhase
+from rapid.utils.hooks import Event, Hooks, LatencyAggregator, endpoint_template
+
+
+class TestHooks:
+    def test_empty_hooks_are_falsy(self):
+        assert not Hooks()
+        assert Hooks([Mock()])
+
+    def test_register_emit_and_unregister(self):
+        hooks = Hooks()
+        hook = hooks.register(Mock())
+        event = Event(EventPhase.TOKEN, 0.1)
+        hooks.emit(event)
+        hook.assert_called_once_with(event)
+
+        hooks.unregister(hook)
+        hooks.emit(event)
+        assert hook.call_count == 1
+        assert not hooks
+
+
+class TestEndpointTemplate:
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/datasets", "/datasets"),
+            ("/oauth2/token", "/oauth2/token"),
+            ("/jobs/1234", "/jobs/{id}"),
+            ("/datasets/domain/dataset", "/datasets/{domain}/{dataset}"),
+            ("/datasets/domain/dataset/query", "/datasets/{domain}/{dataset}/query"),
+            ("/datasets/domain/dataset/info", "/datasets/{domain}/{dataset}/info"),
+            (
+                "/schema/PUBLIC/domain/dataset/generate",
+                "/schema/{sensitivity}/{domain}/{dataset}/generate",
+            ),
+            ("/schema", "/schema"),
+        ],
+    )
+    def test_endpoint_template(self, path, expected):
+        assert endpoint_template(path) == expected
+
+
+class TestLatencyAggregator:
+    def test_groups_durations_by_phase_and_endpoint(self):
+        aggregator = LatencyAggregator()
+        aggregator(Event(EventPhase.REQUEST, 0.01, "/datasets", "POST"))
+        aggregator(Event(EventPhase.REQUEST, 0.03, "/datasets", "POST"))
+        aggregator(Event(EventPhase.REQUEST, 0.02, "/jobs/{id}", "GET"))
+        aggregator(Event(EventPhase.SERIALISE, 0.5))
+
+        assert aggregator.durations == {
+            ("request", "POST /datasets"): [0.01, 0.03],
+            ("request", "GET /jobs/{id}"): [0.02],
+            ("serialise", ""): [0.5],
+        }
+
+    def test_histogram(self):
+        histogram = dict(LatencyAggregator().histogram([0.0005, 0.004, 0.005, 20]))
+        assert histogram["<= 1ms"] == 1
+        assert histogram["<= 5ms"] == 2
+        assert histogram["> 10000ms"] == 1
+        assert sum(histogram.values()) == 4
+
+    def test_report(self):
+        aggregator = LatencyAggregator()
+        for duration in [0.001, 0.004, 0.004, 0.04]:
+            aggregator(Event(EventPhase.REQUEST, duration, "/datasets", "POST"))
+
+        report = aggregator.report(width=4).splitlines()
+        assert report[0] == (
+            "request POST /datasets: count=4 total=49.0ms p50=4.0ms p95=40.0ms max=40.0ms"
+        )
+        assert report[1:] == [
+            "      <= 1ms | ## 1",
+            "      <= 2ms |  0",
+            "      <= 5ms | #### 2",
+            "     <= 10ms |  0",
+            "     <= 20ms |  0",
+            "     <= 50ms | ## 1",
+        ]
+
+    def test_reset(self):
+        aggregator = LatencyAggregator()
+        aggregator(Event(EventPhase.TOKEN, 0.1))
+        aggregator.reset()
+        assert aggregator.report() == ""
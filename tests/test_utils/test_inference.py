@@ -0,0 +1,90 @@
+from mock import Mock
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+import pytest
+
+from rapid.items.schema import Column, Owner, Schema, SchemaMetadata
+from rapid.utils.inference import check_inference_parity, infer_data_type, infer_schema
+
+
+class TestInference:
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            ([1, 2, 3], ("Int64", None)),
+            ([1, None, 3], ("Int64", None)),
+            (pd.array([1, None], dtype="Int64"), ("Int64", None)),
+            ([1.5, 2.0], ("Float64", None)),
+            ([True, False], ("boolean", None)),
+            ([True, None], ("boolean", None)),
+            (["true", "False"], ("boolean", None)),
+            (["a", "b"], ("object", None)),
+            (["1", "2"], ("Int64", None)),
+            (["1.5", "2"], ("Float64", None)),
+            (["2023-01-01", None], ("date", "%Y-%m-%d")),
+            (["01/02/2023", "31/12/2023"], ("date", "%d/%m/%Y")),
+            (["2023-13-45", "2023-01-01"], ("object", None)),
+            (pd.to_datetime(["2023-01-01", "2023-01-02"]), ("date", "%Y-%m-%d")),
+            (pd.Categorical(["a", "b", "a"]), ("object", None)),
+            (pd.Categorical([1, 2, 1]), ("Int64", None)),
+            ([None, None], ("object", None)),
+        ],
+    )
+    def test_infer_data_type(self, values, expected):
+        assert infer_data_type(pd.Series(values)) == expected
+
+    def test_infer_schema(self):
+        df = DataFrame(
+            {
+                "column_a": [1, 2, 3],
+                "column_b": ["one", None, "three"],
+                "column_c": [0.5, 1.5, np.nan],
+            }
+        )
+
+        schema = infer_schema(df, "domain", "dataset", "PUBLIC")
+        assert schema.metadata.domain == "domain"
+        assert schema.metadata.dataset == "dataset"
+        assert schema.metadata.sensitivity == "PUBLIC"
+        assert schema.metadata.owners == [
+            Owner(name="change_me", email="change_me@email.com")
+        ]
+        assert schema.columns == [
+            Column(name="column_a", data_type="Int64"),
+            Column(name="column_b", data_type="object"),
+            Column(name="column_c", data_type="Float64"),
+        ]
+
+    def test_infer_schema_nullability(self):
+        df = DataFrame({"column_a": [1, 2], "column_b": ["one", None]})
+
+        schema = infer_schema(df, "domain", "dataset", "PUBLIC", infer_nullability=True)
+        assert [column.allow_null for column in schema.columns] == [False, True]
+
+    def test_check_inference_parity(self):
+        df = DataFrame({"column_a": range(2000), "column_b": ["one"] * 2000})
+        server_schema = Schema(
+            metadata=SchemaMetadata(
+                domain="domain",
+                dataset="dataset",
+                sensitivity="PUBLIC",
+                owners=[Owner(name="change_me", email="change_me@email.com")],
+            ),
+            columns=[
+                Column(name="column_a", data_type="Float64"),
+                Column(name="column_b", data_type="object"),
+                Column(name="column_c", data_type="object"),
+            ],
+        )
+        rapid = Mock()
+        rapid.generate_schema = Mock(return_value=server_schema)
+
+        res = check_inference_parity(
+            rapid, df, "domain", "dataset", "PUBLIC", sample_rows=100
+        )
+        assert len(rapid.generate_schema.call_args[0][0]) == 100
+        assert set(res) == {"column_a", "column_c"}
+        assert res["column_a"]["local"].data_type == "Int64"
+        assert res["column_a"]["server"].data_type == "Float64"
+        assert res["column_c"]["local"] is None
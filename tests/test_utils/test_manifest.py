@@ -0,0 +1,117 @@
+import os
+
+from mock import Mock
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from rapid.utils.manifest import UploadManifest
+
+
+df = DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"], "value": [0.5, 1.5, 2.5]})
+
+
+class TestUploadManifest:
+    def test_hash_rows_normalises_dtypes(self):
+        other = DataFrame(
+            {
+                "id": pd.array([1, 2, 3], dtype="Int64"),
+                "name": pd.Categorical(["a", "b", "c"]),
+                "value": [0.5, 1.5, 2.5],
+            }
+        )
+        hashes = UploadManifest.hash_rows(df)
+        assert hashes.dtype == np.uint64
+        assert (hashes == UploadManifest.hash_rows(other)).all()
+        assert (
+            UploadManifest.hash_rows(df, ["id"])
+            == UploadManifest.hash_rows(DataFrame({"id": [1.0, 2.0, 3.0]}))
+        ).all()
+        assert len(set(hashes)) == 3
+
+    def test_hash_rows_does_not_depend_on_the_batch(self):
+        first = UploadManifest.hash_rows(
+            DataFrame({"id": [1.0, 2.5], "name": ["a", "b"]})
+        )
+        second = UploadManifest.hash_rows(
+            DataFrame({"id": [1.0, 3.0], "name": ["a", "c"]})
+        )
+        third = UploadManifest.hash_rows(
+            DataFrame({"id": pd.array([1, None], dtype="Int64"), "name": ["a", None]})
+        )
+        assert first[0] == second[0] == third[0]
+        assert (
+            first[1]
+            != UploadManifest.hash_rows(DataFrame({"id": [2.0], "name": ["b"]}))[0]
+        )
+
+    def test_new_rows_and_add(self, tmp_path):
+        manifest = UploadManifest(str(tmp_path))
+        new, hashes = manifest.new_rows("domain", "dataset", df, ["id"])
+        assert new.equals(df)
+
+        manifest.add("domain", "dataset", hashes[:2])
+        new, hashes = manifest.new_rows(
+            "domain", "dataset", pd.concat([df, df.iloc[[2]]]), ["id"]
+        )
+        assert new["id"].tolist() == [3]
+        assert len(hashes) == 1
+        assert manifest.contains("other", "dataset", hashes).tolist() == [False]
+
+    def test_compaction(self, tmp_path):
+        manifest = UploadManifest(str(tmp_path), compact_segments=2)
+        hashes = UploadManifest.hash_rows(df)
+        for value in hashes:
+            manifest.add("domain", "dataset", [value])
+        manifest.add("domain", "dataset", hashes)
+        directory = os.path.join(str(tmp_path), "domain", "dataset")
+        files = sorted(os.listdir(directory))
+        assert files[0] == "base.npy"
+        assert len(files) == 2 and files[1].startswith("segment-")
+        assert manifest.contains("domain", "dataset", hashes).all()
+
+        manifest.compact("domain", "dataset")
+        assert os.listdir(directory) == ["base.npy"]
+        assert manifest.rows("domain", "dataset") == 3
+        assert manifest.contains("domain", "dataset", hashes).all()
+        assert not manifest.contains("domain", "dataset", [0]).any()
+
+    def test_rebuild(self, tmp_path):
+        manifest = UploadManifest(str(tmp_path))
+        manifest.add("domain", "dataset", [1, 2, 3, 4])
+        rapid = Mock()
+        rapid.iter_dataframe = Mock(return_value=iter([df[["id"]][:2], df[["id"]][2:]]))
+
+        assert manifest.rebuild(rapid, "domain", "dataset", ["id"], page_size=2) == 3
+
+        query = rapid.iter_dataframe.call_args.args[2]
+        assert query.select_columns == ["id"]
+        assert query.order_by_columns[0].column == "id"
+        assert rapid.iter_dataframe.call_args.kwargs["page_size"] == 2
+        rapid.download_dataframe.assert_not_called()
+        new, _ = manifest.new_rows("domain", "dataset", df, ["id"])
+        assert new.empty
+        assert not manifest.contains("domain", "dataset", [1, 2, 3, 4]).any()
+
+    def test_rebuild_with_several_key_columns_downloads_at_once(self, tmp_path):
+        manifest = UploadManifest(str(tmp_path))
+        rapid = Mock()
+        rapid.download_dataframe = Mock(return_value=df[["id", "name"]])
+
+        assert manifest.rebuild(rapid, "domain", "dataset", ["id", "name"]) == 3
+
+        query = rapid.download_dataframe.call_args.kwargs["query"]
+        assert query.select_columns == ["id", "name"]
+        rapid.iter_dataframe.assert_not_called()
+
+    def test_ignores_temporary_files(self, tmp_path):
+        manifest = UploadManifest(str(tmp_path), compact_segments=1)
+        hashes = UploadManifest.hash_rows(df)
+        manifest.add("domain", "dataset", hashes[:1])
+        directory = os.path.join(str(tmp_path), "domain", "dataset")
+        with open(os.path.join(directory, "segment-stale.npy.tmp"), "wb") as file:
+            file.write(b"partial")
+
+        manifest.add("domain", "dataset", hashes[1:])
+        assert manifest.contains("domain", "dataset", hashes).all()
+        assert sorted(os.listdir(directory)) == ["base.npy", "segment-stale.npy.tmp"]
@@ -0,0 +1,43 @@
+from io import BytesIO
+
+from mock import patch
+import pytest
+from urllib3.filepost import encode_multipart_formdata
+
+from rapid.utils.multipart import StreamBody, multipart_body
+
+
+class TestStreamBody:
+    def test_read_across_parts(self):
+        body = StreamBody([BytesIO(b"abc"), BytesIO(b""), BytesIO(b"defg")])
+        assert len(body) == 7
+        assert body.read(2) == b"ab"
+        assert body.read(3) == b"cde"
+        assert body.tell() == 5
+        assert body.read() == b"fg"
+        assert body.read(10) == b""
+
+    def test_seek(self):
+        body = StreamBody([BytesIO(b"abc"), BytesIO(b"defg")])
+        body.read()
+        assert body.seek(0) == 0
+        assert body.read() == b"abcdefg"
+        body.seek(4)
+        assert body.read(2) == b"ef"
+        body.seek(-1, 2)
+        assert body.read() == b"g"
+
+
+class TestMultipartBody:
+    @pytest.mark.parametrize("filename", ["file.csv", "file.parquet"])
+    def test_matches_requests_encoding(self, filename):
+        with patch("rapid.utils.multipart.choose_boundary", return_value="boundary"):
+            body, content_type = multipart_body(
+                {"file": (filename, BytesIO(b"column_a\n1\n"))}
+            )
+        expected, expected_type = encode_multipart_formdata(
+            {"file": (filename, b"column_a\n1\n", None)}, boundary="boundary"
+        )
+        assert content_type == expected_type
+        assert len(body) == len(expected)
+        assert body.read() == expected
@@ -0,0 +1,28 @@
+from tempfile import SpooledTemporaryFile
+
+from pandas import DataFrame
+
+from rapid.utils.payload import UploadPayload
+
+
+df = DataFrame({"column_a": [1, 2, 3]})
+
+
+class TestUploadPayload:
+    def test_files_returns_content(self):
+        payload = UploadPayload(df, "file.csv", "column_a\n1\n2\n3\n")
+        assert payload.files() == {"file": ("file.csv", "column_a\n1\n2\n3\n")}
+        assert payload.size == 15
+
+    def test_spooled_files_are_not_closed_by_uploads(self):
+        with SpooledTemporaryFile() as content:
+            content.write(b"column_a\n1\n2\n3\n")
+            with UploadPayload(df, "file.csv", content) as payload:
+                for _ in range(2):
+                    filename, file = payload.files()["file"]
+                    assert filename == "file.csv"
+                    assert file.read() == b"column_a\n1\n2\n3\n"
+                    file.close()
+                assert not content.closed
+                assert payload.size == 15
+            assert content.closed
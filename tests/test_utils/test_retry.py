@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from rapid.utils.backoff import Backoff
+from rapid.utils.retry import RetryPolicy, parse_retry_after
+
+
+def response(status_code: int, headers: dict = None) -> requests.Response:
+    res = requests.Response()
+    res.status_code = status_code
+    res.headers.update(headers if headers else {})
+    return res
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize("status_code", [429, 502, 503, 504])
+    def test_retries_transient_statuses(self, status_code):
+        policy = RetryPolicy(backoff=Backoff(initial=1, jitter=0))
+        assert policy.delay("POST", 0, 0, response=response(status_code)) == 1
+        assert policy.delay("POST", 1, 0, response=response(status_code)) == 2
+
+    @pytest.mark.parametrize("status_code", [200, 202, 400, 422, 500])
+    def test_does_not_retry_other_statuses(self, status_code):
+        assert RetryPolicy().delay("POST", 0, 0, response=response(status_code)) is None
+
+    def test_retries_connection_errors_only(self):
+        policy = RetryPolicy(backoff=Backoff(initial=1, jitter=0))
+        assert policy.delay("GET", 0, 0, error=requests.ConnectionError()) == 1
+        assert policy.delay("GET", 0, 0, error=requests.ReadTimeout()) is None
+
+    @pytest.mark.parametrize("status_code", [429, 503])
+    def test_retries_unsent_statuses_when_not_idempotent(self, status_code):
+        policy = RetryPolicy()
+        res = response(status_code)
+        assert policy.delay("POST", 0, 0, response=res, idempotent=False) is not None
+
+    @pytest.mark.parametrize("status_code", [502, 504])
+    def test_does_not_retry_gateway_errors_when_not_idempotent(self, status_code):
+        policy = RetryPolicy()
+        res = response(status_code)
+        assert policy.delay("POST", 0, 0, response=res, idempotent=False) is None
+
+    def test_retries_connect_errors_only_when_not_idempotent(self):
+        policy = RetryPolicy(backoff=Backoff(initial=1, jitter=0))
+        refused = requests.ConnectionError(
+            MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+        )
+        for error in [requests.ConnectTimeout(), refused]:
+            assert policy.delay("POST", 0, 0, error=error, idempotent=False) == 1
+        reset = requests.ConnectionError(ProtocolError("Connection aborted."))
+        assert policy.delay("POST", 0, 0, error=reset) == 1
+        assert policy.delay("POST", 0, 0, error=reset, idempotent=False) is None
+
+    def test_does_not_retry_other_methods(self):
+        policy = RetryPolicy(methods=["get"])
+        assert policy.delay("GET", 0, 0, response=response(503)) is not None
+        assert policy.delay("POST", 0, 0, response=response(503)) is None
+
+    def test_stops_after_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.delay("GET", 1, 0, response=response(503)) is not None
+        assert policy.delay("GET", 2, 0, response=response(503)) is None
+
+    def test_stops_when_budget_would_be_exceeded(self):
+        policy = RetryPolicy(backoff=Backoff(initial=5, jitter=0), budget=10)
+        assert policy.delay("GET", 0, 4, response=response(503)) == 5
+        assert policy.delay("GET", 0, 6, response=response(503)) is None
+
+    def test_honours_retry_after(self):
+        policy = RetryPolicy(backoff=Backoff(initial=1, jitter=0))
+        res = response(429, {"Retry-After": "7"})
+        assert policy.delay("GET", 0, 0, response=res) == 7
+        assert RetryPolicy(respect_retry_after=False).delay(
+            "GET", 0, 0, response=res
+        ) == pytest.approx(0.5, rel=0.1)
+
+    def test_retry_after_beyond_budget_is_not_retried(self):
+        res = response(503, {"Retry-After": "120"})
+        assert RetryPolicy(budget=60).delay("GET", 0, 0, response=res) is None
+
+
+class TestParseRetryAfter:
+    def test_parse_seconds(self):
+        assert parse_retry_after("3") == 3
+        assert parse_retry_after("-3") == 0
+
+    def test_parse_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == (
+            pytest.approx(30, abs=2)
+        )
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_parse_invalid(self, value):
+        assert parse_retry_after(value) is None
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from rapid.utils.sampling import sample_dataframe
+
+
+ROWS = 10000
+
+
+def create_dataframe() -> DataFrame:
+    rng = np.random.default_rng(1)
+    values = rng.random(ROWS)
+    values[1234] = -1
+    values[5678] = 2
+    category = np.array(["common"] * ROWS, dtype=object)
+    category[4321] = "rare"
+    text = np.array([f"text{i}" for i in range(ROWS)], dtype=object)
+    text[9876] = None
+    return DataFrame(
+        {
+            "value": values,
+            "category": category,
+            "text": text,
+            "date": pd.date_range("2020-01-01", periods=ROWS, freq="h"),
+        }
+    )
+
+
+class TestSampling:
+    def test_sample_dataframe_small_frame_is_unchanged(self):
+        df = DataFrame({"column_a": [1, 2, 3]})
+        assert sample_dataframe(df, max_rows=10) is df
+
+    def test_sample_dataframe_includes_guaranteed_rows(self):
+        df = create_dataframe()
+        sample = sample_dataframe(df, max_rows=100)
+
+        assert len(sample) == 100
+        assert {1234, 5678, 4321, 9876, 0, ROWS - 1} <= set(sample.index)
+        assert set(sample["category"]) == {"common", "rare"}
+        assert sample["text"].isna().any()
+        assert sample.index.is_monotonic_increasing
+
+    def test_sample_dataframe_is_deterministic(self):
+        df = create_dataframe()
+        assert sample_dataframe(df, max_rows=50).index.equals(
+            sample_dataframe(df, max_rows=50).index
+        )
+
+    def test_sample_dataframe_byte_budget(self):
+        df = create_dataframe()
+        sample = sample_dataframe(df, max_bytes=5000)
+
+        assert len(sample.to_csv(index=False)) < 5000 * 1.2
+        assert 4321 in sample.index
+
+    def test_sample_dataframe_guaranteed_rows_exceed_budget(self):
+        df = DataFrame({"category": [f"value{i % 20}" for i in range(1000)]})
+        assert len(sample_dataframe(df, max_rows=5)) == 20
+
+    def test_sample_dataframe_non_default_index(self):
+        df = create_dataframe().set_axis(range(ROWS, 2 * ROWS))
+        sample = sample_dataframe(df, max_rows=100)
+        assert ROWS + 4321 in sample.index
@@ -0,0 +1,66 @@
+from io import BytesIO
+
+from mock import patch
+import pandas as pd
+from pandas import DataFrame
+import pytest
+
+from rapid.utils.constants import UploadFormat
+from rapid.utils.serialise import serialise_dataframe, spool_dataframe
+
+
+df = DataFrame({"column_a": [1, 2, 3], "column_b": ["one", "two", "three"]})
+
+
+class TestSerialise:
+    def test_serialise_dataframe_csv(self):
+        filename, content = serialise_dataframe(df)
+        assert filename.startswith("rapid-sdk") and filename.endswith(".csv")
+        assert content == df.to_csv(index=False)
+
+    def test_serialise_dataframe_parquet(self):
+        filename, content = serialise_dataframe(df, UploadFormat.PARQUET, "gzip")
+        assert filename.startswith("rapid-sdk") and filename.endswith(".parquet")
+        pd.testing.assert_frame_equal(pd.read_parquet(BytesIO(content)), df)
+
+    def test_serialise_dataframe_parquet_from_string(self):
+        filename, _ = serialise_dataframe(df, "parquet")
+        assert filename.endswith(".parquet")
+
+    @patch.object(DataFrame, "to_parquet", side_effect=ImportError)
+    def test_serialise_dataframe_parquet_falls_back_to_csv(self, _):
+        with pytest.warns(UserWarning):
+            filename, content = serialise_dataframe(df, UploadFormat.PARQUET)
+        assert filename.endswith(".csv")
+        assert content == df.to_csv(index=False)
+
+
+class TestSpool:
+    def test_spool_dataframe_small_matches_serialise(self):
+        filename, content = spool_dataframe(df, block_rows=2)
+        assert filename.endswith(".csv")
+        assert content == serialise_dataframe(df)[1]
+
+    def test_spool_dataframe_empty(self):
+        assert spool_dataframe(DataFrame())[1] == "\n"
+
+    def test_spool_dataframe_large_returns_file(self):
+        filename, content = spool_dataframe(df, memory_limit=10, block_rows=2)
+        assert filename.endswith(".csv")
+        with content:
+            assert content.read() == df.to_csv(index=False).encode("utf-8")
+
+    def test_spool_dataframe_parquet(self):
+        _, small = spool_dataframe(df, UploadFormat.PARQUET)
+        filename, large = spool_dataframe(df, UploadFormat.PARQUET, memory_limit=10)
+        assert filename.endswith(".parquet")
+        pd.testing.assert_frame_equal(pd.read_parquet(BytesIO(small)), df)
+        with large:
+            pd.testing.assert_frame_equal(pd.read_parquet(BytesIO(large.read())), df)
+
+    @patch.object(DataFrame, "to_parquet", side_effect=ImportError)
+    def test_spool_dataframe_parquet_falls_back_to_csv(self, _):
+        with pytest.warns(UserWarning):
+            filename, content = spool_dataframe(df, UploadFormat.PARQUET)
+        assert filename.endswith(".csv")
+        assert content == df.to_csv(index=False)
@@ -0,0 +1,19 @@
+from requests.adapters import HTTPAdapter
+
+from rapid.utils.session import create_session
+
+
+class TestSession:
+    def test_create_session_mounts_pooled_adapter(self):
+        session = create_session(pool_connections=4, pool_maxsize=16, pool_block=True)
+        adapter = session.get_adapter("https://TEST_DOMAIN/api")
+
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 16
+        assert adapter._pool_block is True
+        assert session.headers["Connection"] == "keep-alive"
+
+    def test_create_session_mounts_http_and_https(self):
+        session = create_session()
+        assert session.get_adapter("http://host") is session.get_adapter("https://host")